@@ -22,6 +22,7 @@ from src.config.settings import get_settings
 from src.database.base import init_db, check_db_health
 from src.monitoring.health_monitor import get_health_monitor
 from src.monitoring.metrics import get_metrics_collector
+from src.monitoring.alerts import get_alert_manager
 from src.api.trading_routes import router as trading_router
 from src.api.auth_routes import router as auth_router
 from src.api.websocket_routes import router as websocket_router, periodic_updates_task
@@ -56,6 +57,7 @@ class TradingBotApplication:
         self.config = get_settings()
         self.health_monitor = get_health_monitor()
         self.metrics = get_metrics_collector()
+        self.alert_manager = get_alert_manager()
         self.trading_engine = None
         self.websocket_task = None
         self.is_shutting_down = False
@@ -109,6 +111,9 @@ class TradingBotApplication:
             # Stop health monitoring
             await self.health_monitor.stop_monitoring()
             
+            # Flush queued alert notifications
+            await self.alert_manager.stop_notifications()
+            
             logger.info("Trading bot application shutdown complete")
             
         except Exception as e:
@@ -1,7 +1,7 @@
 """Authentication API routes."""
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from fastapi.security import HTTPBearer
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Dict, Any
 import logging
@@ -10,7 +10,7 @@ from datetime import timedelta
 from ..database.base import get_db
 from ..security.auth import (
     authenticate_user, create_access_token, create_refresh_token,
-    AuthenticationManager, get_current_user, User
+    AuthenticationManager, get_current_user, invalidate_token, User
 )
 from ..security.key_manager import APIKeyManager
 from .schemas import (
@@ -470,11 +470,14 @@ async def remove_api_keys(
 
 @router.post("/logout")
 async def logout_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     current_user: User = Depends(get_current_user)
 ):
     """Logout user (invalidate token on client side)."""
     # Note: With JWT, we can't truly invalidate tokens server-side without
-    # maintaining a blacklist. For now, we rely on client-side token removal.
+    # maintaining a blacklist. For now, we rely on client-side token removal
+    # and only drop the server's cached verification result.
+    invalidate_token(credentials.credentials)
     logger.info(f"User logged out: {current_user.email}")
     
     return {
@@ -153,7 +153,7 @@ async def get_system_metrics(
             },
             "current_gauges": {
                 "unrealized_pnl": metrics_collector.get_gauge("unrealized_pnl"),
-                "position_count": len([k for k in metrics_collector.gauges.keys() if "position_size" in k]),
+                "position_count": len([k for k in metrics_collector.gauges.keys() if k[0] == "position_size"]),
                 "last_trade_price_btc": metrics_collector.get_gauge("last_trade_price", {"symbol": "BTC-USD"}),
                 "last_trade_price_eth": metrics_collector.get_gauge("last_trade_price", {"symbol": "ETH-USD"}),
             },
@@ -231,14 +231,14 @@ async def get_alert_history(
         return {
             "alert_history": [
                 {
-                    "id": alert.id,
-                    "title": alert.title,
-                    "message": alert.message,
-                    "severity": alert.severity.value,
-                    "component": alert.component,
-                    "timestamp": alert.timestamp.isoformat(),
-                    "resolved": alert.resolved,
-                    "resolved_at": alert.resolved_at.isoformat() if alert.resolved_at else None
+                    "id": alert["id"],
+                    "title": alert["title"],
+                    "message": alert["message"],
+                    "severity": alert["severity"],
+                    "component": alert["component"],
+                    "timestamp": alert["timestamp"],
+                    "resolved": alert["resolved"],
+                    "resolved_at": alert["resolved_at"]
                 }
                 for alert in alert_history
             ],
@@ -9,7 +9,7 @@ import logging
 
 from ..database.base import get_db
 from ..database.dao import TradingDAO
-from ..security.auth import get_current_user, User
+from ..security.auth import get_current_user, invalidate_user, User
 from ..trading.strategies.ma_crossover import MovingAverageCrossoverStrategy
 from ..trading.risk_management.position_sizer import PositionSizer
 from ..trading.api_client import DydxRestClient
@@ -275,6 +275,7 @@ async def update_strategy_config(
             from ..database.dao import UserDAO
             user_dao = UserDAO(db)
             user_dao.update_user(current_user.id, {"paper_trading_mode": config_request.paper_mode})
+            invalidate_user(current_user.email)
         
         logger.info(f"Strategy configuration updated for user {current_user.id}")
         
@@ -304,6 +305,7 @@ async def emergency_stop(
         user_dao.update_user(current_user.id, {
             "trading_enabled": False
         })
+        invalidate_user(current_user.email)
         
         # Create emergency stop alert
         await alert_dao.create_alert({
@@ -368,6 +370,7 @@ async def resume_trading(
         user_dao.update_user(current_user.id, {
             "trading_enabled": True
         })
+        invalidate_user(current_user.email)
         
         # Create resume alert
         await alert_dao.create_alert({
@@ -326,7 +326,8 @@ class UserDAO:
     
     def get_user_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
-        return self.db.query(User).filter(User.id == user_id).first()
+        # Session.get checks the identity map first, so a row already loaded in this request costs no SQL
+        return self.db.get(User, user_id)
     
     def update_user(self, user_id: int, update_data: Dict[str, Any]) -> bool:
         """Update user information."""
@@ -392,6 +393,7 @@ class ConfigurationDAO:
             # Update existing configuration
             existing.previous_value = existing.value
             existing.value = value
+            existing.value_type = value_type
             existing.version += 1
             existing.updated_at = datetime.utcnow()
             existing.updated_by = updated_by
@@ -413,6 +415,65 @@ class ConfigurationDAO:
         self.db.refresh(config)
         return config
     
+    async def save_configs_bulk(
+        self,
+        rows: List[Dict[str, Any]],
+        user_id: Optional[int] = None,
+        updated_by: Optional[int] = None
+    ) -> List[Configuration]:
+        """
+        Save or update several configurations in one transaction.
+        
+        Each row needs ``category``, ``key``, ``value`` and ``value_type``;
+        ``description`` is optional. Existing rows are fetched with a single
+        query and everything is committed once.
+        """
+        if not rows:
+            return []
+        
+        query = self.db.query(Configuration).filter(
+            and_(
+                or_(*[
+                    and_(Configuration.category == row["category"], Configuration.key == row["key"])
+                    for row in rows
+                ]),
+                Configuration.is_active == True
+            )
+        )
+        if user_id is not None:
+            query = query.filter(Configuration.user_id == user_id)
+        else:
+            query = query.filter(Configuration.user_id.is_(None))
+        
+        existing = {(config.category, config.key): config for config in query.all()}
+        now = datetime.utcnow()
+        configs = []
+        
+        for row in rows:
+            config = existing.get((row["category"], row["key"]))
+            if config:
+                config.previous_value = config.value
+                config.value = row["value"]
+                config.value_type = row["value_type"]
+                config.version += 1
+                config.updated_at = now
+                config.updated_by = updated_by
+            else:
+                config = Configuration(
+                    user_id=user_id,
+                    category=row["category"],
+                    key=row["key"],
+                    value=row["value"],
+                    value_type=row["value_type"],
+                    description=row.get("description"),
+                    updated_by=updated_by
+                )
+                self.db.add(config)
+            configs.append(config)
+        
+        self.db.commit()
+        return configs
+    
     def get_category_configs(
         self, 
         category: str, 
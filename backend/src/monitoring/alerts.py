@@ -1,12 +1,19 @@
 """Alert management and notification system."""
 
 import asyncio
+import bisect
+import itertools
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+import time
+from collections import Counter, OrderedDict, deque
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Callable, Deque, Tuple
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
+from operator import itemgetter
 import smtplib
+import string
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import json
@@ -15,9 +22,31 @@ import aiohttp
 
 from ..config.settings import get_settings
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a notification payload to JSON bytes, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str)
+    return json.dumps(obj, default=str).encode("utf-8")
+
+
+def _dumps_pretty(obj: Any) -> str:
+    """Serialize to indented JSON text, using orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, default=str, indent=2)
+
 
 class AlertSeverity(str, Enum):
     INFO = "info"
@@ -58,6 +87,32 @@ class Alert:
             "resolved": self.resolved,
             "resolved_at": self.resolved_at.isoformat() if self.resolved_at else None
         }
+    
+    @cached_property
+    def payload_bytes(self) -> bytes:
+        """JSON-encoded to_dict(), serialized once and shared across channels."""
+        return _dumps(self.to_dict())
+    
+    @cached_property
+    def email_body(self) -> str:
+        """Plain-text email body, rendered once per alert."""
+        return f"""
+            Alert Details:
+            
+            Title: {self.title}
+            Severity: {self.severity.upper()}
+            Component: {self.component}
+            Time: {self.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}
+            
+            Message:
+            {self.message}
+            
+            Metadata:
+            {_dumps_pretty(self.metadata) if self.metadata else 'None'}
+            
+            ---
+            dYdX Trading Bot Alert System
+            """
 
 
 @dataclass
@@ -71,21 +126,92 @@ class AlertRule:
     cooldown_minutes: int = 60
     channels: List[AlertChannel] = None
     enabled: bool = True
+    # Data keys read by the condition; enables memoized evaluation when set
+    fields: Optional[List[str]] = None
     
     def __post_init__(self):
         if self.channels is None:
             self.channels = [AlertChannel.EMAIL]
+        self._cooldown_s = self.cooldown_minutes * 60
+        
+        # Data keys worth keeping in alert metadata: watched fields plus message placeholders
+        template_fields = [
+            name for _, name, _, _ in string.Formatter().parse(self.message_template) if name
+        ]
+        self._metadata_keys = list(dict.fromkeys((self.fields or []) + template_fields))
+
+
+# Compact alert history record: (epoch timestamp, severity index, component id, alert id)
+HistoryRow = Tuple[float, int, int, str]
+SEVERITIES: List[AlertSeverity] = list(AlertSeverity)
+_SEVERITY_INDEX: Dict[AlertSeverity, int] = {severity: i for i, severity in enumerate(SEVERITIES)}
+_SEVERITY_VALUES: List[str] = [severity.value for severity in SEVERITIES]
+_row_ts = itemgetter(0)
+
+# Slack attachment color based on severity
+SLACK_COLORS = {
+    AlertSeverity.INFO: "good",
+    AlertSeverity.WARNING: "warning",
+    AlertSeverity.ERROR: "danger",
+    AlertSeverity.CRITICAL: "danger"
+}
+
+
+def _build_slack_template(severity: AlertSeverity, component: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """Build the static (color, fields) part of a Slack attachment."""
+    fields = [
+        {
+            "title": "Severity",
+            "value": severity.upper(),
+            "short": True
+        },
+        {
+            "title": "Component",
+            "value": component,
+            "short": True
+        }
+    ]
+    return SLACK_COLORS.get(severity, "warning"), fields
 
 
 class AlertManager:
     """Manages alert generation, notification, and tracking."""
     
     def __init__(self):
+        self.max_history_size = 1000
         self.active_alerts: Dict[str, Alert] = {}
-        self.alert_history: List[Alert] = []
+        self.alert_history: Deque[HistoryRow] = deque(maxlen=self.max_history_size)
+        self._component_ids: Dict[str, int] = {}
+        self._component_names: List[str] = []
+        # Running (severity, component) counts of history rows, bucketed by epoch hour
+        self._stats_buckets: Dict[int, Tuple[Counter, Counter]] = {}
+        # Full Alert objects for the most recent history entries
+        self.max_recent_alerts = 64
+        self._recent_alerts: "OrderedDict[str, Alert]" = OrderedDict()
         self.alert_rules: Dict[str, AlertRule] = {}
-        self.last_alert_times: Dict[str, datetime] = {}
-        self.max_history_size = 1000
+        # Monotonic time of the last alert per rule (LRU order), used for cooldowns
+        self.last_alert_times: "OrderedDict[str, float]" = OrderedDict()
+        self.max_cooldown_entries = 10_000
+        self.cooldown_prune_interval = 300
+        self._last_cooldown_prune = time.monotonic()
+        
+        # Memoized condition results: rule_name -> (data signature, result, expiry)
+        self._eval_cache: "OrderedDict[str, Tuple[int, bool, float]]" = OrderedDict()
+        self.eval_cache_ttl_seconds = 5.0
+        self.max_eval_cache_size = 256
+        self.max_metadata_str_len = 256
+        
+        # Sequence for collision-free alert ids, even when a rule fires twice within a second
+        self._alert_seq = itertools.count(1)
+        
+        # Notifications are sent by a background worker so slow channels don't delay rule checks.
+        # The queue and the semaphore bounding fan-out are created when the worker starts, so
+        # they bind to the running event loop rather than whichever loop imported this module
+        self.notify_concurrency = settings.alert_concurrency
+        self.notify_drain_timeout_seconds = settings.alert_drain_timeout_seconds
+        self._notify_semaphore: Optional[asyncio.Semaphore] = None
+        self._notify_q: "Optional[asyncio.Queue[Tuple[Alert, List[AlertChannel]]]]" = None
+        self._notify_task: Optional[asyncio.Task] = None
         
         # Initialize default alert rules
         self._setup_default_rules()
@@ -101,7 +227,8 @@ class AlertManager:
             component="database",
             message_template="Database connection is unhealthy: {message}",
             cooldown_minutes=5,
-            channels=[AlertChannel.EMAIL, AlertChannel.SLACK]
+            channels=[AlertChannel.EMAIL, AlertChannel.SLACK],
+            fields=["database_status"]
         ))
         
         # API connectivity alert
@@ -112,7 +239,8 @@ class AlertManager:
             component="api",
             message_template="dYdX API is unhealthy: {message}",
             cooldown_minutes=10,
-            channels=[AlertChannel.EMAIL, AlertChannel.SLACK]
+            channels=[AlertChannel.EMAIL, AlertChannel.SLACK],
+            fields=["api_status"]
         ))
         
         # High latency alert
@@ -122,7 +250,8 @@ class AlertManager:
             severity=AlertSeverity.WARNING,
             component="api",
             message_template="High API latency detected: {api_latency:.2f}s",
-            cooldown_minutes=30
+            cooldown_minutes=30,
+            fields=["api_latency"]
         ))
         
         # Daily loss limit alert
@@ -133,7 +262,8 @@ class AlertManager:
             component="risk",
             message_template="Daily loss limit breached: ${daily_pnl:.2f} (limit: ${daily_loss_limit:.2f})",
             cooldown_minutes=60,
-            channels=[AlertChannel.EMAIL, AlertChannel.SLACK, AlertChannel.SMS]
+            channels=[AlertChannel.EMAIL, AlertChannel.SLACK, AlertChannel.SMS],
+            fields=["daily_pnl", "daily_loss_limit"]
         ))
         
         # Position size alert
@@ -143,7 +273,8 @@ class AlertManager:
             severity=AlertSeverity.WARNING,
             component="risk",
             message_template="Large position detected: {position_size_percent:.1f}% of portfolio in {symbol}",
-            cooldown_minutes=120
+            cooldown_minutes=120,
+            fields=["position_size_percent"]
         ))
         
         # System resource alert
@@ -153,7 +284,8 @@ class AlertManager:
             severity=AlertSeverity.WARNING,
             component="system",
             message_template="High CPU usage: {cpu_percent:.1f}%",
-            cooldown_minutes=30
+            cooldown_minutes=30,
+            fields=["cpu_percent"]
         ))
         
         # Memory usage alert
@@ -163,7 +295,8 @@ class AlertManager:
             severity=AlertSeverity.WARNING,
             component="system",
             message_template="High memory usage: {memory_percent:.1f}%",
-            cooldown_minutes=30
+            cooldown_minutes=30,
+            fields=["memory_percent"]
         ))
         
         # Error rate alert
@@ -173,18 +306,26 @@ class AlertManager:
             severity=AlertSeverity.ERROR,
             component="application",
             message_template="High error rate detected: {error_rate:.2%}",
-            cooldown_minutes=15
+            cooldown_minutes=15,
+            fields=["error_rate"]
         ))
     
     def add_rule(self, rule: AlertRule):
         """Add an alert rule."""
+        # Precompute per-rule notification templates
+        rule._slack_template = _build_slack_template(rule.severity, rule.component)
+        rule._email_subject = f"[{rule.severity.upper()}] {rule.component.title()} Alert: {rule.name}"
+        
         self.alert_rules[rule.name] = rule
+        self._eval_cache.pop(rule.name, None)
         logger.info(f"Added alert rule: {rule.name}")
     
     def remove_rule(self, rule_name: str) -> bool:
         """Remove an alert rule."""
         if rule_name in self.alert_rules:
             del self.alert_rules[rule_name]
+            self._eval_cache.pop(rule_name, None)
+            self.last_alert_times.pop(rule_name, None)
             logger.info(f"Removed alert rule: {rule_name}")
             return True
         return False
@@ -205,7 +346,12 @@ class AlertManager:
     
     async def check_rules(self, data: Dict[str, Any]):
         """Check all alert rules against provided data."""
-        current_time = datetime.utcnow()
+        now = time.time()
+        current_time = datetime.utcfromtimestamp(now)
+        now_m = time.monotonic()
+        
+        if now_m - self._last_cooldown_prune >= self.cooldown_prune_interval:
+            self._prune_cooldowns(now_m)
         
         for rule_name, rule in self.alert_rules.items():
             if not rule.enabled:
@@ -214,12 +360,12 @@ class AlertManager:
             try:
                 # Check cooldown period
                 last_alert_time = self.last_alert_times.get(rule_name)
-                if last_alert_time and (current_time - last_alert_time).total_seconds() < rule.cooldown_minutes * 60:
+                if last_alert_time is not None and now_m - last_alert_time < rule._cooldown_s:
                     continue
                 
                 # Evaluate condition
-                if rule.condition(data):
-                    alert_id = f"{rule_name}_{current_time.strftime('%Y%m%d_%H%M%S')}"
+                if self._evaluate_rule(rule_name, rule, data):
+                    alert_id = f"{rule_name}-{next(self._alert_seq)}"
                     
                     # Format message
                     message = rule.message_template.format(**data)
@@ -232,40 +378,209 @@ class AlertManager:
                         severity=rule.severity,
                         component=rule.component,
                         timestamp=current_time,
-                        metadata={"rule_name": rule_name, "data": data}
+                        metadata={"rule_name": rule_name, "data": self._redact(rule, data)}
                     )
                     
                     # Store alert
                     self.active_alerts[alert_id] = alert
-                    self.alert_history.append(alert)
-                    self.last_alert_times[rule_name] = current_time
-                    
-                    # Trim history if needed
-                    if len(self.alert_history) > self.max_history_size:
-                        self.alert_history = self.alert_history[-self.max_history_size:]
+                    self._append_history(alert, now)
+                    self.last_alert_times[rule_name] = now_m
+                    self.last_alert_times.move_to_end(rule_name)
+                    if len(self.last_alert_times) > self.max_cooldown_entries:
+                        self.last_alert_times.popitem(last=False)
                     
-                    # Send notifications
-                    await self._send_notifications(alert, rule.channels)
+                    # Queue notifications for the background worker
+                    if rule.channels:
+                        self._enqueue_notification(alert, rule.channels)
                     
                     logger.warning(f"Alert triggered: {alert.title} - {alert.message}")
                     
             except Exception as e:
                 logger.error(f"Error checking rule {rule_name}: {e}")
     
-    async def _send_notifications(self, alert: Alert, channels: List[AlertChannel]):
-        """Send alert notifications through specified channels."""
-        for channel in channels:
+    def _prune_cooldowns(self, now_m: float):
+        """Drop cooldown entries that have expired or belong to removed rules."""
+        expired = [
+            name for name, last_time in self.last_alert_times.items()
+            if name not in self.alert_rules or now_m - last_time >= self.alert_rules[name]._cooldown_s
+        ]
+        for name in expired:
+            del self.last_alert_times[name]
+        self._last_cooldown_prune = now_m
+    
+    def _append_history(self, alert: Alert, ts: float):
+        """Record an alert in history, keeping the stats buckets in sync with evictions.
+        
+        History must stay in time order because stats and history reads rely on it, so
+        a timestamp earlier than the newest row (a wall-clock step back) is clamped to it.
+        """
+        if self.alert_history and ts < self.alert_history[-1][0]:
+            ts = self.alert_history[-1][0]
+        
+        component_id = self._component_ids.get(alert.component)
+        if component_id is None:
+            component_id = self._component_ids[alert.component] = len(self._component_names)
+            self._component_names.append(alert.component)
+        
+        if len(self.alert_history) == self.max_history_size:
+            self._count_row(self.alert_history[0], -1)
+        
+        row = (ts, _SEVERITY_INDEX[alert.severity], component_id, alert.id)
+        self.alert_history.append(row)
+        self._count_row(row, 1)
+        
+        self._recent_alerts[alert.id] = alert
+        if len(self._recent_alerts) > self.max_recent_alerts:
+            self._recent_alerts.popitem(last=False)
+    
+    def _count_row(self, row: HistoryRow, delta: int):
+        """Adjust the hourly stats bucket a history row falls into."""
+        ts, severity_idx, component_id, _ = row
+        bucket = int(ts // 3600)
+        severity_counter, component_counter = self._stats_buckets.setdefault(bucket, (Counter(), Counter()))
+        severity_counter[severity_idx] += delta
+        component_counter[component_id] += delta
+        
+        if delta < 0:
+            if severity_counter[severity_idx] <= 0:
+                del severity_counter[severity_idx]
+            if component_counter[component_id] <= 0:
+                del component_counter[component_id]
+            if not severity_counter:
+                del self._stats_buckets[bucket]
+    
+    def _row_to_dict(self, row: HistoryRow) -> Dict[str, Any]:
+        """Expand a history row, using the full alert when it is still retained."""
+        ts, severity_idx, component_id, alert_id = row
+        alert = self.active_alerts.get(alert_id) or self._recent_alerts.get(alert_id)
+        if alert is not None:
+            return alert.to_dict()
+        
+        # Alerts only leave active_alerts by being resolved
+        return {
+            "id": alert_id,
+            "title": None,
+            "message": None,
+            "severity": _SEVERITY_VALUES[severity_idx],
+            "component": self._component_names[component_id],
+            "timestamp": datetime.utcfromtimestamp(ts).isoformat(),
+            "resolved": True,
+            "resolved_at": None
+        }
+    
+    def _redact(self, rule: AlertRule, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy only the data keys a rule uses, truncating long strings."""
+        redacted = {}
+        for key in rule._metadata_keys:
+            if key in data:
+                value = data[key]
+                if isinstance(value, str) and len(value) > self.max_metadata_str_len:
+                    value = value[:self.max_metadata_str_len]
+                redacted[key] = value
+        return redacted
+    
+    def _evaluate_rule(self, rule_name: str, rule: AlertRule, data: Dict[str, Any]) -> bool:
+        """Evaluate a rule condition, reusing the last result while its watched data is unchanged."""
+        if not rule.fields:
+            return bool(rule.condition(data))
+        
+        try:
+            sig = hash(tuple((k, data.get(k)) for k in rule.fields))
+        except TypeError:
+            # Unhashable values can't be memoized
+            return bool(rule.condition(data))
+        
+        now = time.monotonic()
+        cached = self._eval_cache.get(rule_name)
+        if cached and cached[0] == sig and now < cached[2]:
+            self._eval_cache.move_to_end(rule_name)
+            return cached[1]
+        
+        result = bool(rule.condition(data))
+        self._eval_cache[rule_name] = (sig, result, now + self.eval_cache_ttl_seconds)
+        self._eval_cache.move_to_end(rule_name)
+        if len(self._eval_cache) > self.max_eval_cache_size:
+            self._eval_cache.popitem(last=False)
+        return result
+    
+    def _enqueue_notification(self, alert: Alert, channels: List[AlertChannel]):
+        """Hand an alert to the notification worker, starting it if needed."""
+        if self._notify_task is None or self._notify_task.done():
+            if self._notify_q is None:
+                self._notify_q = asyncio.Queue(maxsize=1000)
+                self._notify_semaphore = asyncio.Semaphore(self.notify_concurrency)
+            self._notify_task = asyncio.create_task(self._notify_worker())
+        
+        try:
+            self._notify_q.put_nowait((alert, channels))
+        except asyncio.QueueFull:
+            logger.error(f"Notification queue full, dropping notifications for alert {alert.id}")
+    
+    async def _notify_worker(self):
+        """Send queued alert notifications."""
+        while True:
+            alert, channels = await self._notify_q.get()
             try:
-                if channel == AlertChannel.EMAIL:
-                    await self._send_email_notification(alert)
-                elif channel == AlertChannel.SLACK:
-                    await self._send_slack_notification(alert)
-                elif channel == AlertChannel.SMS:
-                    await self._send_sms_notification(alert)
-                elif channel == AlertChannel.WEBHOOK:
-                    await self._send_webhook_notification(alert)
+                await self._send_notifications(alert, channels)
             except Exception as e:
-                logger.error(f"Failed to send {channel.value} notification: {e}")
+                logger.error(f"Notification worker error for alert {alert.id}: {e}")
+            finally:
+                self._notify_q.task_done()
+    
+    async def stop_notifications(self):
+        """Drain pending notifications and stop the notification worker.
+        
+        Draining is bounded by notify_drain_timeout_seconds so a hung channel can't
+        block shutdown; notifications still queued after that are dropped.
+        """
+        if self._notify_task is None:
+            return
+        
+        if not self._notify_task.done():
+            try:
+                await asyncio.wait_for(self._notify_q.join(), timeout=self.notify_drain_timeout_seconds)
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Timed out draining alert notifications, dropping {self._notify_q.qsize()} queued"
+                )
+        self._notify_task.cancel()
+        try:
+            await self._notify_task
+        except asyncio.CancelledError:
+            pass
+        self._notify_task = None
+        self._notify_q = None
+        self._notify_semaphore = None
+    
+    async def _send_notifications(self, alert: Alert, channels: List[AlertChannel]):
+        """Send alert notifications through specified channels concurrently."""
+        results = await asyncio.gather(
+            *(self._dispatch(channel, alert) for channel in channels),
+            return_exceptions=True
+        )
+        
+        for channel, result in zip(channels, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to send {channel.value} notification: {result}")
+    
+    async def _dispatch(self, channel: AlertChannel, alert: Alert):
+        """Send a single channel notification under the shared concurrency limit."""
+        async with self._notify_semaphore:
+            if channel == AlertChannel.EMAIL:
+                await self._send_email_notification(alert)
+            elif channel == AlertChannel.SLACK:
+                await self._send_slack_notification(alert)
+            elif channel == AlertChannel.SMS:
+                await self._send_sms_notification(alert)
+            elif channel == AlertChannel.WEBHOOK:
+                await self._send_webhook_notification(alert)
+    
+    def _rule_for(self, alert: Alert) -> Optional[AlertRule]:
+        """Return the rule that produced an alert, if its templates still apply."""
+        rule = self.alert_rules.get((alert.metadata or {}).get("rule_name"))
+        if rule is not None and rule.severity is alert.severity and rule.component == alert.component:
+            return rule
+        return None
     
     async def _send_email_notification(self, alert: Alert):
         """Send email notification."""
@@ -290,40 +605,32 @@ class AlertManager:
             msg = MIMEMultipart()
             msg['From'] = from_email
             msg['To'] = ', '.join(to_emails)
-            msg['Subject'] = f"[{alert.severity.upper()}] {alert.title}"
-            
-            # Email body
-            body = f"""
-            Alert Details:
-            
-            Title: {alert.title}
-            Severity: {alert.severity.upper()}
-            Component: {alert.component}
-            Time: {alert.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC')}
-            
-            Message:
-            {alert.message}
+            rule = self._rule_for(alert)
+            if rule is not None:
+                msg['Subject'] = rule._email_subject
+            else:
+                msg['Subject'] = f"[{alert.severity.upper()}] {alert.title}"
             
-            Metadata:
-            {json.dumps(alert.metadata, indent=2) if alert.metadata else 'None'}
-            
-            ---
-            dYdX Trading Bot Alert System
-            """
+            msg.attach(MIMEText(alert.email_body, 'plain'))
             
-            msg.attach(MIMEText(body, 'plain'))
-            
-            # Send email
-            with smtplib.SMTP(smtp_server, smtp_port) as server:
-                server.starttls()
-                server.login(smtp_username, smtp_password)
-                server.send_message(msg)
+            # Send email off the event loop so other channels proceed concurrently
+            await asyncio.to_thread(
+                self._deliver_email, msg, smtp_server, smtp_port, smtp_username, smtp_password
+            )
             
             logger.info(f"Email notification sent for alert {alert.id}")
             
         except Exception as e:
             logger.error(f"Failed to send email notification: {e}")
     
+    @staticmethod
+    def _deliver_email(msg: MIMEMultipart, smtp_server: str, smtp_port: int, smtp_username: str, smtp_password: str):
+        """Deliver an email message over SMTP (blocking)."""
+        with smtplib.SMTP(smtp_server, smtp_port) as server:
+            server.starttls()
+            server.login(smtp_username, smtp_password)
+            server.send_message(msg)
+    
     async def _send_slack_notification(self, alert: Alert):
         """Send Slack notification."""
         slack_webhook_url = settings.slack_webhook_url
@@ -332,13 +639,12 @@ class AlertManager:
             logger.debug("Slack webhook URL not configured")
             return
         
-        # Color based on severity
-        color_map = {
-            AlertSeverity.INFO: "good",
-            AlertSeverity.WARNING: "warning", 
-            AlertSeverity.ERROR: "danger",
-            AlertSeverity.CRITICAL: "danger"
-        }
+        # Severity/component parts are prebuilt per rule; only the per-firing fields vary
+        rule = self._rule_for(alert)
+        if rule is not None:
+            color, static_fields = rule._slack_template
+        else:
+            color, static_fields = _build_slack_template(alert.severity, alert.component)
         
         # Create Slack message
         payload = {
@@ -346,20 +652,11 @@ class AlertManager:
             "icon_emoji": ":warning:",
             "attachments": [
                 {
-                    "color": color_map.get(alert.severity, "warning"),
+                    "color": color,
                     "title": alert.title,
                     "text": alert.message,
                     "fields": [
-                        {
-                            "title": "Severity",
-                            "value": alert.severity.upper(),
-                            "short": True
-                        },
-                        {
-                            "title": "Component", 
-                            "value": alert.component,
-                            "short": True
-                        },
+                        *static_fields,
                         {
                             "title": "Time",
                             "value": alert.timestamp.strftime('%Y-%m-%d %H:%M:%S UTC'),
@@ -373,7 +670,7 @@ class AlertManager:
         
         try:
             async with aiohttp.ClientSession() as session:
-                async with session.post(slack_webhook_url, json=payload) as response:
+                async with session.post(slack_webhook_url, data=_dumps(payload), headers=JSON_HEADERS) as response:
                     if response.status == 200:
                         logger.info(f"Slack notification sent for alert {alert.id}")
                     else:
@@ -404,10 +701,8 @@ class AlertManager:
             return
         
         try:
-            payload = alert.to_dict()
-            
             async with aiohttp.ClientSession() as session:
-                async with session.post(webhook_url, json=payload) as response:
+                async with session.post(webhook_url, data=alert.payload_bytes, headers=JSON_HEADERS) as response:
                     if response.status in [200, 201, 202]:
                         logger.info(f"Webhook notification sent for alert {alert.id}")
                     else:
@@ -422,6 +717,7 @@ class AlertManager:
             alert = self.active_alerts[alert_id]
             alert.resolved = True
             alert.resolved_at = datetime.utcnow()
+            alert.__dict__.pop("payload_bytes", None)  # drop the stale serialized payload
             del self.active_alerts[alert_id]
             logger.info(f"Alert resolved: {alert_id}")
             return True
@@ -431,36 +727,51 @@ class AlertManager:
         """Get active alerts, optionally filtered by severity."""
         alerts = list(self.active_alerts.values())
         if severity:
-            alerts = [alert for alert in alerts if alert.severity == severity]
+            alerts = [alert for alert in alerts if alert.severity is severity]
         return sorted(alerts, key=lambda x: x.timestamp, reverse=True)
     
-    def get_alert_history(self, hours: int = 24, severity: Optional[AlertSeverity] = None) -> List[Alert]:
-        """Get alert history within a time window."""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        alerts = [alert for alert in self.alert_history if alert.timestamp >= cutoff_time]
-        
-        if severity:
-            alerts = [alert for alert in alerts if alert.severity == severity]
+    def get_alert_history(self, hours: int = 24, severity: Optional[AlertSeverity] = None) -> List[Dict[str, Any]]:
+        """Get alert history within a time window, newest first."""
+        cutoff = time.time() - hours * 3600
+        severity_idx = _SEVERITY_INDEX[severity] if severity else None
         
-        return sorted(alerts, key=lambda x: x.timestamp, reverse=True)
+        # History is appended in time order, so walking back from the newest row stops at
+        # the cutoff and only touches rows inside the window
+        in_window = itertools.takewhile(lambda row: row[0] >= cutoff, reversed(self.alert_history))
+        return [
+            self._row_to_dict(row) for row in in_window
+            if severity_idx is None or row[1] == severity_idx
+        ]
     
     def get_alert_stats(self, hours: int = 24) -> Dict[str, Any]:
         """Get alert statistics."""
-        recent_alerts = self.get_alert_history(hours)
+        cutoff = time.time() - hours * 3600
+        boundary_bucket = int(cutoff // 3600)
+        
+        severity_counts = Counter()
+        component_counts = Counter()
         
-        severity_counts = {}
-        component_counts = {}
+        # Hours entirely inside the window come straight from the running counters
+        for bucket, (severity_counter, component_counter) in self._stats_buckets.items():
+            if bucket > boundary_bucket:
+                severity_counts.update(severity_counter)
+                component_counts.update(component_counter)
         
-        for alert in recent_alerts:
-            severity_counts[alert.severity.value] = severity_counts.get(alert.severity.value, 0) + 1
-            component_counts[alert.component] = component_counts.get(alert.component, 0) + 1
+        # The partially covered boundary hour is counted exactly from history. Indexing a
+        # deque walks its blocks from the nearer end, so each bisection probe costs
+        # O(n / 64) rather than O(1); still cheaper than scanning the whole window
+        start = bisect.bisect_left(self.alert_history, cutoff, key=_row_ts)
+        end = bisect.bisect_left(self.alert_history, (boundary_bucket + 1) * 3600, key=_row_ts)
+        for _, severity_idx, component_id, _ in itertools.islice(self.alert_history, start, max(start, end)):
+            severity_counts[severity_idx] += 1
+            component_counts[component_id] += 1
         
         return {
             "period_hours": hours,
-            "total_alerts": len(recent_alerts),
+            "total_alerts": sum(severity_counts.values()),
             "active_alerts": len(self.active_alerts),
-            "severity_breakdown": severity_counts,
-            "component_breakdown": component_counts,
+            "severity_breakdown": {_SEVERITY_VALUES[i]: c for i, c in severity_counts.items()},
+            "component_breakdown": {self._component_names[i]: c for i, c in component_counts.items()},
             "last_updated": datetime.utcnow().isoformat()
         }
 
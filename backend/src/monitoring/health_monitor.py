@@ -3,16 +3,24 @@
 import asyncio
 import logging
 import time
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Awaitable, Callable, Deque, Union
+from dataclasses import dataclass, asdict
 from enum import Enum
+from itertools import islice
 import psutil
 
 from ..database.base import check_db_health
 from ..trading.api_client import DydxRestClient
 from ..config.settings import get_settings
 
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
@@ -24,7 +32,7 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthCheck:
     """Individual health check result."""
     name: str
@@ -35,7 +43,7 @@ class HealthCheck:
     metadata: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SystemHealth:
     """Overall system health status."""
     status: HealthStatus
@@ -51,8 +59,10 @@ class HealthMonitor:
     def __init__(self):
         self.start_time = time.time()
         self.last_check_time = None
-        self.check_history: List[SystemHealth] = []
         self.max_history_size = 100
+        # History entries are msgpack-packed when available; the latest result stays unpacked
+        self.check_history: Deque[Union[bytes, SystemHealth]] = deque(maxlen=self.max_history_size)
+        self._latest_health: Optional[SystemHealth] = None
         
         # Health check intervals (in seconds)
         self.check_intervals = {
@@ -63,9 +73,33 @@ class HealthMonitor:
             "trading_engine": 60
         }
         
-        self.last_check_times = {}
+        # Per-check timeouts (in seconds) so a hung dependency can't stall the monitor loop
+        self.check_timeouts = {
+            "database": 2.0,
+            "dydx_api": 3.0,
+            "websocket": 1.0,
+            "system_resources": 0.5,
+            "trading_engine": 1.0
+        }
+        
+        # Check coroutines by name, in reporting order
+        self.checks = {
+            "database": self._check_database,
+            "dydx_api": self._check_dydx_api,
+            "websocket": self._check_websocket,
+            "system_resources": self._check_system_resources,
+            "trading_engine": self._check_trading_engine
+        }
+        
+        self.last_check_times: Dict[str, float] = {}  # time.monotonic() of each check's last run
         self._running = False
         self._monitor_task = None
+        
+        # Prime psutil's CPU baseline so later non-blocking samples measure the delta since the last check
+        psutil.cpu_percent(interval=None)
+        
+        # Long-lived dYdX client reused by every API probe (keeps its connection pool warm)
+        self._dydx_probe_client: Optional[DydxRestClient] = None
     
     async def start_monitoring(self):
         """Start the health monitoring background task."""
@@ -85,6 +119,11 @@ class HealthMonitor:
                 await self._monitor_task
             except asyncio.CancelledError:
                 pass
+        
+        if self._dydx_probe_client is not None:
+            await self._dydx_probe_client.close()
+            self._dydx_probe_client = None
+        
         logger.info("Health monitoring stopped")
     
     async def _monitor_loop(self):
@@ -92,7 +131,8 @@ class HealthMonitor:
         while self._running:
             try:
                 await self.perform_health_checks()
-                await asyncio.sleep(10)  # Check every 10 seconds
+                # Sleep until the next check is due instead of polling on a fixed tick
+                await asyncio.sleep(max(1.0, min(30.0, self._seconds_until_next_check())))
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -102,27 +142,14 @@ class HealthMonitor:
     async def perform_health_checks(self) -> SystemHealth:
         """Perform all health checks and return overall status."""
         current_time = datetime.utcnow()
-        checks = []
+        now_mono = time.monotonic()
         
-        # Database health check
-        if self._should_run_check("database", current_time):
-            checks.append(await self._check_database())
-        
-        # dYdX API health check
-        if self._should_run_check("dydx_api", current_time):
-            checks.append(await self._check_dydx_api())
-        
-        # WebSocket health check
-        if self._should_run_check("websocket", current_time):
-            checks.append(await self._check_websocket())
-        
-        # System resources check
-        if self._should_run_check("system_resources", current_time):
-            checks.append(await self._check_system_resources())
-        
-        # Trading engine health check
-        if self._should_run_check("trading_engine", current_time):
-            checks.append(await self._check_trading_engine())
+        # Run every due check concurrently so wall time is bounded by the slowest probe
+        pending = [
+            (name, check) for name, check in self.checks.items()
+            if self._should_run_check(name, now_mono)
+        ]
+        checks = list(await asyncio.gather(*(self._run_check(name, check) for name, check in pending)))
         
         # Determine overall status
         overall_status = self._calculate_overall_status(checks)
@@ -151,28 +178,65 @@ class HealthMonitor:
         
         return system_health
     
-    def _should_run_check(self, check_name: str, current_time: datetime) -> bool:
+    async def _run_check(self, name: str, check: Callable[[], Awaitable[HealthCheck]]) -> HealthCheck:
+        """Run a single check under its timeout, converting failures into an unhealthy result."""
+        start_time = time.perf_counter_ns()
+        timeout = self.check_timeouts.get(name, 5.0)
+        
+        try:
+            return await asyncio.wait_for(check(), timeout)
+        except asyncio.TimeoutError:
+            return HealthCheck(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"{name} check timeout after {timeout}s",
+                response_time=timeout,
+                timestamp=datetime.utcnow()
+            )
+        except Exception as e:
+            return HealthCheck(
+                name=name,
+                status=HealthStatus.UNHEALTHY,
+                message=f"{name} check error: {str(e)}",
+                response_time=(time.perf_counter_ns() - start_time) * 1e-9,
+                timestamp=datetime.utcnow()
+            )
+    
+    def _seconds_until_next_check(self) -> float:
+        """Seconds remaining until the earliest scheduled check is due."""
+        now_mono = time.monotonic()
+        next_due = None
+        for name in self.checks:
+            last_check = self.last_check_times.get(name)
+            if last_check is None:
+                return 0.0
+            remaining = self.check_intervals.get(name, 60) - (now_mono - last_check)
+            if next_due is None or remaining < next_due:
+                next_due = remaining
+        return next_due if next_due is not None else 0.0
+    
+    def _should_run_check(self, check_name: str, now_mono: float) -> bool:
         """Determine if a health check should be run based on interval."""
         if check_name not in self.last_check_times:
-            self.last_check_times[check_name] = current_time
+            self.last_check_times[check_name] = now_mono
             return True
         
         interval = self.check_intervals.get(check_name, 60)
         last_check = self.last_check_times[check_name]
         
-        if (current_time - last_check).total_seconds() >= interval:
-            self.last_check_times[check_name] = current_time
+        if now_mono - last_check >= interval:
+            self.last_check_times[check_name] = now_mono
             return True
         
         return False
     
     async def _check_database(self) -> HealthCheck:
         """Check database connectivity and performance."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             is_healthy = await check_db_health()
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             
             if is_healthy:
                 return HealthCheck(
@@ -192,7 +256,7 @@ class HealthMonitor:
                 )
                 
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             return HealthCheck(
                 name="database",
                 status=HealthStatus.UNHEALTHY,
@@ -203,22 +267,20 @@ class HealthMonitor:
     
     async def _check_dydx_api(self) -> HealthCheck:
         """Check dYdX API connectivity and latency."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            # Create a test client (without real credentials for health check)
-            client = DydxRestClient(
-                api_key="test",
-                api_secret="test", 
-                testnet=settings.testnet
-            )
+            if self._dydx_probe_client is None:
+                self._dydx_probe_client = DydxRestClient()
             
-            # Try to get market data (public endpoint)
-            # In production, this would be a real API call
-            response_time = time.time() - start_time
+            # Probe a lightweight public endpoint over the shared connection pool
+            markets = await self._dydx_probe_client.get_markets()
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             
-            # For now, simulate based on response time
-            if response_time < 1.0:
+            if markets is None:
+                status = HealthStatus.UNHEALTHY
+                message = f"dYdX API request failed after {response_time:.3f}s"
+            elif response_time < 1.0:
                 status = HealthStatus.HEALTHY
                 message = f"dYdX API responding in {response_time:.3f}s"
             elif response_time < 3.0:
@@ -234,11 +296,11 @@ class HealthMonitor:
                 message=message,
                 response_time=response_time,
                 timestamp=datetime.utcnow(),
-                metadata={"endpoint": "market_data"}
+                metadata={"endpoint": "/v4/perpetualMarkets"}
             )
             
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             return HealthCheck(
                 name="dydx_api",
                 status=HealthStatus.UNHEALTHY,
@@ -249,13 +311,13 @@ class HealthMonitor:
     
     async def _check_websocket(self) -> HealthCheck:
         """Check WebSocket connection health."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # TODO: Implement actual WebSocket health check
             # This would check if WebSocket connections are active and receiving data
             
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             
             # For now, simulate WebSocket health
             return HealthCheck(
@@ -268,7 +330,7 @@ class HealthMonitor:
             )
             
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             return HealthCheck(
                 name="websocket",
                 status=HealthStatus.UNHEALTHY,
@@ -277,15 +339,21 @@ class HealthMonitor:
                 timestamp=datetime.utcnow()
             )
     
+    @staticmethod
+    def _sample_resources():
+        """Collect CPU, memory and disk usage (blocking)."""
+        cpu_percent = psutil.cpu_percent(interval=None)
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('/')
+        return cpu_percent, memory, disk
+    
     async def _check_system_resources(self) -> HealthCheck:
         """Check system resource usage."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
-            # Get system metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            # Disk/memory stats can still touch the filesystem, so keep them off the event loop
+            cpu_percent, memory, disk = await asyncio.to_thread(self._sample_resources)
             
             # Determine status based on resource usage
             status = HealthStatus.HEALTHY
@@ -315,7 +383,7 @@ class HealthMonitor:
                 messages.append(f"Elevated disk usage: {disk_percent:.1f}%")
             
             message = "; ".join(messages) if messages else "System resources are healthy"
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             
             return HealthCheck(
                 name="system_resources",
@@ -333,7 +401,7 @@ class HealthMonitor:
             )
             
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             return HealthCheck(
                 name="system_resources",
                 status=HealthStatus.UNHEALTHY,
@@ -344,7 +412,7 @@ class HealthMonitor:
     
     async def _check_trading_engine(self) -> HealthCheck:
         """Check trading engine health."""
-        start_time = time.time()
+        start_time = time.perf_counter_ns()
         
         try:
             # TODO: Implement actual trading engine health checks
@@ -354,7 +422,7 @@ class HealthMonitor:
             # - Risk management system
             # - Market data processing
             
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             
             return HealthCheck(
                 name="trading_engine",
@@ -370,7 +438,7 @@ class HealthMonitor:
             )
             
         except Exception as e:
-            response_time = time.time() - start_time
+            response_time = (time.perf_counter_ns() - start_time) * 1e-9
             return HealthCheck(
                 name="trading_engine",
                 status=HealthStatus.UNHEALTHY,
@@ -384,27 +452,57 @@ class HealthMonitor:
         if not checks:
             return HealthStatus.UNKNOWN
         
-        # If any check is unhealthy, system is unhealthy
-        if any(check.status == HealthStatus.UNHEALTHY for check in checks):
-            return HealthStatus.UNHEALTHY
-        
-        # If any check is degraded, system is degraded
-        if any(check.status == HealthStatus.DEGRADED for check in checks):
-            return HealthStatus.DEGRADED
+        unhealthy, degraded, healthy = HealthStatus.UNHEALTHY, HealthStatus.DEGRADED, HealthStatus.HEALTHY
         
-        # If all checks are healthy, system is healthy
-        if all(check.status == HealthStatus.HEALTHY for check in checks):
-            return HealthStatus.HEALTHY
+        # Single pass: any unhealthy wins outright, then degraded, then anything not healthy
+        overall = healthy
+        for check in checks:
+            status = check.status
+            if status is unhealthy:
+                return unhealthy
+            if status is degraded:
+                overall = degraded
+            elif status is not healthy and overall is healthy:
+                overall = HealthStatus.UNKNOWN
         
-        return HealthStatus.UNKNOWN
+        return overall
     
     def _add_to_history(self, system_health: SystemHealth):
         """Add health check result to history."""
-        self.check_history.append(system_health)
+        self._latest_health = system_health
+        self.check_history.append(self._pack_health(system_health))
+    
+    @staticmethod
+    def _pack_health(system_health: SystemHealth) -> Union[bytes, SystemHealth]:
+        """Pack a health result into a compact msgpack blob for history storage."""
+        if not MSGPACK_AVAILABLE:
+            return system_health
+        return msgpack.packb(asdict(system_health), default=str)
+    
+    @staticmethod
+    def _unpack_health(entry: Union[bytes, SystemHealth]) -> SystemHealth:
+        """Rebuild a SystemHealth from a packed history entry."""
+        if isinstance(entry, SystemHealth):
+            return entry
         
-        # Keep only recent history
-        if len(self.check_history) > self.max_history_size:
-            self.check_history = self.check_history[-self.max_history_size:]
+        data = msgpack.unpackb(entry)
+        return SystemHealth(
+            status=HealthStatus(data["status"]),
+            checks=[
+                HealthCheck(
+                    name=check["name"],
+                    status=HealthStatus(check["status"]),
+                    message=check["message"],
+                    response_time=check["response_time"],
+                    timestamp=datetime.fromisoformat(check["timestamp"]),
+                    metadata=check["metadata"]
+                )
+                for check in data["checks"]
+            ],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            uptime_seconds=data["uptime_seconds"],
+            version=data["version"]
+        )
     
     async def _handle_unhealthy_system(self, system_health: SystemHealth):
         """Handle unhealthy system state."""
@@ -421,11 +519,12 @@ class HealthMonitor:
     
     def get_current_health(self) -> Optional[SystemHealth]:
         """Get the most recent health status."""
-        return self.check_history[-1] if self.check_history else None
+        return self._latest_health
     
     def get_health_history(self, limit: int = 50) -> List[SystemHealth]:
         """Get recent health check history."""
-        return self.check_history[-limit:] if self.check_history else []
+        start = max(0, len(self.check_history) - limit)
+        return [self._unpack_health(entry) for entry in islice(self.check_history, start, None)]
     
     def get_uptime(self) -> float:
         """Get system uptime in seconds."""
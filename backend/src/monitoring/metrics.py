@@ -1,16 +1,29 @@
 """Metrics collection and monitoring system."""
 
 import time
+import asyncio
+import functools
+import heapq
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Callable, Deque, Set, Tuple
 from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from datetime import datetime
 from dataclasses import dataclass
+from itertools import takewhile
+from operator import attrgetter
 from enum import Enum
 import statistics
 
 logger = logging.getLogger(__name__)
 
+# (name, sorted label items) - hashable without any string formatting
+MetricKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+# Stored history entry: (epoch seconds, value); expanded to MetricPoint on export
+HistoryRow = Tuple[float, float]
+
+_point_ts = attrgetter("timestamp")
+
 
 class MetricType(str, Enum):
     COUNTER = "counter"
@@ -19,13 +32,13 @@ class MetricType(str, Enum):
     TIMER = "timer"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MetricPoint:
     """A single metric data point."""
     name: str
     value: float
     labels: Dict[str, str]
-    timestamp: datetime
+    timestamp: float  # epoch seconds
     metric_type: MetricType
 
 
@@ -34,27 +47,60 @@ class MetricsCollector:
     
     def __init__(self, max_history_size: int = 10000):
         self.max_history_size = max_history_size
-        self.metrics: Dict[str, deque] = defaultdict(lambda: deque(maxlen=max_history_size))
-        self.counters: Dict[str, float] = defaultdict(float)
-        self.gauges: Dict[str, float] = defaultdict(float)
-        self.timers: Dict[str, List[float]] = defaultdict(list)
+        self.metrics: Dict[MetricKey, Deque[HistoryRow]] = {}
+        # Value of the newest row each full history deque has dropped, i.e. the last
+        # value recorded before its oldest retained row (window baseline for counters)
+        self._evicted_values: Dict[MetricKey, float] = {}
+        self._metric_types: Dict[MetricKey, MetricType] = {}
+        self._name_to_keys: Dict[str, Set[MetricKey]] = defaultdict(set)
+        # Counters and gauges expose their current value; per-update history is opt-in by name
+        self._history_enabled: Set[str] = {"trades_total"}
+        self.counters: Dict[MetricKey, float] = defaultdict(float)
+        self.gauges: Dict[MetricKey, float] = defaultdict(float)
+        self.max_timer_samples = 1000
+        self.timers: Dict[MetricKey, Deque[float]] = defaultdict(lambda: deque(maxlen=self.max_timer_samples))
+        # Timer stats are recomputed only after new samples bump the key's version
+        self._timer_versions: Dict[MetricKey, int] = defaultdict(int)
+        self._timer_stats_cache: Dict[MetricKey, Tuple[int, Dict[str, float]]] = {}
+        # Counter increments are batched and folded into one point per key per window
+        self.flush_interval_seconds = 0.1
+        self._pending_increments: Dict[MetricKey, float] = defaultdict(float)
+        self._flush_task: Optional[asyncio.Task] = None
         
     def increment(self, name: str, value: float = 1.0, labels: Optional[Dict[str, str]] = None):
         """Increment a counter metric."""
-        labels = labels or {}
-        key = self._make_key(name, labels)
-        
-        self.counters[key] += value
-        
-        metric_point = MetricPoint(
-            name=name,
-            value=self.counters[key],
-            labels=labels,
-            timestamp=datetime.utcnow(),
-            metric_type=MetricType.COUNTER
-        )
-        
-        self.metrics[key].append(metric_point)
+        key = self._make_key(name, labels or {})
+        self._pending_increments[key] += value
+        self._schedule_flush()
+    
+    def _schedule_flush(self):
+        """Start the flush timer for pending increments, or flush now without a loop."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to flush from later; apply immediately
+            self.flush_increments()
+            return
+        
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_after_interval())
+    
+    async def _flush_after_interval(self):
+        """Fold pending counter increments once the batching window closes."""
+        await asyncio.sleep(self.flush_interval_seconds)
+        self.flush_increments()
+    
+    def flush_increments(self):
+        """Apply pending counter increments, recording one point per counter."""
+        if not self._pending_increments:
+            return
+        
+        pending, self._pending_increments = self._pending_increments, defaultdict(float)
+        timestamp = time.time()
+        for key, delta in pending.items():
+            self.counters[key] += delta
+            if key[0] in self._history_enabled:
+                self._append_row(key, MetricType.COUNTER, timestamp, self.counters[key])
     
     def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Set a gauge metric value."""
@@ -63,54 +109,86 @@ class MetricsCollector:
         
         self.gauges[key] = value
         
-        metric_point = MetricPoint(
-            name=name,
-            value=value,
-            labels=labels,
-            timestamp=datetime.utcnow(),
-            metric_type=MetricType.GAUGE
-        )
-        
-        self.metrics[key].append(metric_point)
+        if name in self._history_enabled:
+            self._append_row(key, MetricType.GAUGE, time.time(), value)
     
     def record_timer(self, name: str, duration: float, labels: Optional[Dict[str, str]] = None):
         """Record a timing metric."""
         labels = labels or {}
         key = self._make_key(name, labels)
         
-        # Keep only recent timer values for efficiency
-        if len(self.timers[key]) >= 1000:
-            self.timers[key] = self.timers[key][-500:]
-        
+        # Ring buffer keeps only the most recent samples
         self.timers[key].append(duration)
+        self._timer_versions[key] += 1
         
-        metric_point = MetricPoint(
-            name=name,
-            value=duration,
-            labels=labels,
-            timestamp=datetime.utcnow(),
-            metric_type=MetricType.TIMER
-        )
-        
-        self.metrics[key].append(metric_point)
+        self._append_row(key, MetricType.TIMER, time.time(), duration)
     
     def record_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """Record a histogram metric."""
         labels = labels or {}
         key = self._make_key(name, labels)
         
-        metric_point = MetricPoint(
-            name=name,
-            value=value,
-            labels=labels,
-            timestamp=datetime.utcnow(),
-            metric_type=MetricType.HISTOGRAM
-        )
-        
-        self.metrics[key].append(metric_point)
+        self._append_row(key, MetricType.HISTOGRAM, time.time(), value)
+    
+    def record_batch(self, events: List[Tuple[str, float, Optional[Dict[str, str]], MetricType]]):
+        """Record several metrics at once with a shared timestamp.
+        
+        Each event is ``(name, value, labels, metric_type)``; label keys are
+        built once per distinct labels dict in the batch.
+        """
+        timestamp = time.time()
+        label_keys: Dict[int, Tuple[Tuple[str, str], ...]] = {}
+        has_increments = False
+        
+        for name, value, labels, metric_type in events:
+            label_key = label_keys.get(id(labels))
+            if label_key is None:
+                label_key = label_keys[id(labels)] = self._make_key(name, labels or {})[1]
+            key = (name, label_key)
+            
+            if metric_type is MetricType.COUNTER:
+                self._pending_increments[key] += value
+                has_increments = True
+            elif metric_type is MetricType.GAUGE:
+                self.gauges[key] = value
+                if name in self._history_enabled:
+                    self._append_row(key, metric_type, timestamp, value)
+            elif metric_type is MetricType.TIMER:
+                self.timers[key].append(value)
+                self._timer_versions[key] += 1
+                self._append_row(key, metric_type, timestamp, value)
+            else:
+                self._append_row(key, metric_type, timestamp, value)
+        
+        if has_increments:
+            self._schedule_flush()
+    
+    def enable_history(self, name: str):
+        """Keep per-update history for a counter or gauge name."""
+        self._history_enabled.add(name)
+    
+    def _append_row(self, key: MetricKey, metric_type: MetricType, timestamp: float, value: float):
+        """Append a (timestamp, value) row to a metric's history."""
+        rows = self.metrics.get(key)
+        if rows is None:
+            rows = self.metrics[key] = deque(maxlen=self.max_history_size)
+            self._metric_types[key] = metric_type
+            self._name_to_keys[key[0]].add(key)
+        elif len(rows) == rows.maxlen:
+            self._evicted_values[key] = rows[0][1]
+        rows.append((timestamp, value))
+    
+    def _to_points(self, key: MetricKey, rows) -> List[MetricPoint]:
+        """Expand stored history rows for a key into MetricPoints."""
+        name, metric_type, labels = key[0], self._metric_types[key], dict(key[1])
+        return [
+            MetricPoint(name=name, value=value, labels=labels, timestamp=ts, metric_type=metric_type)
+            for ts, value in rows
+        ]
     
     def get_counter(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
         """Get current counter value."""
+        self.flush_increments()
         key = self._make_key(name, labels or {})
         return self.counters.get(key, 0.0)
     
@@ -122,15 +200,20 @@ class MetricsCollector:
     def get_timer_stats(self, name: str, labels: Optional[Dict[str, str]] = None) -> Optional[Dict[str, float]]:
         """Get timer statistics (mean, median, p95, p99)."""
         key = self._make_key(name, labels or {})
-        timer_values = self.timers.get(key, [])
+        timer_values = self.timers.get(key)
         
         if not timer_values:
             return None
         
+        version = self._timer_versions[key]
+        cached = self._timer_stats_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return dict(cached[1])
+        
         sorted_values = sorted(timer_values)
         count = len(sorted_values)
         
-        return {
+        stats = {
             "count": count,
             "mean": statistics.mean(sorted_values),
             "median": statistics.median(sorted_values),
@@ -139,48 +222,82 @@ class MetricsCollector:
             "p95": sorted_values[int(0.95 * count)] if count > 0 else 0,
             "p99": sorted_values[int(0.99 * count)] if count > 0 else 0,
         }
+        self._timer_stats_cache[key] = (version, stats)
+        return dict(stats)
     
     def get_metrics_by_name(self, name: str) -> List[MetricPoint]:
         """Get all metrics with a specific name."""
-        matching_metrics = []
-        for key, metric_points in self.metrics.items():
-            if key.startswith(name):
-                matching_metrics.extend(list(metric_points))
+        self.flush_increments()
+        keys = self._name_to_keys.get(name, ())
         
-        return sorted(matching_metrics, key=lambda x: x.timestamp)
+        # Each key's rows are already time-ordered, so a k-way merge replaces a full sort
+        return list(heapq.merge(*(self._to_points(key, self.metrics[key]) for key in keys), key=_point_ts))
     
     def get_recent_metrics(self, name: str, minutes: int = 5) -> List[MetricPoint]:
         """Get recent metrics within a time window."""
-        cutoff_time = datetime.utcnow() - timedelta(minutes=minutes)
-        all_metrics = self.get_metrics_by_name(name)
-        
-        return [metric for metric in all_metrics if metric.timestamp >= cutoff_time]
+        self.flush_increments()
+        cutoff_time = time.time() - minutes * 60
+        recent_metrics = []
+        for key in self._name_to_keys.get(name, ()):
+            rows = self.metrics[key]
+            # Rows are appended in time order, so walking back from the newest row stops
+            # at the cutoff and only touches rows inside the window
+            tail = list(takewhile(lambda row: row[0] >= cutoff_time, reversed(rows)))
+            tail.reverse()
+            recent_metrics.extend(self._to_points(key, tail))
+        
+        recent_metrics.sort(key=_point_ts)
+        return recent_metrics
     
     def get_all_metrics(self) -> Dict[str, List[MetricPoint]]:
         """Get all metrics."""
-        return {key: list(points) for key, points in self.metrics.items()}
+        self.flush_increments()
+        return {self._key_to_str(key): self._to_points(key, rows) for key, rows in self.metrics.items()}
     
     def clear_metrics(self, name: Optional[str] = None):
         """Clear metrics, optionally by name."""
+        self.flush_increments()
         if name:
-            keys_to_remove = [key for key in self.metrics.keys() if key.startswith(name)]
+            keys_to_remove = {
+                key for store in (self.metrics, self.counters, self.gauges, self.timers)
+                for key in store if key[0] == name
+            }
+            self._name_to_keys.pop(name, None)
             for key in keys_to_remove:
-                del self.metrics[key]
+                self.metrics.pop(key, None)
+                self._evicted_values.pop(key, None)
+                self._metric_types.pop(key, None)
                 self.counters.pop(key, None)
                 self.gauges.pop(key, None)
                 self.timers.pop(key, None)
+                self._timer_versions.pop(key, None)
+                self._timer_stats_cache.pop(key, None)
         else:
             self.metrics.clear()
+            self._evicted_values.clear()
+            self._metric_types.clear()
+            self._name_to_keys.clear()
             self.counters.clear()
             self.gauges.clear()
             self.timers.clear()
+            self._timer_versions.clear()
+            self._timer_stats_cache.clear()
     
-    def _make_key(self, name: str, labels: Dict[str, str]) -> str:
+    def _make_key(self, name: str, labels: Dict[str, str]) -> MetricKey:
         """Create a unique key for a metric with labels."""
+        if not labels:
+            return (name, ())
+        
+        return (name, tuple(sorted(labels.items())))
+    
+    @staticmethod
+    def _key_to_str(key: MetricKey) -> str:
+        """Render a metric key as ``name{k=v,...}`` for export."""
+        name, labels = key
         if not labels:
             return name
         
-        label_parts = [f"{k}={v}" for k, v in sorted(labels.items())]
+        label_parts = [f"{k}={v}" for k, v in labels]
         return f"{name}{{{','.join(label_parts)}}}"
     
     # Trading-specific metric methods
@@ -189,10 +306,12 @@ class MetricsCollector:
         """Record a trade execution with relevant metrics."""
         labels = {"symbol": symbol, "side": side}
         
-        self.increment("trades_total", labels=labels)
-        self.record_timer("trade_execution_latency", latency, labels=labels)
-        self.set_gauge("last_trade_price", price, labels={"symbol": symbol})
-        self.set_gauge("last_trade_size", size, labels=labels)
+        self.record_batch([
+            ("trades_total", 1.0, labels, MetricType.COUNTER),
+            ("trade_execution_latency", latency, labels, MetricType.TIMER),
+            ("last_trade_price", price, {"symbol": symbol}, MetricType.GAUGE),
+            ("last_trade_size", size, labels, MetricType.GAUGE),
+        ])
     
     def record_order_placement(self, symbol: str, order_type: str, latency: float, success: bool):
         """Record order placement metrics."""
@@ -250,26 +369,29 @@ class MetricsCollector:
     
     def get_trading_summary(self, hours: int = 24) -> Dict[str, Any]:
         """Get a summary of trading metrics."""
-        cutoff_time = datetime.utcnow() - timedelta(hours=hours)
-        
-        # Get recent trades
-        recent_trades = []
-        for key, points in self.metrics.items():
-            if "trades_total" in key:
-                recent_points = [p for p in points if p.timestamp >= cutoff_time]
-                if recent_points:
-                    recent_trades.extend(recent_points)
-        
-        total_trades = len(recent_trades)
+        self.flush_increments()
+        cutoff_time = time.time() - hours * 3600
+        
+        # Count trades in the window from the cumulative counter history
+        total_trades = 0
+        for key, rows in self.metrics.items():
+            if key[0] == "trades_total" and rows and rows[-1][0] >= cutoff_time:
+                # Walk back from the newest row to the last value recorded before the window
+                baseline = self._evicted_values.get(key, 0.0)
+                for ts, value in reversed(rows):
+                    if ts < cutoff_time:
+                        baseline = value
+                        break
+                total_trades += int(rows[-1][1] - baseline)
         
         # Get trade latency stats
         latency_stats = self.get_timer_stats("trade_execution_latency")
         
         # Get current positions
         position_metrics = {}
-        for key, value in self.gauges.items():
-            if "position_size" in key:
-                symbol = key.split("symbol=")[1].split("}")[0] if "symbol=" in key else "unknown"
+        for (metric_name, labels), value in self.gauges.items():
+            if metric_name == "position_size":
+                symbol = next((v for k, v in labels if k == "symbol"), "unknown")
                 position_metrics[symbol] = value
         
         return {
@@ -294,15 +416,35 @@ class MetricTimer:
         self.start_time = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.start_time:
-            duration = time.time() - self.start_time
+        if self.start_time is not None:
+            duration = (time.perf_counter_ns() - self.start_time) * 1e-9
             self.collector.record_timer(self.metric_name, duration, self.labels)
 
 
+def timed(metric_name: str, **labels: str) -> Callable:
+    """Decorator that records a coroutine's run time as a timer metric.
+    
+    Cheaper than wrapping each call in ``MetricTimer``; labels are fixed at
+    decoration time and the global collector is resolved per call.
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                get_metrics_collector().record_timer(
+                    metric_name, (time.perf_counter_ns() - start) * 1e-9, labels
+                )
+        return wrapper
+    return decorator
+
+
 # Global metrics collector instance
 _metrics_collector: Optional[MetricsCollector] = None
 
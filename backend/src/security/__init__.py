@@ -6,6 +6,7 @@ from .auth import (
     create_access_token,
     verify_password,
     hash_password,
+    hash_passwords_bulk,
     authenticate_user,
     User
 )
@@ -18,6 +19,7 @@ __all__ = [
     "create_access_token",
     "verify_password",
     "hash_password",
+    "hash_passwords_bulk",
     "authenticate_user",
     "User",
     "APIKeyManager",
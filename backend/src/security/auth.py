@@ -1,17 +1,24 @@
 """Authentication and authorization utilities."""
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from typing import Any, Hashable, List, Optional, Tuple
 import jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+import bcrypt
+from cryptography.hazmat.primitives import serialization
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 import pyotp
-import qrcode
-import io
-import base64
 import secrets
+import hashlib
+import hmac
+import os
+import threading
+import time
 import logging
 
 from ..database.base import get_db
@@ -22,22 +29,89 @@ from ..config.settings import get_settings
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt only uses the first 72 bytes of a password
+BCRYPT_MAX_PASSWORD_BYTES = 72
 
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
-# JWT settings
-SECRET_KEY = settings.secret_key
-ALGORITHM = "HS256"
+# JWT settings; the HS256 secret also keys backup code hashes
+SECRET_KEY = settings.jwt_secret_key
+
+
+def _load_jwt_keys():
+    """Resolve the JWT algorithm and key objects once at import time."""
+    if settings.jwt_private_key:
+        # Ed25519: only this service can sign, while gateways can verify with the public key
+        private_key = serialization.load_pem_private_key(settings.jwt_private_key.encode(), password=None)
+        if settings.jwt_public_key:
+            public_key = serialization.load_pem_public_key(settings.jwt_public_key.encode())
+        else:
+            public_key = private_key.public_key()
+        return "EdDSA", private_key, public_key
+    return "HS256", SECRET_KEY, SECRET_KEY
+
+
+ALGORITHM, _SIGNING_KEY, _VERIFY_KEY = _load_jwt_keys()
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 REFRESH_TOKEN_EXPIRE_DAYS = 7
+JWT_REQUIRED_CLAIMS = ["exp", "sub", "type"]
+
+# Short-lived caches for the per-request auth path
+TOKEN_CACHE_TTL_SECONDS = 30.0
+USER_CACHE_TTL_SECONDS = 60.0
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries expire after a per-entry TTL."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        now_m = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= now_m:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+    
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+# Verified token payloads keyed by token digest
+_token_cache = _TTLCache(maxsize=10000)
+
+# Resolved users keyed by email
+_user_cache = _TTLCache(maxsize=5000)
 
 
 class User:
     """User model for authentication."""
     
+    # Built for every authenticated request, so skip the per-instance __dict__
+    __slots__ = (
+        "id", "email", "username", "is_active", "is_superuser", "is_2fa_enabled",
+        "trading_enabled", "paper_trading_mode", "created_at", "last_login",
+    )
+    
     def __init__(self, user_data: UserModel):
         self.id = user_data.id
         self.email = user_data.email
@@ -53,12 +127,53 @@ class User:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(
+            plain_password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES],
+            hashed_password.encode("utf-8")
+        )
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
 
 
 def hash_password(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.bcrypt_cost)
+    return bcrypt.hashpw(password.encode("utf-8")[:BCRYPT_MAX_PASSWORD_BYTES], salt).decode("utf-8")
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a stored hash was made with a different bcrypt cost than configured."""
+    # bcrypt hashes look like $2b$<cost>$<salt+digest>
+    parts = hashed_password.split("$")
+    if len(parts) != 4 or not parts[2].isdigit():
+        return True
+    return int(parts[2]) != settings.bcrypt_cost
+
+
+# bcrypt releases the GIL, so one thread per core hashes in parallel without oversubscribing
+_bcrypt_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_bcrypt_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for bulk bcrypt work."""
+    global _bcrypt_executor
+    if _bcrypt_executor is None:
+        _bcrypt_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 1,
+            thread_name_prefix="bcrypt"
+        )
+    return _bcrypt_executor
+
+
+async def hash_passwords_bulk(passwords: List[str]) -> List[str]:
+    """Hash many passwords in parallel (e.g. admin bulk imports), preserving order."""
+    loop = asyncio.get_running_loop()
+    executor = _get_bcrypt_executor()
+    return list(await asyncio.gather(
+        *(loop.run_in_executor(executor, hash_password, password) for password in passwords)
+    ))
 
 
 def create_access_token(
@@ -68,34 +183,67 @@ def create_access_token(
     """Create a JWT access token."""
     to_encode = data.copy()
     
+    # Epoch seconds go into the claims as-is, so no datetime round trip is needed
+    now = int(time.time())
     if expires_delta:
-        expire = datetime.now(timezone.utc) + expires_delta
+        ttl_seconds = int(expires_delta.total_seconds())
     else:
-        expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        ttl_seconds = ACCESS_TOKEN_EXPIRE_MINUTES * 60
     
-    to_encode.update({"exp": expire, "type": "access"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    to_encode.update({"iat": now, "exp": now + ttl_seconds, "type": "access"})
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
 def create_refresh_token(data: dict) -> str:
     """Create a JWT refresh token."""
     to_encode = data.copy()
-    expire = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode.update({"exp": expire, "type": "refresh"})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    now = int(time.time())
+    to_encode.update({"iat": now, "exp": now + REFRESH_TOKEN_EXPIRE_DAYS * 86400, "type": "refresh"})
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
+def _token_cache_key(token: str) -> bytes:
+    """Digest a token so raw credentials are never held as cache keys."""
+    return hashlib.sha256(token.encode()).digest()[:16]
+
+
+def invalidate_token(token: str) -> None:
+    """Drop a token's cached verification result."""
+    _token_cache.pop(_token_cache_key(token))
+
+
+def invalidate_user(email: str) -> None:
+    """Drop a user's cached record so the next request reloads it."""
+    _user_cache.pop(email)
+
+
 def verify_token(token: str) -> Optional[dict]:
     """Verify and decode a JWT token."""
+    cache_key = _token_cache_key(token)
+    cached = _token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        # Only the configured algorithm is accepted, and tokens missing exp/sub/type are rejected during decode
+        payload = jwt.decode(
+            token,
+            _VERIFY_KEY,
+            algorithms=[ALGORITHM],
+            options={"require": JWT_REQUIRED_CLAIMS}
+        )
+        
+        # Never cache past the token's own expiry
+        ttl = min(TOKEN_CACHE_TTL_SECONDS, float(payload["exp"]) - time.time())
+        _token_cache.set(cache_key, payload, ttl)
+        
         return payload
     except jwt.ExpiredSignatureError:
         logger.warning("Token has expired")
         return None
-    except jwt.JWTError as e:
+    except jwt.InvalidTokenError as e:
         logger.warning(f"Token validation error: {e}")
         return None
 
@@ -114,7 +262,8 @@ async def authenticate_user(
         logger.warning(f"Authentication failed: user {email} not found")
         return None
     
-    if not verify_password(password, user_model.hashed_password):
+    # bcrypt releases the GIL, so run it in a worker thread instead of stalling the event loop
+    if not await asyncio.to_thread(verify_password, password, user_model.hashed_password):
         logger.warning(f"Authentication failed: invalid password for {email}")
         return None
     
@@ -133,6 +282,12 @@ async def authenticate_user(
             logger.warning(f"Authentication failed: invalid 2FA token for {email}")
             return None
     
+    # Migrate the stored hash to the configured cost while we have the plaintext
+    if password_needs_rehash(user_model.hashed_password):
+        new_hash = await asyncio.to_thread(hash_password, password)
+        user_dao.update_user(user_model.id, {"hashed_password": new_hash})
+        logger.info(f"Rehashed password for {email} at cost {settings.bcrypt_cost}")
+    
     # Update last login
     user_dao.update_last_login(user_model.id)
     
@@ -141,6 +296,7 @@ async def authenticate_user(
 
 
 async def get_current_user(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
@@ -164,13 +320,36 @@ async def get_current_user(
     if email is None:
         raise credentials_exception
     
-    user_dao = UserDAO(db)
-    user_model = user_dao.get_user_by_email(email)
+    user = _user_cache.get(email)
+    if user is None:
+        user_dao = UserDAO(db)
+        user_model = user_dao.get_user_by_email(email)
+        
+        if user_model is None:
+            raise credentials_exception
+        
+        # Keep the row for this request only; the shared cache holds the plain wrapper
+        request.state.user_model = user_model
+        user = User(user_model)
+        _user_cache.set(email, user, USER_CACHE_TTL_SECONDS)
     
+    request.state.user = user
+    return user
+
+
+async def get_current_user_model(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> UserModel:
+    """Get the ORM row for the current user, reusing the one loaded during authentication."""
+    user_model = getattr(request.state, "user_model", None)
     if user_model is None:
-        raise credentials_exception
-    
-    return User(user_model)
+        user_model = UserDAO(db).get_user_by_id(current_user.id)
+        if user_model is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found")
+        request.state.user_model = user_model
+    return user_model
 
 
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
@@ -187,6 +366,11 @@ def generate_2fa_secret() -> str:
 
 def get_2fa_qr_code(secret: str, email: str, issuer: str = "dYdX Trading Bot") -> str:
     """Generate a QR code for 2FA setup."""
+    # qrcode pulls in PIL; only 2FA setup needs it, so keep it out of worker start-up
+    import base64
+    import io
+    import qrcode
+    
     totp_uri = pyotp.totp.TOTP(secret).provisioning_uri(
         name=email,
         issuer_name=issuer
@@ -208,13 +392,19 @@ def get_2fa_qr_code(secret: str, email: str, issuer: str = "dYdX Trading Bot") -
     return f"data:image/png;base64,{img_base64}"
 
 
+@lru_cache(maxsize=4096)
+def _totp(secret: str) -> pyotp.TOTP:
+    """Reuse TOTP objects per secret across verifications."""
+    return pyotp.TOTP(secret)
+
+
 def verify_totp_token(secret: str, token: str) -> bool:
-    """Verify a TOTP token."""
+    """Verify a TOTP token (pyotp compares codes in constant time)."""
     if not secret or not token:
         return False
     
     try:
-        totp = pyotp.TOTP(secret)
+        totp = _totp(secret)
         # Allow for some clock drift (window of 1 = 30 seconds before/after)
         return totp.verify(token, valid_window=1)
     except Exception as e:
@@ -222,27 +412,51 @@ def verify_totp_token(secret: str, token: str) -> bool:
         return False
 
 
+BACKUP_CODE_BYTES = 5  # 40 bits -> 10 hex characters
+
+
 def generate_backup_codes(count: int = 10) -> list[str]:
     """Generate backup codes for 2FA recovery."""
-    return [secrets.token_hex(4).upper() for _ in range(count)]
+    # One RNG read for the whole batch, sliced into codes
+    raw = secrets.token_bytes(BACKUP_CODE_BYTES * count)
+    return [
+        raw[i:i + BACKUP_CODE_BYTES].hex().upper()
+        for i in range(0, len(raw), BACKUP_CODE_BYTES)
+    ]
+
+
+def hash_backup_code(code: str) -> str:
+    """Hash a backup code for storage, keyed with the app secret."""
+    return hmac.new(SECRET_KEY.encode(), code.upper().strip().encode(), hashlib.sha256).hexdigest()
 
 
 def verify_backup_code(backup_codes: list[str], provided_code: str) -> tuple[bool, list[str]]:
     """
     Verify a backup code and remove it from the list.
     
+    Stored codes are HMAC digests; legacy plaintext codes are hashed on the fly.
+    Every stored code is compared in constant time so timing doesn't reveal
+    which (or whether any) code matched.
+    
     Returns:
         Tuple of (is_valid, updated_backup_codes)
     """
     if not backup_codes or not provided_code:
         return False, backup_codes
     
-    provided_code = provided_code.upper().strip()
+    provided_hash = hash_backup_code(provided_code)
+    
+    matched = False
+    match_index = -1
+    for i, code in enumerate(backup_codes):
+        stored_hash = code if len(code) == 64 else hash_backup_code(code)
+        is_match = hmac.compare_digest(stored_hash, provided_hash)
+        matched |= is_match
+        match_index = i if is_match else match_index
     
-    if provided_code in backup_codes:
+    if matched:
         # Remove the used backup code
-        updated_codes = [code for code in backup_codes if code != provided_code]
-        return True, updated_codes
+        return True, backup_codes[:match_index] + backup_codes[match_index + 1:]
     
     return False, backup_codes
 
@@ -273,10 +487,11 @@ class AuthenticationManager:
                 return False, "User already exists", None
             
             # Create user
+            hashed_password = await asyncio.to_thread(hash_password, password)
             user_data = {
                 "email": email,
                 "username": username,
-                "hashed_password": hash_password(password),
+                "hashed_password": hashed_password,
                 "is_active": True,
                 "is_superuser": False,
                 "is_2fa_enabled": False,
@@ -319,9 +534,10 @@ class AuthenticationManager:
                 "backup_codes": backup_codes,
                 "is_2fa_enabled": False  # Will be enabled after verification
             })
+            invalidate_user(user_model.email)
             
-            # Generate QR code
-            qr_code = get_2fa_qr_code(secret, user_model.email)
+            # Render the QR image in a worker thread; PNG encoding would block the event loop
+            qr_code = await asyncio.to_thread(get_2fa_qr_code, secret, user_model.email)
             
             return True, "2FA setup initiated", qr_code
             
@@ -345,17 +561,23 @@ class AuthenticationManager:
             if not user_model or not user_model.totp_secret:
                 return False, "2FA setup not initiated", None
             
+            if user_model.is_2fa_enabled:
+                return False, "2FA is already enabled", None
+            
             # Verify the token
             if not verify_totp_token(user_model.totp_secret, token):
                 return False, "Invalid verification code", None
             
-            # Enable 2FA
+            # Enable 2FA; backup codes are shown once here and only their hashes are kept
+            backup_codes = user_model.backup_codes or []
             self.user_dao.update_user(user_id, {
-                "is_2fa_enabled": True
+                "is_2fa_enabled": True,
+                "backup_codes": [hash_backup_code(code) for code in backup_codes]
             })
+            invalidate_user(user_model.email)
             
             logger.info(f"2FA enabled for user {user_id}")
-            return True, "2FA enabled successfully", user_model.backup_codes
+            return True, "2FA enabled successfully", backup_codes
             
         except Exception as e:
             logger.error(f"2FA verification error: {e}")
@@ -378,7 +600,7 @@ class AuthenticationManager:
                 return False, "User not found"
             
             # Verify password
-            if not verify_password(password, user_model.hashed_password):
+            if not await asyncio.to_thread(verify_password, password, user_model.hashed_password):
                 return False, "Invalid password"
             
             # Disable 2FA
@@ -387,6 +609,9 @@ class AuthenticationManager:
                 "totp_secret": None,
                 "backup_codes": None
             })
+            invalidate_user(user_model.email)
+            # Don't keep the revoked secret in memory
+            _totp.cache_clear()
             
             logger.info(f"2FA disabled for user {user_id}")
             return True, "2FA disabled successfully"
@@ -413,14 +638,15 @@ class AuthenticationManager:
                 return False, "User not found"
             
             # Verify current password
-            if not verify_password(current_password, user_model.hashed_password):
+            if not await asyncio.to_thread(verify_password, current_password, user_model.hashed_password):
                 return False, "Invalid current password"
             
             # Update password
-            new_hashed_password = hash_password(new_password)
+            new_hashed_password = await asyncio.to_thread(hash_password, new_password)
             self.user_dao.update_user(user_id, {
                 "hashed_password": new_hashed_password
             })
+            invalidate_user(user_model.email)
             
             logger.info(f"Password changed for user {user_id}")
             return True, "Password changed successfully"
@@ -4,12 +4,26 @@ import os
 import base64
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-from typing import Optional
+from typing import Dict, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SALT = b"dydx_trading_bot_salt"  # Static salt for simplicity
+
+# Current format: base64url(version byte + 12-byte nonce + AES-GCM ciphertext/tag)
+AESGCM_VERSION = b"\x01"
+# Same layout, keyed by a subkey derived from the master key with a caller-supplied HKDF info
+SUBKEY_VERSION = b"\x02"
+AESGCM_NONCE_SIZE = 12
+HKDF_INFO = b"wolfhunt-field-encryption-v1"
+
+# Legacy Fernet tokens start with version byte 0x80, i.e. "gAAAA" once base64url encoded
+FERNET_TOKEN_PREFIX = b"gAAAA"
+
 
 class EncryptionManager:
     """Handles encryption and decryption of sensitive data."""
@@ -27,12 +41,46 @@ class EncryptionManager:
                 raise ValueError("No master encryption key provided")
         
         self.master_key = master_key.encode()
-        self._fernet = None
+        # Derived ciphers per salt; the legacy PBKDF2 path is only used to read old records
+        self._aead_cache: Dict[bytes, AESGCM] = {}
+        self._subkey_cache: Dict[bytes, AESGCM] = {}
+        self._fernet_cache: Dict[bytes, Fernet] = {}
+    
+    def derive_subkey(self, info: bytes) -> bytes:
+        """
+        Derive a 32-byte key for one domain (e.g. a user) from the master key.
+        
+        HKDF is enough for domain separation; the master key already has full
+        entropy, so no PBKDF2 stretching is needed.
+        """
+        return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=info).derive(self.master_key)
+    
+    def _get_subkey_aead(self, info: bytes) -> AESGCM:
+        """Get or create the AES-GCM cipher for a derived subkey."""
+        aead = self._subkey_cache.get(info)
+        if aead is None:
+            aead = self._subkey_cache[info] = AESGCM(self.derive_subkey(info))
+        return aead
+    
+    def _get_aead(self, salt: Optional[bytes] = None) -> AESGCM:
+        """Get or create the AES-GCM cipher for a salt."""
+        if salt is None:
+            salt = DEFAULT_SALT
+        
+        aead = self._aead_cache.get(salt)
+        if aead is None:
+            kdf = HKDF(algorithm=hashes.SHA256(), length=32, salt=salt, info=HKDF_INFO)
+            aead = self._aead_cache[salt] = AESGCM(kdf.derive(self.master_key))
+        return aead
     
     def _get_fernet(self, salt: Optional[bytes] = None) -> Fernet:
-        """Get or create Fernet instance with derived key."""
+        """Get or create the legacy Fernet instance for a salt."""
         if salt is None:
-            salt = b"dydx_trading_bot_salt"  # Static salt for simplicity
+            salt = DEFAULT_SALT
+        
+        fernet = self._fernet_cache.get(salt)
+        if fernet is not None:
+            return fernet
         
         # Derive key from master key using PBKDF2
         kdf = PBKDF2HMAC(
@@ -43,43 +91,88 @@ class EncryptionManager:
         )
         
         key = base64.urlsafe_b64encode(kdf.derive(self.master_key))
-        return Fernet(key)
+        fernet = self._fernet_cache[salt] = Fernet(key)
+        return fernet
+    
+    @staticmethod
+    def _encrypt_with(aead: AESGCM, data: str, version: bytes = AESGCM_VERSION) -> str:
+        """Encrypt a string into the versioned AES-GCM format."""
+        nonce = os.urandom(AESGCM_NONCE_SIZE)
+        ciphertext = aead.encrypt(nonce, data.encode(), None)
+        return base64.urlsafe_b64encode(version + nonce + ciphertext).decode("ascii")
+    
+    def _decrypt_token(
+        self,
+        encrypted_data: str,
+        salt: Optional[bytes] = None,
+        key_info: Optional[bytes] = None
+    ) -> str:
+        """Decrypt an AES-GCM record, falling back to the legacy Fernet formats."""
+        token = encrypted_data.encode()
+        if token.startswith(FERNET_TOKEN_PREFIX):
+            return self._get_fernet(salt).decrypt(token).decode()
+        
+        raw = base64.urlsafe_b64decode(token)
+        version = raw[:1]
+        if version == AESGCM_VERSION or version == SUBKEY_VERSION:
+            nonce = raw[1:1 + AESGCM_NONCE_SIZE]
+            ciphertext = raw[1 + AESGCM_NONCE_SIZE:]
+            if version == SUBKEY_VERSION:
+                if key_info is None:
+                    raise ValueError("Record was encrypted with a derived subkey; key_info is required")
+                aead = self._get_subkey_aead(key_info)
+            else:
+                aead = self._get_aead(salt)
+            return aead.decrypt(nonce, ciphertext, None).decode()
+        
+        # Legacy Fernet token wrapped in an extra base64 layer
+        return self._get_fernet(salt).decrypt(raw).decode()
     
-    def encrypt(self, data: str, salt: Optional[bytes] = None) -> str:
+    def encrypt(
+        self,
+        data: str,
+        salt: Optional[bytes] = None,
+        key_info: Optional[bytes] = None
+    ) -> str:
         """
         Encrypt a string.
         
         Args:
             data: String to encrypt
             salt: Optional salt for key derivation
+            key_info: Optional HKDF info; when given, the record is keyed by
+                ``derive_subkey(key_info)`` instead of the salt
             
         Returns:
-            Base64 encoded encrypted data
+            Base64url encoded versioned AES-GCM record
         """
         try:
-            fernet = self._get_fernet(salt)
-            encrypted_data = fernet.encrypt(data.encode())
-            return base64.b64encode(encrypted_data).decode()
+            if key_info is not None:
+                return self._encrypt_with(self._get_subkey_aead(key_info), data, SUBKEY_VERSION)
+            return self._encrypt_with(self._get_aead(salt), data)
         except Exception as e:
             logger.error(f"Encryption error: {e}")
             raise
     
-    def decrypt(self, encrypted_data: str, salt: Optional[bytes] = None) -> str:
+    def decrypt(
+        self,
+        encrypted_data: str,
+        salt: Optional[bytes] = None,
+        key_info: Optional[bytes] = None
+    ) -> str:
         """
         Decrypt a string.
         
         Args:
-            encrypted_data: Base64 encoded encrypted data
-            salt: Optional salt for key derivation
+            encrypted_data: Encrypted record (legacy Fernet tokens are accepted)
+            salt: Optional salt for key derivation (used by older records)
+            key_info: HKDF info for records written with a derived subkey
             
         Returns:
             Decrypted string
         """
         try:
-            fernet = self._get_fernet(salt)
-            decoded_data = base64.b64decode(encrypted_data.encode())
-            decrypted_data = fernet.decrypt(decoded_data)
-            return decrypted_data.decode()
+            return self._decrypt_token(encrypted_data, salt, key_info)
         except Exception as e:
             logger.error(f"Decryption error: {e}")
             raise
@@ -95,13 +188,11 @@ class EncryptionManager:
         Returns:
             Dictionary with encrypted values
         """
-        encrypted_dict = {}
-        for key, value in data_dict.items():
-            if isinstance(value, str):
-                encrypted_dict[key] = self.encrypt(value, salt)
-            else:
-                encrypted_dict[key] = value
-        return encrypted_dict
+        aead = self._get_aead(salt)
+        return {
+            key: self._encrypt_with(aead, value) if isinstance(value, str) else value
+            for key, value in data_dict.items()
+        }
     
     def decrypt_dict(self, encrypted_dict: dict, salt: Optional[bytes] = None) -> dict:
         """
@@ -118,7 +209,7 @@ class EncryptionManager:
         for key, value in encrypted_dict.items():
             if isinstance(value, str):
                 try:
-                    decrypted_dict[key] = self.decrypt(value, salt)
+                    decrypted_dict[key] = self._decrypt_token(value, salt)
                 except Exception:
                     # If decryption fails, assume it's not encrypted
                     decrypted_dict[key] = value
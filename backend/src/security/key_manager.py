@@ -1,17 +1,34 @@
 """API key management with secure encryption."""
 
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 import logging
+import time
 from sqlalchemy.orm import Session
 
-from .encryption import EncryptionManager
+from .encryption import get_encryption_manager
 from ..database.dao import UserDAO, ConfigurationDAO
 from ..config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# (result key, User column) for each stored credential; the passphrase is optional
+CREDENTIAL_COLUMNS = (
+    ("api_key", "api_key_encrypted"),
+    ("api_secret", "api_secret_encrypted"),
+    ("api_passphrase", "api_passphrase_encrypted"),
+)
+
+ROTATION_PERIOD_DAYS = 30
+
+
+def _config_epoch(value: Any) -> float:
+    """Read a stored timestamp; older rows hold ISO strings instead of epoch seconds."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp()
+    return value
+
 
 class APIKeyManager:
     """Manages encrypted storage and rotation of API keys."""
@@ -21,7 +38,11 @@ class APIKeyManager:
         self.user_id = user_id
         self.user_dao = UserDAO(db)
         self.config_dao = ConfigurationDAO(db)
-        self.encryption_manager = EncryptionManager()
+        # Shared manager so the per-user derived key is cached across requests
+        self.encryption_manager = get_encryption_manager()
+        # New records use an HKDF subkey; the salt is only needed to read older records
+        self.key_info = f"user_{self.user_id}".encode()
+        self.user_salt = f"user_{self.user_id}_salt".encode()
     
     async def store_api_keys(
         self, 
@@ -41,16 +62,13 @@ class APIKeyManager:
             True if successful, False otherwise
         """
         try:
-            # Generate user-specific salt
-            user_salt = f"user_{self.user_id}_salt".encode()
-            
             # Encrypt the API credentials
-            encrypted_key = self.encryption_manager.encrypt(api_key, user_salt)
-            encrypted_secret = self.encryption_manager.encrypt(api_secret, user_salt)
+            encrypted_key = self.encryption_manager.encrypt(api_key, key_info=self.key_info)
+            encrypted_secret = self.encryption_manager.encrypt(api_secret, key_info=self.key_info)
             encrypted_passphrase = None
             
             if api_passphrase:
-                encrypted_passphrase = self.encryption_manager.encrypt(api_passphrase, user_salt)
+                encrypted_passphrase = self.encryption_manager.encrypt(api_passphrase, key_info=self.key_info)
             
             # Store in user model
             update_data = {
@@ -63,23 +81,23 @@ class APIKeyManager:
             
             if success:
                 # Store metadata in configuration
-                await self.config_dao.save_config(
-                    category="api_keys",
-                    key="last_updated",
-                    value=datetime.utcnow().isoformat(),
-                    value_type="string",
-                    user_id=self.user_id,
-                    description="Last time API keys were updated"
-                )
-                
-                await self.config_dao.save_config(
-                    category="api_keys",
-                    key="rotation_due",
-                    value=(datetime.utcnow() + timedelta(days=30)).isoformat(),
-                    value_type="string",
-                    user_id=self.user_id,
-                    description="When API keys should be rotated"
-                )
+                now = int(time.time())
+                await self.config_dao.save_configs_bulk([
+                    {
+                        "category": "api_keys",
+                        "key": "last_updated",
+                        "value": now,
+                        "value_type": "int",
+                        "description": "Last time API keys were updated (epoch seconds)"
+                    },
+                    {
+                        "category": "api_keys",
+                        "key": "rotation_due",
+                        "value": now + ROTATION_PERIOD_DAYS * 86400,
+                        "value_type": "int",
+                        "description": "When API keys should be rotated (epoch seconds)"
+                    }
+                ], user_id=self.user_id)
                 
                 logger.info(f"API keys stored for user {self.user_id}")
             
@@ -101,21 +119,13 @@ class APIKeyManager:
             if not user or not user.api_key_encrypted:
                 return None
             
-            # Generate user-specific salt
-            user_salt = f"user_{self.user_id}_salt".encode()
-            
-            # Decrypt the API credentials
-            api_key = self.encryption_manager.decrypt(user.api_key_encrypted, user_salt)
-            api_secret = self.encryption_manager.decrypt(user.api_secret_encrypted, user_salt)
-            
-            result = {
-                "api_key": api_key,
-                "api_secret": api_secret
-            }
-            
-            if user.api_passphrase_encrypted:
-                api_passphrase = self.encryption_manager.decrypt(user.api_passphrase_encrypted, user_salt)
-                result["api_passphrase"] = api_passphrase
+            # Decrypt the API credentials in one pass over the shared cached cipher
+            decrypt = self.encryption_manager.decrypt
+            result = {}
+            for name, column in CREDENTIAL_COLUMNS:
+                encrypted = getattr(user, column)
+                if encrypted or name != "api_passphrase":
+                    result[name] = decrypt(encrypted, self.user_salt, self.key_info)
             
             return result
             
@@ -160,8 +170,7 @@ class APIKeyManager:
             if not rotation_config:
                 return False
             
-            rotation_due = datetime.fromisoformat(rotation_config.value)
-            return datetime.utcnow() >= rotation_due
+            return time.time() >= _config_epoch(rotation_config.value)
             
         except Exception as e:
             logger.error(f"Error checking rotation due for user {self.user_id}: {e}")
@@ -178,13 +187,11 @@ class APIKeyManager:
             True if successful, False otherwise
         """
         try:
-            new_rotation_date = datetime.utcnow() + timedelta(days=days)
-            
             await self.config_dao.save_config(
                 category="api_keys",
                 key="rotation_due",
-                value=new_rotation_date.isoformat(),
-                value_type="string",
+                value=int(time.time()) + days * 86400,
+                value_type="int",
                 user_id=self.user_id,
                 description=f"API key rotation extended by {days} days",
                 updated_by=self.user_id
@@ -251,10 +258,10 @@ class APIKeyManager:
             rotation_due = None
             
             if last_updated_config:
-                last_updated = datetime.fromisoformat(last_updated_config.value)
+                last_updated = datetime.utcfromtimestamp(_config_epoch(last_updated_config.value))
             
             if rotation_due_config:
-                rotation_due = datetime.fromisoformat(rotation_due_config.value)
+                rotation_due = datetime.utcfromtimestamp(_config_epoch(rotation_due_config.value))
             
             return {
                 "has_keys": has_keys,
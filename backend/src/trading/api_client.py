@@ -5,21 +5,77 @@ Handles all REST API interactions with proper authentication, rate limiting, and
 
 import asyncio
 import hashlib
-import hmac
+import random
 import time
 import json
+import logging
+from collections import deque
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from enum import Enum
 import httpx
 from httpx import Response, HTTPError, TimeoutException
+import numpy as np
 import structlog
 
 from src.config import get_config
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - required by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 logger = structlog.get_logger(__name__)
+# structlog's stdlib LoggerFactory logs through this logger; checking it first lets the
+# high-frequency polling paths skip building debug events that would be filtered anyway
+_stdlib_logger = logging.getLogger(__name__)
+
+
+def _debug_enabled() -> bool:
+    """Whether debug events from this module would be emitted"""
+    return _stdlib_logger.isEnabledFor(logging.DEBUG)
+
+# Bodies larger than this (bulk cancels, batched orders) are signed in a worker thread;
+# hashlib releases the GIL for large inputs, so the event loop keeps serving callbacks
+SIGN_OFFLOAD_BYTES = 4096
+
+# 429 handling: retries per request and the cap on exponential backoff
+MAX_RATE_LIMIT_RETRIES = 3
+MAX_BACKOFF_SECONDS = 30.0
+
+# Response time stats: EMA smoothing factor and how many raw samples are kept for percentiles
+RESPONSE_TIME_ALPHA = 0.1
+RESPONSE_TIME_DECAY = 1 - RESPONSE_TIME_ALPHA
+RESPONSE_TIME_SAMPLES = 1000
+
+# Hosts with separate connection pools, rate limiters and circuit breakers
+API_HOSTS = ("indexer", "trading")
+
+# Maximum orders in flight at once for place_orders_batch
+ORDER_BATCH_CONCURRENCY = 16
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize a request body to compact JSON bytes, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def _loads(content: bytes) -> Any:
+    """Parse a response body, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(content)
+    return json.loads(content)
 
 
 class OrderSide(str, Enum):
@@ -52,7 +108,7 @@ class TimeInForce(str, Enum):
     IOC = "IOC"  # Immediate or Cancel
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderRequest:
     """Order request data structure"""
     symbol: str
@@ -67,7 +123,7 @@ class OrderRequest:
     good_til_time: Optional[int] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OrderResult:
     """Order execution result"""
     success: bool
@@ -79,7 +135,7 @@ class OrderResult:
     remaining_size: float = 0.0
 
 
-@dataclass 
+@dataclass(slots=True, frozen=True)
 class Position:
     """Position data structure"""
     symbol: str
@@ -92,7 +148,7 @@ class Position:
     created_at: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Trade:
     """Trade data structure"""
     id: str
@@ -105,70 +161,127 @@ class Trade:
     liquidity: str  # MAKER or TAKER
 
 
+# (array name, payload key) for the float columns of get_positions_arrays.
+# The positions payload carries no mark price, so there is no mark_price column
+POSITION_FLOAT_COLUMNS = (
+    ("size", "size"),
+    ("entry_price", "entryPrice"),
+    ("unrealized_pnl", "unrealizedPnl"),
+    ("realized_pnl", "realizedPnl"),
+)
+
+
+def _parse_position(pos_data: Dict[str, Any]) -> Position:
+    """Build a Position from an indexer position payload"""
+    # datetime.fromisoformat is C-implemented and accepts the trailing "Z" on Python 3.11+
+    size = float(pos_data.get("size", 0))
+    entry_price = float(pos_data.get("entryPrice", 0))
+    unrealized_pnl = float(pos_data.get("unrealizedPnl", 0))
+    
+    # Indexer positions don't always carry a mark price; when absent, back it out of
+    # the unrealized PnL (pnl = |size| * (mark - entry) for longs, negated for shorts)
+    if "markPrice" in pos_data:
+        mark_price = float(pos_data["markPrice"])
+    elif size:
+        direction = -1.0 if pos_data.get("side") == "SHORT" else 1.0
+        mark_price = entry_price + unrealized_pnl / (direction * abs(size))
+    else:
+        mark_price = entry_price
+    
+    return Position(
+        symbol=pos_data.get("market"),
+        side=pos_data.get("side"),
+        size=size,
+        entry_price=entry_price,
+        mark_price=mark_price,
+        unrealized_pnl=unrealized_pnl,
+        realized_pnl=float(pos_data.get("realizedPnl", 0)),
+        created_at=datetime.fromisoformat(pos_data.get("createdAt", ""))
+    )
+
+
 class RateLimiter:
     """Token bucket rate limiter for API requests"""
     
     def __init__(self, requests_per_second: int):
         self.requests_per_second = requests_per_second
         self.tokens = requests_per_second
-        self.last_update = time.time()
+        self.last_update = time.monotonic()
         self.lock = asyncio.Lock()
     
+    def _refill(self) -> None:
+        """Add tokens for the time elapsed since the last refill"""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.tokens = min(
+            self.requests_per_second,
+            self.tokens + elapsed * self.requests_per_second
+        )
+        self.last_update = now
+    
     async def acquire(self) -> None:
         """Acquire a token for API request"""
-        async with self.lock:
-            now = time.time()
-            # Add tokens based on time elapsed
-            elapsed = now - self.last_update
-            self.tokens = min(
-                self.requests_per_second,
-                self.tokens + elapsed * self.requests_per_second
-            )
-            self.last_update = now
-            
-            if self.tokens < 1:
-                # Wait for next token
+        while True:
+            async with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
                 wait_time = (1 - self.tokens) / self.requests_per_second
-                await asyncio.sleep(wait_time)
-                self.tokens = 0
-            else:
-                self.tokens -= 1
+            
+            # Sleep without holding the lock so other callers can refill and proceed
+            await asyncio.sleep(wait_time)
 
 
 class CircuitBreaker:
     """Circuit breaker for API failure handling"""
     
+    # Methods never await, so each state transition is atomic on the event loop without a lock
+    
     def __init__(self, failure_threshold: int = 5, timeout: int = 60):
         self.failure_threshold = failure_threshold
         self.timeout = timeout
         self.failure_count = 0
         self.last_failure_time = 0
         self.state = "CLOSED"  # CLOSED, OPEN, HALF_OPEN
+        # Monotonic start time of the single HALF_OPEN probe, or None if no probe is running
+        self._probe_started: Optional[float] = None
     
     def can_execute(self) -> bool:
         """Check if request can be executed"""
-        now = time.time()
+        if self.state == "CLOSED":
+            return True
+        
+        now = time.monotonic()
         
         if self.state == "OPEN":
             if now - self.last_failure_time > self.timeout:
+                # This caller becomes the probe
                 self.state = "HALF_OPEN"
+                self._probe_started = now
                 return True
             return False
         
-        return True
+        # HALF_OPEN: admit one probe at a time; re-admit if a probe never reported back
+        if self._probe_started is None or now - self._probe_started > self.timeout:
+            self._probe_started = now
+            return True
+        return False
     
     def record_success(self) -> None:
         """Record successful request"""
         self.failure_count = 0
+        self._probe_started = None
         if self.state == "HALF_OPEN":
             self.state = "CLOSED"
     
     def record_failure(self) -> None:
         """Record failed request"""
         self.failure_count += 1
-        self.last_failure_time = time.time()
+        self.last_failure_time = time.monotonic()
+        self._probe_started = None
         
-        if self.failure_count >= self.failure_threshold:
+        if self.state == "HALF_OPEN" or self.failure_count >= self.failure_threshold:
             self.state = "OPEN"
 
 
@@ -198,10 +311,24 @@ class DydxRestClient:
         self.api_key = self.config.dydx_api_key
         self.secret_key = self.config.dydx_secret_key
         self.passphrase = self.config.dydx_passphrase
+        # HMAC-SHA256 inner/outer states with the padded key already absorbed
+        self._hmac_inner, self._hmac_outer = (
+            self._keyed_sha256_states(self.secret_key.encode('utf-8'))
+            if self.secret_key else (None, None)
+        )
+        # Only the signature and timestamp change per request
+        self._static_auth_headers = {
+            "DYDX-API-KEY": self.api_key,
+            "DYDX-PASSPHRASE": self.passphrase
+        }
         
         # Rate limiting and circuit breaking
-        self.rate_limiter = RateLimiter(self.config.api_requests_per_second)
-        self.circuit_breaker = CircuitBreaker()
+        # Bulkheads: the indexer and trading API hosts each get their own limiter and breaker,
+        # so an indexer outage cannot block order placement or cancellation
+        self.rate_limiters = {
+            host: RateLimiter(self.config.api_requests_per_second) for host in API_HOSTS
+        }
+        self.circuit_breakers = {host: CircuitBreaker() for host in API_HOSTS}
         
         # HTTP client configuration
         self.timeout_config = httpx.Timeout(
@@ -211,14 +338,18 @@ class DydxRestClient:
             pool=60.0
         )
         
-        # Connection limits
+        # Connection limits. Enough keepalive connections for concurrent order placement and
+        # polling, and an expiry matched to the upstream edge's 75s idle timeout so idle
+        # connections survive between polls instead of paying a new TLS handshake
         self.limits = httpx.Limits(
-            max_keepalive_connections=20,
-            max_connections=100,
-            keepalive_expiry=30
+            max_keepalive_connections=self.config.api_max_keepalive_connections,
+            max_connections=self.config.api_max_connections,
+            keepalive_expiry=self.config.api_keepalive_expiry
         )
         
+        # One client per host: indexer (market/account data) and trading API (orders)
         self.client: Optional[httpx.AsyncClient] = None
+        self.trading_client: Optional[httpx.AsyncClient] = None
         
         # Request statistics
         self.stats = {
@@ -226,8 +357,10 @@ class DydxRestClient:
             "requests_successful": 0,
             "requests_failed": 0,
             "last_request_time": None,
-            "average_response_time": 0.0
+            "average_response_time": None
         }
+        # Recent response times for percentile reporting
+        self._response_times: deque = deque(maxlen=RESPONSE_TIME_SAMPLES)
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -238,46 +371,66 @@ class DydxRestClient:
         """Async context manager exit"""
         await self.close()
     
+    def _create_http_client(self, base_url: str) -> httpx.AsyncClient:
+        """Create a pooled HTTP client for one host"""
+        # HTTP/2 multiplexes concurrent polls over a single connection per host
+        return httpx.AsyncClient(
+            base_url=base_url,
+            http2=HTTP2_AVAILABLE,
+            timeout=self.timeout_config,
+            limits=self.limits,
+            headers={
+                "User-Agent": "dYdX-Trading-Bot/1.0",
+                "Content-Type": "application/json"
+            }
+        )
+    
     async def initialize(self) -> None:
-        """Initialize HTTP client"""
+        """Initialize HTTP clients"""
         if self.client is None:
-            self.client = httpx.AsyncClient(
-                base_url=self.base_url,
-                timeout=self.timeout_config,
-                limits=self.limits,
-                headers={
-                    "User-Agent": "dYdX-Trading-Bot/1.0",
-                    "Content-Type": "application/json"
-                }
-            )
-            logger.info("dYdX REST client initialized")
+            self.client = self._create_http_client(self.base_url)
+            self.trading_client = self._create_http_client(self.api_url)
+            logger.info("dYdX REST client initialized", http2=HTTP2_AVAILABLE)
     
     async def close(self) -> None:
-        """Close HTTP client"""
+        """Close HTTP clients"""
         if self.client:
             await self.client.aclose()
+            await self.trading_client.aclose()
             self.client = None
+            self.trading_client = None
             logger.info("dYdX REST client closed")
     
-    def _generate_signature(self, timestamp: str, method: str, path: str, body: str = "") -> str:
+    @staticmethod
+    def _keyed_sha256_states(key: bytes):
+        """Precompute the HMAC-SHA256 ipad/opad hash states for a key"""
+        block_size = 64
+        if len(key) > block_size:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(block_size, b"\0")
+        inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+        return inner, outer
+    
+    def _generate_signature(self, timestamp: str, method: str, path: str, body: bytes = b"") -> str:
         """Generate HMAC SHA256 signature for authentication"""
-        message = timestamp + method.upper() + path + body
-        return hmac.new(
-            self.secret_key.encode('utf-8'),
-            message.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
-    
-    def _get_auth_headers(self, method: str, path: str, body: str = "") -> Dict[str, str]:
+        # Copying the keyed hash states is HMAC without the hmac module's wrapper overhead
+        inner = self._hmac_inner.copy()
+        inner.update((timestamp + method.upper() + path).encode('utf-8'))
+        inner.update(body)
+        outer = self._hmac_outer.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+    
+    def _get_auth_headers(self, method: str, path: str, body: bytes = b"") -> Dict[str, str]:
         """Generate authentication headers"""
         timestamp = str(int(time.time()))
         signature = self._generate_signature(timestamp, method, path, body)
         
         return {
+            **self._static_auth_headers,
             "DYDX-SIGNATURE": signature,
-            "DYDX-API-KEY": self.api_key,
-            "DYDX-TIMESTAMP": timestamp,
-            "DYDX-PASSPHRASE": self.passphrase
+            "DYDX-TIMESTAMP": timestamp
         }
     
     async def _make_request(
@@ -306,81 +459,115 @@ class DydxRestClient:
         if not self.client:
             await self.initialize()
         
+        # Each host has its own client, so the endpoint stays relative
+        if use_api_url:
+            host, client = "trading", self.trading_client
+        else:
+            host, client = "indexer", self.client
+        circuit_breaker = self.circuit_breakers[host]
+        rate_limiter = self.rate_limiters[host]
+        
         # Check circuit breaker
-        if not self.circuit_breaker.can_execute():
-            logger.warning("Circuit breaker is OPEN, skipping request")
+        if not circuit_breaker.can_execute():
+            logger.warning("Circuit breaker is OPEN, skipping request", host=host)
             return None
         
-        # Apply rate limiting
-        await self.rate_limiter.acquire()
-        
         # Prepare request
-        url = f"{self.api_url if use_api_url else self.base_url}{endpoint}"
-        headers = {}
-        body = ""
+        body = b""
         
         if data:
-            body = json.dumps(data, separators=(',', ':'))
-        
-        if authenticated:
-            path = endpoint
-            headers.update(self._get_auth_headers(method, path, body))
-        
-        start_time = time.time()
-        
-        try:
-            # Make the request
-            response = await self.client.request(
-                method=method,
-                url=url,
-                params=params,
-                content=body if body else None,
-                headers=headers
-            )
+            body = _dumps(data)
+        
+        for attempt in range(MAX_RATE_LIMIT_RETRIES + 1):
+            # Apply rate limiting
+            await rate_limiter.acquire()
+            
+            # Sign per attempt so retried requests carry a fresh timestamp; public market
+            # data requests skip signing and send only the client's default headers
+            headers = None
+            if authenticated:
+                path = endpoint
+                if len(body) > SIGN_OFFLOAD_BYTES:
+                    headers = await asyncio.to_thread(self._get_auth_headers, method, path, body)
+                else:
+                    headers = self._get_auth_headers(method, path, body)
             
-            # Record timing
-            response_time = time.time() - start_time
-            self._update_stats(response_time, success=True)
+            start_time = time.monotonic()
             
-            # Handle response
-            if response.status_code == 200:
-                self.circuit_breaker.record_success()
-                return response.json()
+            try:
+                # Make the request
+                response = await client.request(
+                    method=method,
+                    url=endpoint,
+                    params=params,
+                    content=body if body else None,
+                    headers=headers
+                )
+                
+                # Record timing
+                response_time = time.monotonic() - start_time
+                self._update_stats(response_time, success=True)
+                
+                # Handle response
+                if response.status_code == 200:
+                    circuit_breaker.record_success()
+                    return _loads(response.content)
+                
+                elif response.status_code == 429:
+                    # Rate limited
+                    if attempt == MAX_RATE_LIMIT_RETRIES:
+                        logger.warning("Rate limited by dYdX API, giving up",
+                                      endpoint=endpoint,
+                                      attempts=attempt + 1)
+                        return None
+                    
+                    delay = self._rate_limit_delay(response, attempt)
+                    logger.warning("Rate limited by dYdX API, backing off", 
+                                  endpoint=endpoint, 
+                                  status=response.status_code,
+                                  delay=round(delay, 3))
+                    await asyncio.sleep(delay)
+                
+                else:
+                    # Other HTTP errors
+                    logger.error("HTTP error from dYdX API",
+                               endpoint=endpoint,
+                               status=response.status_code,
+                               response=response.text)
+                    circuit_breaker.record_failure()
+                    return None
             
-            elif response.status_code == 429:
-                # Rate limited
-                logger.warning("Rate limited by dYdX API", 
-                              endpoint=endpoint, 
-                              status=response.status_code)
-                await asyncio.sleep(1)  # Back off
+            except TimeoutException:
+                logger.error("Request timeout", endpoint=endpoint)
+                circuit_breaker.record_failure()
+                self._update_stats(time.monotonic() - start_time, success=False)
                 return None
             
-            else:
-                # Other HTTP errors
-                logger.error("HTTP error from dYdX API",
-                           endpoint=endpoint,
-                           status=response.status_code,
-                           response=response.text)
-                self.circuit_breaker.record_failure()
+            except HTTPError as e:
+                logger.error("HTTP error", endpoint=endpoint, error=str(e))
+                circuit_breaker.record_failure()
+                self._update_stats(time.monotonic() - start_time, success=False)
+                return None
+            
+            except Exception as e:
+                logger.error("Unexpected error", endpoint=endpoint, error=str(e))
+                circuit_breaker.record_failure()
+                self._update_stats(time.monotonic() - start_time, success=False)
                 return None
         
-        except TimeoutException:
-            logger.error("Request timeout", endpoint=endpoint)
-            self.circuit_breaker.record_failure()
-            self._update_stats(time.time() - start_time, success=False)
-            return None
-        
-        except HTTPError as e:
-            logger.error("HTTP error", endpoint=endpoint, error=str(e))
-            self.circuit_breaker.record_failure()
-            self._update_stats(time.time() - start_time, success=False)
-            return None
-        
-        except Exception as e:
-            logger.error("Unexpected error", endpoint=endpoint, error=str(e))
-            self.circuit_breaker.record_failure()
-            self._update_stats(time.time() - start_time, success=False)
-            return None
+        return None
+    
+    @staticmethod
+    def _rate_limit_delay(response: Response, attempt: int) -> float:
+        """Backoff before retrying a 429, honoring Retry-After with jitter to avoid retry storms"""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return float(retry_after) + random.uniform(0, 0.25)
+            except ValueError:
+                pass  # HTTP-date form; fall back to exponential backoff
+        
+        return min(2 ** attempt, MAX_BACKOFF_SECONDS) * (0.5 + random.random() * 0.5)
     
     def _update_stats(self, response_time: float, success: bool) -> None:
         """Update request statistics"""
@@ -392,16 +579,12 @@ class DydxRestClient:
         else:
             self.stats["requests_failed"] += 1
         
-        # Update average response time
-        if self.stats["requests_sent"] == 1:
-            self.stats["average_response_time"] = response_time
-        else:
-            # Exponential moving average
-            alpha = 0.1
-            self.stats["average_response_time"] = (
-                alpha * response_time + 
-                (1 - alpha) * self.stats["average_response_time"]
-            )
+        # Exponential moving average, seeded by the first sample
+        average = self.stats["average_response_time"]
+        self.stats["average_response_time"] = response_time if average is None else (
+            RESPONSE_TIME_ALPHA * response_time + RESPONSE_TIME_DECAY * average
+        )
+        self._response_times.append(response_time)
     
     # =============================================================================
     # Account Management
@@ -436,6 +619,34 @@ class DydxRestClient:
         Returns:
             List of current positions
         """
+        raw_positions = await self._fetch_raw_positions()
+        return [_parse_position(pos_data) for pos_data in raw_positions]
+    
+    async def get_positions_arrays(self) -> Dict[str, np.ndarray]:
+        """
+        Get current open positions as parallel column arrays
+        
+        Returns:
+            Dict with object arrays "symbol" and "side" plus float64 arrays for
+            each column in POSITION_FLOAT_COLUMNS, all aligned by index
+        """
+        raw_positions = await self._fetch_raw_positions()
+        count = len(raw_positions)
+        
+        arrays = {
+            "symbol": np.array([pos_data.get("market") for pos_data in raw_positions], dtype=object),
+            "side": np.array([pos_data.get("side") for pos_data in raw_positions], dtype=object)
+        }
+        for name, key in POSITION_FLOAT_COLUMNS:
+            arrays[name] = np.fromiter(
+                (float(pos_data.get(key, 0)) for pos_data in raw_positions),
+                dtype=np.float64,
+                count=count
+            )
+        return arrays
+    
+    async def _fetch_raw_positions(self) -> List[Dict[str, Any]]:
+        """Fetch the raw position payloads from the indexer"""
         logger.info("Fetching current positions")
         
         result = await self._make_request(
@@ -444,26 +655,12 @@ class DydxRestClient:
             authenticated=True
         )
         
-        positions = []
         if result and "positions" in result:
-            for pos_data in result["positions"]:
-                position = Position(
-                    symbol=pos_data.get("market"),
-                    side=pos_data.get("side"),
-                    size=float(pos_data.get("size", 0)),
-                    entry_price=float(pos_data.get("entryPrice", 0)),
-                    mark_price=float(pos_data.get("unrealizedPnl", 0)),  # TODO: Get mark price
-                    unrealized_pnl=float(pos_data.get("unrealizedPnl", 0)),
-                    realized_pnl=float(pos_data.get("realizedPnl", 0)),
-                    created_at=datetime.fromisoformat(pos_data.get("createdAt", "").replace("Z", "+00:00"))
-                )
-                positions.append(position)
-            
-            logger.info("Retrieved positions", count=len(positions))
-        else:
-            logger.warning("No positions data received")
+            logger.info("Retrieved positions", count=len(result["positions"]))
+            return result["positions"]
         
-        return positions
+        logger.warning("No positions data received")
+        return []
     
     # =============================================================================
     # Order Management
@@ -486,13 +683,13 @@ class DydxRestClient:
                    size=order.size,
                    price=order.price)
         
-        # Build order payload
+        # Build order payload; the enums subclass str, so they serialize as their values
         payload = {
             "market": order.symbol,
-            "side": order.side.value,
-            "type": order.type.value,
+            "side": order.side,
+            "type": order.type,
             "size": str(order.size),
-            "timeInForce": order.time_in_force.value,
+            "timeInForce": order.time_in_force,
             "postOnly": order.post_only,
             "reduceOnly": order.reduce_only
         }
@@ -516,13 +713,14 @@ class DydxRestClient:
         
         if result and "order" in result:
             order_data = result["order"]
+            remaining_size = float(order_data.get("remainingSize", 0))
             return OrderResult(
                 success=True,
                 order_id=order_data.get("id"),
                 client_id=order_data.get("clientId"),
                 status=OrderStatus(order_data.get("status", "")),
-                filled_size=float(order_data.get("size", 0)) - float(order_data.get("remainingSize", 0)),
-                remaining_size=float(order_data.get("remainingSize", 0))
+                filled_size=float(order_data.get("size", 0)) - remaining_size,
+                remaining_size=remaining_size
             )
         else:
             return OrderResult(
@@ -530,6 +728,32 @@ class DydxRestClient:
                 error_message="Failed to place order"
             )
     
+    async def place_orders_batch(
+        self,
+        orders: List[OrderRequest],
+        max_concurrency: int = ORDER_BATCH_CONCURRENCY
+    ) -> List[OrderResult]:
+        """
+        Place several orders concurrently
+        
+        Network round trips overlap instead of running back to back; every order still
+        takes a rate limiter token and is signed just before it is sent.
+        
+        Args:
+            orders: Order requests to place
+            max_concurrency: Maximum number of orders in flight at once
+            
+        Returns:
+            Order results in the same order as the requests
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def place(order: OrderRequest) -> OrderResult:
+            async with semaphore:
+                return await self.place_order(order)
+        
+        return list(await asyncio.gather(*(place(order) for order in orders)))
+    
     async def cancel_order(self, order_id: str) -> bool:
         """
         Cancel an existing order
@@ -567,7 +791,9 @@ class DydxRestClient:
         Returns:
             Order status information
         """
-        logger.debug("Checking order status", order_id=order_id)
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("Checking order status", order_id=order_id)
         
         result = await self._make_request(
             method="GET",
@@ -575,7 +801,7 @@ class DydxRestClient:
             authenticated=True
         )
         
-        if result:
+        if result and debug:
             logger.debug("Order status retrieved", order_id=order_id)
         
         return result
@@ -590,7 +816,9 @@ class DydxRestClient:
         Returns:
             List of order fills
         """
-        logger.debug("Fetching order fills", order_id=order_id)
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("Fetching order fills", order_id=order_id)
         
         result = await self._make_request(
             method="GET",
@@ -600,9 +828,10 @@ class DydxRestClient:
         )
         
         if result and "fills" in result:
-            logger.debug("Order fills retrieved", 
-                        order_id=order_id, 
-                        count=len(result["fills"]))
+            if debug:
+                logger.debug("Order fills retrieved", 
+                            order_id=order_id, 
+                            count=len(result["fills"]))
             return result["fills"]
         
         return []
@@ -613,7 +842,9 @@ class DydxRestClient:
     
     async def get_markets(self) -> Optional[Dict[str, Any]]:
         """Get all available markets information"""
-        logger.debug("Fetching markets information")
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("Fetching markets information")
         
         result = await self._make_request(
             method="GET",
@@ -621,7 +852,7 @@ class DydxRestClient:
             authenticated=False
         )
         
-        if result:
+        if result and debug:
             logger.debug("Markets information retrieved")
         
         return result
@@ -636,7 +867,9 @@ class DydxRestClient:
         Returns:
             Orderbook data with bids and asks
         """
-        logger.debug("Fetching orderbook", symbol=symbol)
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("Fetching orderbook", symbol=symbol)
         
         result = await self._make_request(
             method="GET",
@@ -644,7 +877,7 @@ class DydxRestClient:
             authenticated=False
         )
         
-        if result:
+        if result and debug:
             logger.debug("Orderbook retrieved", symbol=symbol)
         
         return result
@@ -666,10 +899,12 @@ class DydxRestClient:
         Returns:
             List of candle data
         """
-        logger.debug("Fetching candles", 
-                    symbol=symbol, 
-                    resolution=resolution, 
-                    limit=limit)
+        debug = _debug_enabled()
+        if debug:
+            logger.debug("Fetching candles", 
+                        symbol=symbol, 
+                        resolution=resolution, 
+                        limit=limit)
         
         result = await self._make_request(
             method="GET",
@@ -682,9 +917,10 @@ class DydxRestClient:
         )
         
         if result and "candles" in result:
-            logger.debug("Candles retrieved", 
-                        symbol=symbol, 
-                        count=len(result["candles"]))
+            if debug:
+                logger.debug("Candles retrieved", 
+                            symbol=symbol, 
+                            count=len(result["candles"]))
             return result["candles"]
         
         return []
@@ -695,10 +931,18 @@ class DydxRestClient:
     
     def get_client_stats(self) -> Dict[str, Any]:
         """Get client statistics and health metrics"""
+        samples = sorted(self._response_times)
+        p95_response_time = samples[int(0.95 * (len(samples) - 1))] if samples else None
+        
         return {
             **self.stats,
-            "circuit_breaker_state": self.circuit_breaker.state,
-            "circuit_breaker_failures": self.circuit_breaker.failure_count,
-            "rate_limiter_tokens": self.rate_limiter.tokens,
+            "p95_response_time": p95_response_time,
+            "circuit_breakers": {
+                host: {"state": breaker.state, "failures": breaker.failure_count}
+                for host, breaker in self.circuit_breakers.items()
+            },
+            "rate_limiter_tokens": {
+                host: limiter.tokens for host, limiter in self.rate_limiters.items()
+            },
             "is_connected": self.client is not None
         }
\ No newline at end of file
@@ -0,0 +1,64 @@
+"""
+Strategy Signal Kernels
+
+Array kernels that evaluate the built-in backtesting strategies over a whole
+price series in one pass. Each kernel returns one side per row (BUY, SELL or
+HOLD) so the simulation loop can look signals up by cursor instead of
+re-slicing the frame on every step.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Pass-through decorator used when numba is not installed"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+HOLD = 0
+BUY = 1
+SELL = -1
+
+
+@njit(cache=True)
+def rsi_signals(rsi: np.ndarray, oversold: float, overbought: float, period: int) -> np.ndarray:
+    """
+    RSI mean reversion sides per row
+
+    Row i emits BUY when RSI crosses back above the oversold level and SELL when
+    it crosses back below the overbought level. Rows before ``period`` never
+    signal, matching the minimum history the strategy requires.
+    """
+    sides = np.zeros(rsi.shape[0], dtype=np.int8)
+    for i in range(max(period, 1), rsi.shape[0]):
+        prev_rsi = rsi[i - 1]
+        current_rsi = rsi[i]
+        if prev_rsi <= oversold and current_rsi > oversold:
+            sides[i] = BUY
+        elif prev_rsi >= overbought and current_rsi < overbought:
+            sides[i] = SELL
+    return sides
+
+
+@njit(cache=True)
+def momentum_signals(momentum: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Momentum sides per row
+
+    ``momentum`` is the fractional price change over the lookback window (the
+    ``momentum`` indicator column); rows where it is NaN never signal.
+    """
+    sides = np.zeros(momentum.shape[0], dtype=np.int8)
+    for i in range(momentum.shape[0]):
+        change = momentum[i]
+        if change > threshold:
+            sides[i] = BUY
+        elif change < -threshold:
+            sides[i] = SELL
+    return sides
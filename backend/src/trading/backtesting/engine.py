@@ -7,17 +7,25 @@ performance analysis.
 """
 
 import asyncio
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
+import hashlib
+import json
 import logging
+import time
 import uuid
-from decimal import Decimal
 
-from .mock_wallet import MockWallet, Portfolio, Trade
+from .mock_wallet import MockWallet
+from ._strategy_kernels import BUY, HOLD, momentum_signals, rsi_signals
 from .historical_data import HistoricalDataService
 from .performance import PerformanceCalculator
-from .utils import BacktestConfig, BacktestStatus, TimeSeriesUtils, DataValidator, calculate_technical_indicators
+from .utils import (
+    BacktestConfig, BacktestStatus, ExecutionLimits, TimeSeriesUtils, DataValidator, calculate_technical_indicators
+)
 
 # Import existing strategy classes
 import sys
@@ -26,6 +34,33 @@ sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 logger = logging.getLogger(__name__)
 
+# Simulation progress is reported at most every PROGRESS_MIN_INTERVAL seconds
+# unless it has advanced by at least PROGRESS_MIN_STEP percentage points
+PROGRESS_MIN_STEP = 1.0
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Simulation steps between progress checks
+PROGRESS_STEP_INTERVAL = 100
+
+
+def _signals_frame(strategy, columns: Dict[str, np.ndarray], symbol: str) -> pd.DataFrame:
+    """Signals for every row with a non-HOLD side, as (timestamp, side, size, price) rows indexed by row"""
+    sides = strategy.signal_sides(columns)
+    rows = np.flatnonzero(sides)
+    signals = [signal for row in rows for signal in strategy.signal_at(columns, symbol, row, sides[row])]
+    return pd.DataFrame(signals, index=rows[:len(signals)])
+
+
+def _indicator_cache_variant(indicator_config: Dict) -> str:
+    """Cache key suffix identifying OHLCV data enriched with the given indicators"""
+    config_json = json.dumps(indicator_config, sort_keys=True)
+    return f"indicators_{hashlib.md5(config_json.encode()).hexdigest()}"
+
+
+def _run_backtest_process(config: BacktestConfig, historical_data: Dict[str, pd.DataFrame]) -> Dict:
+    """Worker-process entry point for run_sweep"""
+    return asyncio.run(BacktestEngine().run_backtest(config, historical_data=historical_data))
+
 
 class BacktestEngine:
     """
@@ -45,13 +80,15 @@ class BacktestEngine:
         self.performance_calculator = PerformanceCalculator()
         self.active_backtests: Dict[str, Dict] = {}
 
-    async def run_backtest(self, config: BacktestConfig, progress_callback=None) -> Dict:
+    async def run_backtest(self, config: BacktestConfig, progress_callback=None,
+                           historical_data: Optional[Dict[str, pd.DataFrame]] = None) -> Dict:
         """
         Execute a complete backtesting run
 
         Args:
             config: Backtest configuration
             progress_callback: Optional callback for progress updates
+            historical_data: Preloaded indicator-enriched data; fetched when omitted
 
         Returns:
             Comprehensive backtest results dictionary
@@ -81,7 +118,8 @@ class BacktestEngine:
 
             # Fetch historical data
             await self._update_progress(backtest_id, 10, "Fetching historical data", progress_callback)
-            historical_data = await self._fetch_historical_data(config)
+            if historical_data is None:
+                historical_data = await self._fetch_historical_data(config)
 
             # Validate data quality
             await self._update_progress(backtest_id, 20, "Validating data quality", progress_callback)
@@ -100,7 +138,7 @@ class BacktestEngine:
             # Calculate performance metrics
             await self._update_progress(backtest_id, 90, "Calculating performance metrics", progress_callback)
             performance_metrics = self.performance_calculator.calculate_comprehensive_metrics(
-                mock_wallet.portfolio_history,
+                mock_wallet.portfolio_history_frame(),
                 mock_wallet.trade_history,
                 config.initial_capital
             )
@@ -123,38 +161,121 @@ class BacktestEngine:
             self.active_backtests[backtest_id]['error'] = str(e)
             raise
 
+    async def run_sweep(self, configs: List[BacktestConfig], max_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Run independent backtests in parallel worker processes
+
+        Historical data is fetched once per distinct (symbols, period, timeframe,
+        indicators) combination in this process and shipped to the workers, so
+        configs that only differ in strategy parameters share one fetch.
+
+        Args:
+            configs: Backtest configurations to run
+            max_workers: Worker process count (defaults to the CPU count)
+
+        Returns:
+            One results dictionary per config, in order; failed runs yield {'error': ...}
+        """
+        results: List[Optional[Dict]] = [None] * len(configs)
+        data_by_key: Dict[Tuple, Dict[str, pd.DataFrame]] = {}
+        runnable = []
+
+        for index, config in enumerate(configs):
+            is_valid, errors = DataValidator.validate_backtest_config(config)
+            if not is_valid:
+                results[index] = {'error': f"Invalid configuration: {errors}"}
+                continue
+
+            data_key = (
+                tuple(config.symbols), config.start_date, config.end_date, config.timeframe,
+                _indicator_cache_variant(self._get_indicator_config(config))
+            )
+            try:
+                if data_key not in data_by_key:
+                    data_by_key[data_key] = await self._fetch_historical_data(config)
+                runnable.append((index, config, data_key))
+            except Exception as e:
+                logger.error(f"Sweep data fetch failed for {config.strategy_name} on {config.symbols}: {e}")
+                results[index] = {'error': str(e)}
+
+        logger.info(f"Running sweep of {len(runnable)} backtests over {len(data_by_key)} datasets")
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            outcomes = await asyncio.gather(
+                *(loop.run_in_executor(executor, _run_backtest_process, config, data_by_key[data_key])
+                  for _, config, data_key in runnable),
+                return_exceptions=True
+            )
+
+        for (index, _, _), outcome in zip(runnable, outcomes):
+            results[index] = {'error': str(outcome)} if isinstance(outcome, Exception) else outcome
+
+        return results
+
     async def _fetch_historical_data(self, config: BacktestConfig) -> Dict[str, pd.DataFrame]:
         """Fetch historical data for all symbols"""
         logger.info(f"Fetching data for {len(config.symbols)} symbols from {config.start_date} to {config.end_date}")
 
+        indicator_config = self._get_indicator_config(config)
+        cache_variant = _indicator_cache_variant(indicator_config)
+
         # Initialize data service with context manager
         async with HistoricalDataService() as data_service:
-            historical_data = {}
+            # Fetch all symbols concurrently; indicator math runs on a shared thread pool
+            with ThreadPoolExecutor(max_workers=min(8, len(config.symbols))) as executor:
+                results = await asyncio.gather(
+                    *(self._fetch_symbol_data(data_service, symbol, config, indicator_config, cache_variant, executor)
+                      for symbol in config.symbols),
+                    return_exceptions=True
+                )
 
-            # Fetch data for each symbol
-            for symbol in config.symbols:
-                try:
-                    data = await data_service.get_ohlcv_data(
-                        symbol, config.start_date, config.end_date, config.timeframe
-                    )
-
-                    if not data.empty:
-                        # Add technical indicators
-                        indicator_config = self._get_indicator_config(config)
-                        data = calculate_technical_indicators(data, indicator_config)
-                        historical_data[symbol] = data
-                        logger.info(f"Loaded {len(data)} rows for {symbol}")
-                    else:
-                        logger.warning(f"No data available for {symbol}")
+        historical_data = {}
+        errors = []
+        for symbol, result in zip(config.symbols, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch data for {symbol}: {result}")
+                errors.append(result)
+            elif result is not None:
+                historical_data[symbol] = result
+
+        if errors:
+            raise errors[0]
+
+        # Align timeframes across symbols
+        return TimeSeriesUtils.align_timeframes(historical_data)
+
+    async def _fetch_symbol_data(self, data_service: HistoricalDataService, symbol: str, config: BacktestConfig,
+                                 indicator_config: Dict, cache_variant: str,
+                                 executor: ThreadPoolExecutor) -> Optional[pd.DataFrame]:
+        """Fetch one symbol's OHLCV data and add technical indicators off the event loop"""
+        loop = asyncio.get_running_loop()
+        cache_args = (symbol, config.start_date, config.end_date, config.timeframe)
+
+        # Repeat runs over the same range and indicators skip both the fetch and the TA pass
+        cached = await loop.run_in_executor(
+            executor, partial(data_service.cache.get, *cache_args, variant=cache_variant)
+        )
+        if cached is not None and not cached.empty:
+            logger.info(f"Loaded {len(cached)} rows for {symbol} from indicator cache")
+            return cached
+
+        data = await data_service.get_ohlcv_data(*cache_args)
 
-                except Exception as e:
-                    logger.error(f"Failed to fetch data for {symbol}: {e}")
-                    raise
+        if data.empty:
+            logger.warning(f"No data available for {symbol}")
+            return None
 
-            # Align timeframes across symbols
-            historical_data = TimeSeriesUtils.align_timeframes(historical_data)
+        data = await loop.run_in_executor(executor, calculate_technical_indicators, data, indicator_config)
 
-            return historical_data
+        # Synthetic fallback data must not shadow a real fetch on the next run
+        if not data.attrs.get('synthetic'):
+            await loop.run_in_executor(
+                executor, partial(data_service.cache.set, *cache_args, data, variant=cache_variant)
+            )
+
+        logger.info(f"Loaded {len(data)} rows for {symbol}")
+        return data
 
     async def _validate_historical_data(self, historical_data: Dict[str, pd.DataFrame], symbols: List[str]):
         """Validate the quality of historical data"""
@@ -242,40 +363,47 @@ class BacktestEngine:
                 self.position_size = params.get('positionSize', 0.05)
 
             def generate_signals(self, data: pd.DataFrame, symbol: str) -> List[Dict]:
-                if data.empty or len(data) < self.rsi_period + 1:
+                if data.empty or len(data) < self.rsi_period + 1 or 'rsi' not in data.columns:
                     return []
 
-                signals = []
-                latest = data.iloc[-1]
-                previous = data.iloc[-2]
+                # Evaluate the crossing on the latest two rows only
+                tail = TimeSeriesUtils.to_columns(data.iloc[-2:])
+                side = rsi_signals(tail['rsi'].astype(np.float64, copy=False), self.oversold, self.overbought, 1)[-1]
+                return self.signal_at(tail, symbol, len(tail['rsi']) - 1, side)
+
+            def signal_sides(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+                """Signal side for every row of the full history"""
+                if 'rsi' not in columns:
+                    return np.zeros(len(columns['close']), dtype=np.int8)
+                return rsi_signals(
+                    columns['rsi'].astype(np.float64, copy=False), self.oversold, self.overbought, self.rsi_period
+                )
 
-                if 'rsi' in data.columns:
-                    current_rsi = latest['rsi']
-                    prev_rsi = previous['rsi']
+            def signal_at(self, columns: Dict[str, np.ndarray], symbol: str, row: int, side: int) -> List[Dict]:
+                """Build the signals emitted at ``row`` for a precomputed side"""
+                if side == HOLD:
+                    return []
 
+                current_rsi = columns['rsi'][row]
+                if side == BUY:
                     # Buy signal: RSI crosses above oversold
-                    if prev_rsi <= self.oversold and current_rsi > self.oversold:
-                        signals.append({
-                            'symbol': symbol,
-                            'side': 'BUY',
-                            'size': self.position_size,
-                            'timestamp': latest['timestamp'],
-                            'price': latest['close'],
-                            'reason': f'RSI oversold recovery: {current_rsi:.1f}'
-                        })
-
+                    reason = f'RSI oversold recovery: {current_rsi:.1f}'
+                else:
                     # Sell signal: RSI crosses below overbought
-                    elif prev_rsi >= self.overbought and current_rsi < self.overbought:
-                        signals.append({
-                            'symbol': symbol,
-                            'side': 'SELL',
-                            'size': self.position_size,
-                            'timestamp': latest['timestamp'],
-                            'price': latest['close'],
-                            'reason': f'RSI overbought pullback: {current_rsi:.1f}'
-                        })
+                    reason = f'RSI overbought pullback: {current_rsi:.1f}'
 
-                return signals
+                return [{
+                    'symbol': symbol,
+                    'side': 'BUY' if side == BUY else 'SELL',
+                    'size': self.position_size,
+                    'timestamp': pd.Timestamp(columns['timestamp'][row]),
+                    'price': columns['close'][row],
+                    'reason': reason
+                }]
+
+            def precompute_signals(self, columns: Dict[str, np.ndarray], symbol: str) -> pd.DataFrame:
+                """All signals over the full history, indexed by row"""
+                return _signals_frame(self, columns, symbol)
 
         return RSIMeanReversionStrategy(params)
 
@@ -292,34 +420,47 @@ class BacktestEngine:
                 if data.empty or len(data) < self.lookback + 1:
                     return []
 
-                signals = []
-                latest = data.iloc[-1]
+                # Momentum only needs the latest lookback window
+                tail = TimeSeriesUtils.to_columns(data.iloc[-(self.lookback + 1):])
+                sides = momentum_signals(self._momentum(tail), self.threshold)
+                return self.signal_at(tail, symbol, len(sides) - 1, sides[-1])
 
-                # Calculate momentum (price change over lookback period)
-                old_price = data.iloc[-(self.lookback + 1)]['close']
-                current_price = latest['close']
-                momentum = (current_price - old_price) / old_price
+            def signal_sides(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+                """Signal side for every row of the full history"""
+                return momentum_signals(self._momentum(columns), self.threshold)
 
-                if momentum > self.threshold:
-                    signals.append({
-                        'symbol': symbol,
-                        'side': 'BUY',
-                        'size': self.position_size,
-                        'timestamp': latest['timestamp'],
-                        'price': current_price,
-                        'reason': f'Positive momentum: {momentum:.2%}'
-                    })
-                elif momentum < -self.threshold:
-                    signals.append({
-                        'symbol': symbol,
-                        'side': 'SELL',
-                        'size': self.position_size,
-                        'timestamp': latest['timestamp'],
-                        'price': current_price,
-                        'reason': f'Negative momentum: {momentum:.2%}'
-                    })
+            def signal_at(self, columns: Dict[str, np.ndarray], symbol: str, row: int, side: int) -> List[Dict]:
+                """Build the signals emitted at ``row`` for a precomputed side"""
+                if side == HOLD:
+                    return []
 
-                return signals
+                momentum = self._momentum(columns)[row]
+
+                return [{
+                    'symbol': symbol,
+                    'side': 'BUY' if side == BUY else 'SELL',
+                    'size': self.position_size,
+                    'timestamp': pd.Timestamp(columns['timestamp'][row]),
+                    'price': columns['close'][row],
+                    'reason': f'Positive momentum: {momentum:.2%}' if side == BUY else f'Negative momentum: {momentum:.2%}'
+                }]
+
+            def _momentum(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+                """Price change over the lookback period, from the indicator column when present"""
+                if 'momentum' in columns:
+                    return columns['momentum'].astype(np.float64, copy=False)
+
+                close = columns['close'].astype(np.float64, copy=False)
+                momentum = np.full(len(close), np.nan)
+                if self.lookback > 0:
+                    momentum[self.lookback:] = close[self.lookback:] / close[:-self.lookback] - 1
+                else:
+                    momentum[:] = 0.0
+                return momentum
+
+            def precompute_signals(self, columns: Dict[str, np.ndarray], symbol: str) -> pd.DataFrame:
+                """All signals over the full history, indexed by row"""
+                return _signals_frame(self, columns, symbol)
 
         return MomentumStrategy(params)
 
@@ -346,6 +487,10 @@ class BacktestEngine:
             return {
                 'rsi_period': config.strategy_params.get('period', 14)
             }
+        elif strategy_name == 'momentum':
+            return {
+                'momentum_lookback': config.strategy_params.get('lookback', 20)
+            }
         else:
             return base_config
 
@@ -353,72 +498,129 @@ class BacktestEngine:
                              strategy, config: BacktestConfig, backtest_id: str, progress_callback) -> Dict:
         """Execute the main backtesting simulation"""
 
-        # Determine simulation timeline
-        all_timestamps = set()
-        for data in historical_data.values():
-            if not data.empty:
-                all_timestamps.update(data['timestamp'].tolist())
-
-        timeline = sorted(all_timestamps)
+        # Convert each symbol's timestamp-sorted frame to column arrays once; the loop and
+        # the strategy kernels read these directly instead of going through pandas
+        for symbol, data in historical_data.items():
+            if not data['timestamp'].is_monotonic_increasing:
+                historical_data[symbol] = data.sort_values('timestamp').reset_index(drop=True)
+        symbol_columns = {symbol: TimeSeriesUtils.to_columns(data) for symbol, data in historical_data.items()}
+
+        # Determine simulation timeline as a sorted datetime64 array (union of all symbols)
+        timestamp_columns = [columns['timestamp'] for columns in symbol_columns.values() if len(columns['timestamp'])]
+        timeline = np.unique(np.concatenate(timestamp_columns)) if timestamp_columns else np.array([], dtype='datetime64[ns]')
+        timeline = timeline.astype('datetime64[ns]', copy=False)
         if len(timeline) < config.warmup_period:
             raise ValueError(f"Insufficient data: {len(timeline)} periods, need at least {config.warmup_period}")
 
-        logger.info(f"Simulation timeline: {len(timeline)} periods from {timeline[0]} to {timeline[-1]}")
+        logger.info(f"Simulation timeline: {len(timeline)} periods from {pd.Timestamp(timeline[0])} to {pd.Timestamp(timeline[-1])}")
+
+        # Aligned (steps, symbols) matrices: the row cursor of every symbol at every step
+        # (rows [0, cursor) are visible) and its price there, NaN before its first row.
+        # Cursors are resolved for the whole timeline at once as int64 nanoseconds
+        symbols_order = list(symbol_columns)
+        symbol_index = {symbol: column for column, symbol in enumerate(symbols_order)}
+        timeline_ns = timeline.view('i8')
+        cursor_matrix = np.zeros((len(timeline), len(symbols_order)), dtype=np.int64)
+        price_matrix = np.full((len(timeline), len(symbols_order)), np.nan)
+
+        for column, symbol in enumerate(symbols_order):
+            columns = symbol_columns[symbol]
+            cursors = np.searchsorted(
+                columns['timestamp'].astype('datetime64[ns]', copy=False).view('i8'), timeline_ns, side='right'
+            )
+            cursor_matrix[:, column] = cursors
+            if len(cursors) and len(columns['close']):
+                visible = cursors > 0
+                price_matrix[visible, column] = columns['close'][cursors[visible] - 1]
+
+        # Strategies that can score the whole history up front have their signals computed
+        # once and looked up by row; anything else gets generate_signals on the visible rows
+        precomputed_signals = None
+        if hasattr(strategy, 'precompute_signals'):
+            precomputed_signals = {}
+            for symbol, columns in symbol_columns.items():
+                signals_df = strategy.precompute_signals(columns, symbol)
+                by_row = precomputed_signals[symbol] = {}
+                for row, signal in zip(signals_df.index, signals_df.to_dict('records')):
+                    by_row.setdefault(row, []).append(signal)
 
         # Simulation state
+        mock_wallet.preallocate_history(len(timeline) - config.warmup_period)
+        limits = config.execution_limits()
         total_signals_generated = 0
         total_trades_executed = 0
         simulation_start = datetime.utcnow()
 
-        # Main simulation loop
-        for i, current_time in enumerate(timeline[config.warmup_period:], start=config.warmup_period):
-
-            # Update progress
-            if i % 100 == 0:
-                progress = 40 + (50 * i / len(timeline))
-                await self._update_progress(
-                    backtest_id, progress,
-                    f"Processing {current_time.date()} ({i}/{len(timeline)})",
-                    progress_callback
-                )
+        # The simulation starts at the first step where any symbol has data
+        first_step = max(
+            config.warmup_period,
+            min((int(np.searchsorted(cursor_matrix[:, column], 1)) for column in range(len(symbols_order))),
+                default=len(timeline))
+        )
 
-            # Get current market data for all symbols
-            current_prices = {}
-            symbol_data = {}
+        # Holdings only change when a signal fires, so with precomputed signals only steps
+        # where some symbol's visible row carries a signal are replayed; the steps between
+        # them are marked to market in bulk. Other strategies are consulted at every step.
+        if precomputed_signals is not None:
+            event_mask = np.zeros(len(timeline), dtype=bool)
+            for symbol in config.symbols:
+                if precomputed_signals.get(symbol):
+                    # Indexed by cursor: cursor c exposes row c - 1
+                    signal_cursors = np.zeros(len(symbol_columns[symbol]['close']) + 1, dtype=bool)
+                    signal_cursors[np.fromiter(precomputed_signals[symbol], dtype=np.int64) + 1] = True
+                    event_mask |= signal_cursors[cursor_matrix[:, symbol_index[symbol]]]
+            event_steps = np.flatnonzero(event_mask[first_step:]) + first_step
+        else:
+            event_steps = np.arange(first_step, len(timeline))
 
-            for symbol, data in historical_data.items():
-                # Find data up to current timestamp
-                mask = data['timestamp'] <= current_time
-                available_data = data[mask]
+        # Snapshots are recorded for steps [first_step, recorded_step)
+        recorded_step = first_step
+        last_progress_step = first_step - PROGRESS_STEP_INTERVAL
 
-                if not available_data.empty:
-                    latest_price = available_data.iloc[-1]['close']
-                    current_prices[symbol] = latest_price
-                    symbol_data[symbol] = available_data
+        # Main simulation loop
+        for i in event_steps.tolist():
+            current_time = timeline[i]
 
-            if not current_prices:
-                continue
+            # Update progress (coalesced; only awaited when there is a callback to notify)
+            if i - last_progress_step >= PROGRESS_STEP_INTERVAL:
+                last_progress_step = i
+                progress = 40 + (50 * i / len(timeline))
+                if self._progress_due(backtest_id, progress):
+                    message = f"Processing {pd.Timestamp(current_time).date()} ({i}/{len(timeline)})"
+                    if progress_callback:
+                        await self._update_progress(backtest_id, progress, message, progress_callback)
+                    else:
+                        self._set_progress(backtest_id, progress, message)
 
-            # Record portfolio snapshot
-            mock_wallet.record_portfolio_snapshot(current_prices, current_time)
+            # Record portfolio snapshots up to and including this step, before its trades
+            mock_wallet.record_portfolio_snapshots(
+                price_matrix[recorded_step:i + 1], symbol_index, timeline[recorded_step:i + 1]
+            )
+            recorded_step = i + 1
 
             # Generate trading signals for each symbol
+            step_cursors = cursor_matrix[i]
             for symbol in config.symbols:
-                if symbol in symbol_data:
+                column = symbol_index.get(symbol)
+                cursor = int(step_cursors[column]) if column is not None else 0
+                if cursor:
                     try:
-                        signals = strategy.generate_signals(symbol_data[symbol], symbol)
+                        if precomputed_signals is not None:
+                            signals = precomputed_signals[symbol].get(cursor - 1, ())
+                        else:
+                            signals = strategy.generate_signals(historical_data[symbol].iloc[:cursor], symbol)
                         total_signals_generated += len(signals)
 
                         # Execute signals
                         for signal in signals:
-                            if self._should_execute_signal(signal, mock_wallet, config):
+                            if self._should_execute_signal(signal, mock_wallet, limits):
                                 trade = mock_wallet.execute_trade(
                                     symbol=signal['symbol'],
                                     side=signal['side'],
                                     size=signal['size'],
                                     price=signal['price'],
-                                    timestamp=current_time,
-                                    slippage_rate=config.slippage_rate
+                                    timestamp=pd.Timestamp(current_time),
+                                    slippage_rate=limits.slippage_rate
                                 )
 
                                 if trade:
@@ -428,6 +630,11 @@ class BacktestEngine:
                     except Exception as e:
                         logger.warning(f"Strategy error at {current_time} for {symbol}: {e}")
 
+        # Mark the steps after the last event
+        mock_wallet.record_portfolio_snapshots(
+            price_matrix[recorded_step:], symbol_index, timeline[recorded_step:]
+        )
+
         simulation_end = datetime.utcnow()
         simulation_duration = (simulation_end - simulation_start).total_seconds()
 
@@ -441,38 +648,28 @@ class BacktestEngine:
             'warmup_periods': config.warmup_period
         }
 
-    def _should_execute_signal(self, signal: Dict, mock_wallet: MockWallet, config: BacktestConfig) -> bool:
+    def _should_execute_signal(self, signal: Dict, mock_wallet: MockWallet, limits: ExecutionLimits) -> bool:
         """Determine if a trading signal should be executed"""
-        symbol = signal['symbol']
-        side = signal['side']
-        size = signal['size']
-
-        # Check position size limits
-        portfolio_value = mock_wallet.cash_balance + sum(
-            abs(pos.size) * float(signal['price'])
-            for pos in mock_wallet.positions.values()
-            if pos.size != 0
+        # Gross exposure is tracked by the wallet, so both limits share one O(1) lookup
+        price = float(signal['price'])
+        gross_exposure = mock_wallet.gross_exposure_at(price)
+        portfolio_value = mock_wallet.cash_balance + gross_exposure
+        position_value = signal['size'] * price
+
+        # Compare against absolute thresholds instead of dividing into percentages
+        within_limits = (
+            position_value <= limits.max_position_size * portfolio_value
+            and gross_exposure <= limits.max_total_exposure * portfolio_value
         )
 
-        position_value = size * signal['price']
-        position_pct = position_value / portfolio_value
-
-        if position_pct > config.max_position_size:
-            logger.debug(f"Rejected signal: position size {position_pct:.2%} > limit {config.max_position_size:.2%}")
-            return False
-
-        # Check total exposure
-        total_exposure = sum(
-            abs(pos.size) * float(signal['price'])
-            for pos in mock_wallet.positions.values()
-            if pos.size != 0
-        ) / portfolio_value
-
-        if total_exposure > config.max_total_exposure:
-            logger.debug(f"Rejected signal: total exposure {total_exposure:.2%} > limit {config.max_total_exposure:.2%}")
-            return False
+        if not within_limits and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Rejected signal: position {position_value:.2f} / exposure {gross_exposure:.2f} "
+                f"on portfolio {portfolio_value:.2f} exceeds limits "
+                f"{limits.max_position_size:.2%} / {limits.max_total_exposure:.2%}"
+            )
 
-        return True
+        return within_limits
 
     async def _compile_results(self, backtest_id: str, config: BacktestConfig,
                               simulation_results: Dict, performance_metrics: Dict,
@@ -515,13 +712,31 @@ class BacktestEngine:
 
     async def _update_progress(self, backtest_id: str, progress: float, message: str, callback=None):
         """Update backtest progress"""
-        if backtest_id in self.active_backtests:
-            self.active_backtests[backtest_id]['progress'] = progress
-            self.active_backtests[backtest_id]['status_message'] = message
+        self._set_progress(backtest_id, progress, message)
 
         if callback:
             await callback(backtest_id, progress, message)
 
+    def _set_progress(self, backtest_id: str, progress: float, message: str):
+        """Record progress on the backtest tracking entry"""
+        info = self.active_backtests.get(backtest_id)
+        if info is not None:
+            info['progress'] = progress
+            info['status_message'] = message
+            info['progress_updated_at'] = time.monotonic()
+
+    def _progress_due(self, backtest_id: str, progress: float) -> bool:
+        """Whether a simulation progress update is worth reporting"""
+        info = self.active_backtests.get(backtest_id)
+        if info is None:
+            return True
+
+        # Skip updates that move less than 1% within 250ms of the last one
+        return (
+            progress - info['progress'] >= PROGRESS_MIN_STEP
+            or time.monotonic() - info.get('progress_updated_at', 0.0) >= PROGRESS_MIN_INTERVAL
+        )
+
     def get_backtest_status(self, backtest_id: str) -> Optional[Dict]:
         """Get status of running backtest"""
         return self.active_backtests.get(backtest_id)
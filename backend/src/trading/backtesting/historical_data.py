@@ -30,13 +30,16 @@ class RateLimiter:
 
     async def wait_if_needed(self):
         """Wait if rate limit would be exceeded"""
+        # Reserve the next slot before sleeping so concurrent callers queue up
+        # behind each other instead of all waking at the same time
         now = time.time()
-        time_since_last = now - self.last_call
-        if time_since_last < self.min_interval:
-            wait_time = self.min_interval - time_since_last
+        scheduled = max(now, self.last_call + self.min_interval)
+        self.last_call = scheduled
+
+        wait_time = scheduled - now
+        if wait_time > 0:
             logger.debug(f"Rate limiting: waiting {wait_time:.2f}s")
             await asyncio.sleep(wait_time)
-        self.last_call = time.time()
 
 
 class DataCache:
@@ -47,18 +50,22 @@ class DataCache:
         self.cache_dir.mkdir(exist_ok=True)
         logger.info(f"DataCache initialized at {self.cache_dir}")
 
-    def _get_cache_key(self, symbol: str, start: datetime, end: datetime, timeframe: str) -> str:
+    def _get_cache_key(self, symbol: str, start: datetime, end: datetime, timeframe: str, variant: str = '') -> str:
         """Generate cache key for data request"""
         key_string = f"{symbol}_{start.isoformat()}_{end.isoformat()}_{timeframe}"
+        if variant:
+            # Derived datasets (e.g. OHLCV plus indicators) are cached alongside the raw data
+            key_string += f"_{variant}"
         return hashlib.md5(key_string.encode()).hexdigest()
 
     def _get_cache_path(self, cache_key: str) -> Path:
         """Get cache file path"""
         return self.cache_dir / f"{cache_key}.pkl"
 
-    def get(self, symbol: str, start: datetime, end: datetime, timeframe: str) -> Optional[pd.DataFrame]:
+    def get(self, symbol: str, start: datetime, end: datetime, timeframe: str,
+            variant: str = '') -> Optional[pd.DataFrame]:
         """Retrieve cached data if available and fresh"""
-        cache_key = self._get_cache_key(symbol, start, end, timeframe)
+        cache_key = self._get_cache_key(symbol, start, end, timeframe, variant)
         cache_path = self._get_cache_path(cache_key)
 
         if not cache_path.exists():
@@ -82,9 +89,10 @@ class DataCache:
             logger.warning(f"Cache read error for {symbol}: {e}")
             return None
 
-    def set(self, symbol: str, start: datetime, end: datetime, timeframe: str, data: pd.DataFrame):
+    def set(self, symbol: str, start: datetime, end: datetime, timeframe: str, data: pd.DataFrame,
+            variant: str = ''):
         """Cache data with metadata"""
-        cache_key = self._get_cache_key(symbol, start, end, timeframe)
+        cache_key = self._get_cache_key(symbol, start, end, timeframe, variant)
         cache_path = self._get_cache_path(cache_key)
 
         try:
@@ -393,6 +401,7 @@ class HistoricalDataService:
             current_price = new_price
 
         df = pd.DataFrame(data)
+        df.attrs['synthetic'] = True  # Lets callers avoid caching derived data built from it
         logger.info(f"Generated {len(df)} synthetic rows for {symbol}")
         return df
 
@@ -6,32 +6,46 @@ balance tracking, and trading execution for backtesting scenarios.
 """
 
 import uuid
+import numpy as np
+import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
-from decimal import Decimal, ROUND_HALF_UP
 from dataclasses import dataclass, field
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Residual position sizes below this are float rounding noise, not real exposure
+SIZE_EPSILON = 1e-9
+
+# Row layout of the preallocated portfolio history buffer (mirrors Portfolio)
+PORTFOLIO_DTYPE = np.dtype([
+    ('timestamp', 'datetime64[ns]'),
+    ('total_value', 'f8'),
+    ('cash_balance', 'f8'),
+    ('positions_value', 'f8'),
+    ('unrealized_pnl', 'f8'),
+    ('realized_pnl', 'f8')
+])
+
 
 @dataclass
 class Position:
     """Represents a trading position in the mock wallet"""
     symbol: str
-    size: Decimal  # Positive for long, negative for short
-    entry_price: Decimal
+    size: float  # Positive for long, negative for short
+    entry_price: float
     entry_timestamp: datetime
-    unrealized_pnl: Decimal = Decimal('0')
+    unrealized_pnl: float = 0.0
 
-    def calculate_pnl(self, current_price: Decimal) -> Decimal:
+    def calculate_pnl(self, current_price: float) -> float:
         """Calculate unrealized P&L for this position"""
         if self.size == 0:
-            return Decimal('0')
+            return 0.0
 
         price_diff = current_price - self.entry_price
         pnl = self.size * price_diff
-        self.unrealized_pnl = pnl.quantize(Decimal('0.01'), rounding=ROUND_HALF_UP)
+        self.unrealized_pnl = round(pnl, 2)
         return self.unrealized_pnl
 
 
@@ -41,28 +55,31 @@ class Trade:
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
     symbol: str = ''
     side: str = ''  # 'BUY' or 'SELL'
-    size: Decimal = Decimal('0')
-    price: Decimal = Decimal('0')
-    commission: Decimal = Decimal('0')
+    size: float = 0.0
+    price: float = 0.0
+    commission: float = 0.0
     timestamp: datetime = field(default_factory=datetime.utcnow)
-    realized_pnl: Decimal = Decimal('0')
+    realized_pnl: float = 0.0
 
 
 @dataclass
 class Portfolio:
     """Portfolio state snapshot for performance tracking"""
     timestamp: datetime
-    total_value: Decimal
-    cash_balance: Decimal
-    positions_value: Decimal
-    unrealized_pnl: Decimal
-    realized_pnl: Decimal
+    total_value: float
+    cash_balance: float
+    positions_value: float
+    unrealized_pnl: float
+    realized_pnl: float
 
 
 class MockWallet:
     """
     Production-grade mock wallet for backtesting with realistic trading simulation
 
+    Balances, sizes and prices are plain floats; float64 is ample precision for
+    simulation and keeps decimal arithmetic out of the per-step loop.
+
     Features:
     - Position management (long/short)
     - Realistic commission and slippage
@@ -72,20 +89,25 @@ class MockWallet:
     """
 
     def __init__(self, initial_capital: float = 10000.0, commission_rate: float = 0.001):
-        self.initial_capital = Decimal(str(initial_capital))
-        self.cash_balance = Decimal(str(initial_capital))
-        self.commission_rate = Decimal(str(commission_rate))
+        self.initial_capital = float(initial_capital)
+        self.cash_balance = float(initial_capital)
+        self.commission_rate = float(commission_rate)
 
         # Position and trade tracking
         self.positions: Dict[str, Position] = {}
+        self._gross_position_size = 0.0  # Sum of |size| over all positions
         self.trade_history: List[Trade] = []
-        self.portfolio_history: List[Portfolio] = []
+        self._portfolio_history: List[Portfolio] = []
+
+        # Optional preallocated snapshot buffer, see preallocate_history()
+        self._history_buffer: Optional[np.ndarray] = None
+        self._history_size = 0
 
         # Performance metrics
-        self.total_realized_pnl = Decimal('0')
-        self.total_commission_paid = Decimal('0')
+        self.total_realized_pnl = 0.0
+        self.total_commission_paid = 0.0
         self.peak_portfolio_value = self.initial_capital
-        self.max_drawdown = Decimal('0')
+        self.max_drawdown = 0.0
 
         logger.info(f"MockWallet initialized with ${initial_capital:,.2f} capital")
 
@@ -105,17 +127,17 @@ class MockWallet:
         Returns:
             Trade object if successful, None if insufficient funds
         """
-        size_decimal = Decimal(str(size))
-        price_decimal = Decimal(str(price))
+        size = float(size)
+        price = float(price)
 
         # Apply slippage
         if side.upper() == 'BUY':
-            execution_price = price_decimal * (Decimal('1') + Decimal(str(slippage_rate)))
+            execution_price = price * (1.0 + slippage_rate)
         else:
-            execution_price = price_decimal * (Decimal('1') - Decimal(str(slippage_rate)))
+            execution_price = price * (1.0 - slippage_rate)
 
         # Calculate trade value and commission
-        trade_value = size_decimal * execution_price
+        trade_value = size * execution_price
         commission = trade_value * self.commission_rate
         total_cost = trade_value + commission if side.upper() == 'BUY' else commission
 
@@ -127,12 +149,14 @@ class MockWallet:
         # Check sufficient position for selling
         if side.upper() == 'SELL':
             current_position = self.positions.get(symbol)
-            if not current_position or current_position.size < size_decimal:
+            if not current_position or current_position.size < size - SIZE_EPSILON:
                 logger.warning(f"Insufficient position for {side} {size} {symbol}")
                 return None
 
         # Execute the trade
-        realized_pnl = self._update_positions(symbol, side, size_decimal, execution_price)
+        previous_size = abs(self.positions[symbol].size) if symbol in self.positions else 0.0
+        realized_pnl = self._update_positions(symbol, side, size, execution_price)
+        self._gross_position_size += abs(self.positions[symbol].size) - previous_size
 
         # Update cash balance
         if side.upper() == 'BUY':
@@ -147,7 +171,7 @@ class MockWallet:
         trade = Trade(
             symbol=symbol,
             side=side.upper(),
-            size=size_decimal,
+            size=size,
             price=execution_price,
             commission=commission,
             timestamp=timestamp,
@@ -160,12 +184,12 @@ class MockWallet:
         logger.info(f"Trade executed: {trade.side} {trade.size} {trade.symbol} @ ${trade.price:.2f}")
         return trade
 
-    def _update_positions(self, symbol: str, side: str, size: Decimal, price: Decimal) -> Decimal:
+    def _update_positions(self, symbol: str, side: str, size: float, price: float) -> float:
         """Update position and calculate realized P&L"""
-        realized_pnl = Decimal('0')
+        realized_pnl = 0.0
 
         if symbol not in self.positions:
-            self.positions[symbol] = Position(symbol, Decimal('0'), Decimal('0'), datetime.utcnow())
+            self.positions[symbol] = Position(symbol, 0.0, 0.0, datetime.utcnow())
 
         position = self.positions[symbol]
 
@@ -188,7 +212,7 @@ class MockWallet:
                     realized_pnl = abs(position.size) * (position.entry_price - price)
                     remaining_size = size - abs(position.size)
                     position.size = remaining_size
-                    position.entry_price = price if remaining_size > 0 else Decimal('0')
+                    position.entry_price = price if remaining_size > 0 else 0.0
                 else:
                     # Partially closing short
                     realized_pnl = size * (position.entry_price - price)
@@ -213,29 +237,38 @@ class MockWallet:
                     realized_pnl = position.size * (price - position.entry_price)
                     remaining_size = size - position.size
                     position.size = -remaining_size
-                    position.entry_price = price if remaining_size > 0 else Decimal('0')
+                    position.entry_price = price if remaining_size > 0 else 0.0
                 else:
                     # Partially closing long
                     realized_pnl = size * (price - position.entry_price)
                     position.size -= size
 
+        # Snap rounding residue to flat so closed positions don't linger as dust
+        if abs(position.size) < SIZE_EPSILON:
+            position.size = 0.0
+            position.entry_price = 0.0
+
         return realized_pnl
 
-    def get_portfolio_value(self, current_prices: Dict[str, float]) -> Decimal:
-        """Calculate total portfolio value including positions"""
-        positions_value = Decimal('0')
-        unrealized_pnl = Decimal('0')
+    def gross_exposure_at(self, price: float) -> float:
+        """Gross position exposure with every open position marked at ``price``"""
+        return self._gross_position_size * price
+
+    def _mark_to_market(self, current_prices: Dict[str, float]) -> Tuple[float, float]:
+        """Positions value and unrealized P&L at current prices"""
+        positions_value = 0.0
+        unrealized_pnl = 0.0
 
         for symbol, position in self.positions.items():
             if position.size != 0 and symbol in current_prices:
-                current_price = Decimal(str(current_prices[symbol]))
-                position_value = abs(position.size) * current_price
-                positions_value += position_value
+                current_price = float(current_prices[symbol])
+                positions_value += abs(position.size) * current_price
                 unrealized_pnl += position.calculate_pnl(current_price)
 
-        total_value = self.cash_balance + positions_value
+        return positions_value, unrealized_pnl
 
-        # Update drawdown tracking
+    def _track_drawdown(self, total_value: float):
+        """Update peak value and maximum drawdown"""
         if total_value > self.peak_portfolio_value:
             self.peak_portfolio_value = total_value
         else:
@@ -243,38 +276,148 @@ class MockWallet:
             if current_drawdown > self.max_drawdown:
                 self.max_drawdown = current_drawdown
 
+    def get_portfolio_value(self, current_prices: Dict[str, float]) -> float:
+        """Calculate total portfolio value including positions"""
+        positions_value, _ = self._mark_to_market(current_prices)
+        total_value = self.cash_balance + positions_value
+        self._track_drawdown(total_value)
         return total_value
 
+    def preallocate_history(self, capacity: int):
+        """
+        Record subsequent snapshots into a preallocated NumPy buffer
+
+        Args:
+            capacity: Expected number of snapshots (the buffer grows if exceeded)
+        """
+        buffer = np.empty(max(capacity, len(self._portfolio_history), 1), dtype=PORTFOLIO_DTYPE)
+        for i, snapshot in enumerate(self._portfolio_history):
+            buffer[i] = (
+                snapshot.timestamp, snapshot.total_value, snapshot.cash_balance,
+                snapshot.positions_value, snapshot.unrealized_pnl, snapshot.realized_pnl
+            )
+
+        self._history_buffer = buffer
+        self._history_size = len(self._portfolio_history)
+        self._portfolio_history = []
+
     def record_portfolio_snapshot(self, current_prices: Dict[str, float], timestamp: datetime):
         """Record portfolio state for performance tracking"""
-        total_value = self.get_portfolio_value(current_prices)
+        positions_value, unrealized_pnl = self._mark_to_market(current_prices)
+        total_value = self.cash_balance + positions_value
+        self._track_drawdown(total_value)
+
+        if self._history_buffer is None:
+            self._portfolio_history.append(Portfolio(
+                timestamp=timestamp,
+                total_value=total_value,
+                cash_balance=self.cash_balance,
+                positions_value=positions_value,
+                unrealized_pnl=unrealized_pnl,
+                realized_pnl=self.total_realized_pnl
+            ))
+            return
+
+        if self._history_size == len(self._history_buffer):
+            self._history_buffer = np.resize(self._history_buffer, 2 * len(self._history_buffer))
+
+        self._history_buffer[self._history_size] = (
+            timestamp, total_value, self.cash_balance, positions_value, unrealized_pnl, self.total_realized_pnl
+        )
+        self._history_size += 1
+
+    def record_portfolio_snapshots(self, prices: np.ndarray, symbol_columns: Dict[str, int],
+                                   timestamps: np.ndarray):
+        """
+        Record a run of snapshots over which cash and positions do not change
+
+        Args:
+            prices: (snapshots, symbols) price matrix, NaN where a symbol has no price yet
+            symbol_columns: Symbol -> column of ``prices``
+            timestamps: Snapshot timestamps, one per price row
+        """
+        count = len(timestamps)
+        if count == 0:
+            return
 
-        positions_value = Decimal('0')
-        unrealized_pnl = Decimal('0')
+        positions_value = np.zeros(count)
+        unrealized_pnl = np.zeros(count)
 
         for symbol, position in self.positions.items():
-            if position.size != 0 and symbol in current_prices:
-                current_price = Decimal(str(current_prices[symbol]))
-                positions_value += abs(position.size) * current_price
-                unrealized_pnl += position.calculate_pnl(current_price)
+            if position.size != 0 and symbol in symbol_columns:
+                symbol_prices = prices[:, symbol_columns[symbol]]
+                priced = ~np.isnan(symbol_prices)
+                pnl = np.round(position.size * (symbol_prices - position.entry_price), 2)
+                positions_value += np.where(priced, abs(position.size) * symbol_prices, 0.0)
+                unrealized_pnl += np.where(priced, pnl, 0.0)
+                if priced[-1]:
+                    position.unrealized_pnl = float(pnl[-1])
 
-        snapshot = Portfolio(
-            timestamp=timestamp,
-            total_value=total_value,
-            cash_balance=self.cash_balance,
-            positions_value=positions_value,
-            unrealized_pnl=unrealized_pnl,
-            realized_pnl=self.total_realized_pnl
-        )
+        total_value = self.cash_balance + positions_value
 
-        self.portfolio_history.append(snapshot)
+        # Vectorised form of _track_drawdown over the whole run
+        running_peak = np.maximum.accumulate(np.maximum(total_value, self.peak_portfolio_value))
+        drawdown = (running_peak - total_value) / running_peak
+        self.peak_portfolio_value = float(running_peak[-1])
+        self.max_drawdown = max(self.max_drawdown, float(drawdown.max()))
+
+        if self._history_buffer is None:
+            for timestamp, total, value, pnl in zip(timestamps, total_value.tolist(),
+                                                    positions_value.tolist(), unrealized_pnl.tolist()):
+                self._portfolio_history.append(Portfolio(
+                    timestamp=timestamp,
+                    total_value=total,
+                    cash_balance=self.cash_balance,
+                    positions_value=value,
+                    unrealized_pnl=pnl,
+                    realized_pnl=self.total_realized_pnl
+                ))
+            return
+
+        end = self._history_size + count
+        if end > len(self._history_buffer):
+            self._history_buffer = np.resize(self._history_buffer, max(end, 2 * len(self._history_buffer)))
+
+        rows = self._history_buffer[self._history_size:end]
+        rows['timestamp'] = timestamps
+        rows['total_value'] = total_value
+        rows['cash_balance'] = self.cash_balance
+        rows['positions_value'] = positions_value
+        rows['unrealized_pnl'] = unrealized_pnl
+        rows['realized_pnl'] = self.total_realized_pnl
+        self._history_size = end
+
+    @property
+    def portfolio_history(self) -> List[Portfolio]:
+        """Portfolio snapshots in recording order"""
+        if self._history_buffer is None:
+            return self._portfolio_history
+
+        return [
+            Portfolio(pd.Timestamp(row['timestamp']), *(float(row[name]) for name in PORTFOLIO_DTYPE.names[1:]))
+            for row in self._history_buffer[:self._history_size]
+        ]
+
+    def portfolio_history_frame(self) -> pd.DataFrame:
+        """Portfolio snapshots as a DataFrame with one column per Portfolio field"""
+        if self._history_buffer is None:
+            return pd.DataFrame(
+                [vars(snapshot) for snapshot in self._portfolio_history], columns=list(PORTFOLIO_DTYPE.names)
+            )
+
+        return pd.DataFrame(self._history_buffer[:self._history_size])
 
     def get_performance_summary(self) -> Dict:
         """Get comprehensive performance metrics"""
-        if not self.portfolio_history:
+        if self._history_buffer is not None:
+            if not self._history_size:
+                return {"error": "No portfolio history available"}
+            final_value = float(self._history_buffer['total_value'][self._history_size - 1])
+        elif self._portfolio_history:
+            final_value = self._portfolio_history[-1].total_value
+        else:
             return {"error": "No portfolio history available"}
 
-        final_value = self.portfolio_history[-1].total_value
         total_return = final_value - self.initial_capital
         total_return_pct = (total_return / self.initial_capital) * 100
 
@@ -300,15 +443,18 @@ class MockWallet:
     def reset(self, initial_capital: float = None):
         """Reset wallet for new backtest"""
         if initial_capital:
-            self.initial_capital = Decimal(str(initial_capital))
+            self.initial_capital = float(initial_capital)
 
         self.cash_balance = self.initial_capital
         self.positions.clear()
+        self._gross_position_size = 0.0
         self.trade_history.clear()
-        self.portfolio_history.clear()
-        self.total_realized_pnl = Decimal('0')
-        self.total_commission_paid = Decimal('0')
+        self._portfolio_history = []
+        self._history_buffer = None
+        self._history_size = 0
+        self.total_realized_pnl = 0.0
+        self.total_commission_paid = 0.0
         self.peak_portfolio_value = self.initial_capital
-        self.max_drawdown = Decimal('0')
+        self.max_drawdown = 0.0
 
         logger.info(f"MockWallet reset with ${float(self.initial_capital):,.2f} capital")
\ No newline at end of file
@@ -44,14 +44,14 @@ class PerformanceCalculator:
         Calculate comprehensive performance metrics from backtest results
 
         Args:
-            portfolio_history: List of Portfolio snapshots
+            portfolio_history: List of Portfolio snapshots, or a DataFrame with one column per Portfolio field
             trade_history: List of Trade objects
             initial_capital: Starting capital amount
 
         Returns:
             Dictionary containing all performance metrics
         """
-        if not portfolio_history:
+        if len(portfolio_history) == 0:
             return {"error": "No portfolio history provided"}
 
         logger.info(f"Calculating metrics for {len(portfolio_history)} portfolio snapshots, {len(trade_history)} trades")
@@ -88,18 +88,23 @@ class PerformanceCalculator:
 
     def _portfolio_history_to_df(self, portfolio_history: List) -> pd.DataFrame:
         """Convert portfolio history to DataFrame for analysis"""
-        data = []
-        for snapshot in portfolio_history:
-            data.append({
-                'timestamp': snapshot.timestamp,
-                'total_value': float(snapshot.total_value),
-                'cash_balance': float(snapshot.cash_balance),
-                'positions_value': float(snapshot.positions_value),
-                'unrealized_pnl': float(snapshot.unrealized_pnl),
-                'realized_pnl': float(snapshot.realized_pnl)
-            })
-
-        df = pd.DataFrame(data)
+        value_columns = ['total_value', 'cash_balance', 'positions_value', 'unrealized_pnl', 'realized_pnl']
+
+        if isinstance(portfolio_history, pd.DataFrame):
+            df = portfolio_history[['timestamp'] + value_columns].astype({column: float for column in value_columns})
+        else:
+            data = []
+            for snapshot in portfolio_history:
+                data.append({
+                    'timestamp': snapshot.timestamp,
+                    'total_value': float(snapshot.total_value),
+                    'cash_balance': float(snapshot.cash_balance),
+                    'positions_value': float(snapshot.positions_value),
+                    'unrealized_pnl': float(snapshot.unrealized_pnl),
+                    'realized_pnl': float(snapshot.realized_pnl)
+                })
+
+            df = pd.DataFrame(data)
         df['timestamp'] = pd.to_datetime(df['timestamp'])
         df = df.sort_values('timestamp').reset_index(drop=True)
 
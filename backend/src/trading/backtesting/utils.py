@@ -8,7 +8,7 @@ time series processing, data validation, and configuration management.
 import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, NamedTuple
 from dataclasses import dataclass
 from enum import Enum
 import logging
@@ -25,6 +25,13 @@ class BacktestStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class ExecutionLimits(NamedTuple):
+    """Per-run execution limits, resolved once from the config for the simulation loop"""
+    max_position_size: float
+    max_total_exposure: float
+    slippage_rate: float
+
+
 @dataclass
 class BacktestConfig:
     """Configuration for backtesting runs"""
@@ -33,13 +40,15 @@ class BacktestConfig:
     strategy_name: str
     strategy_params: Dict[str, Any]
 
+    # Markets to trade (required, so it precedes the defaulted fields)
+    symbols: List[str]
+
     # Time period
     start_date: datetime
     end_date: datetime
     timeframe: str = '1h'
 
     # Trading parameters
-    symbols: List[str]
     initial_capital: float = 10000.0
     commission_rate: float = 0.001
     slippage_rate: float = 0.0001
@@ -58,6 +67,14 @@ class BacktestConfig:
         """Validate configuration after initialization"""
         self._validate_config()
 
+    def execution_limits(self) -> ExecutionLimits:
+        """Snapshot the risk and slippage settings used for every signal"""
+        return ExecutionLimits(
+            max_position_size=float(self.max_position_size),
+            max_total_exposure=float(self.max_total_exposure),
+            slippage_rate=float(self.slippage_rate)
+        )
+
     def _validate_config(self):
         """Validate configuration parameters"""
         if self.end_date <= self.start_date:
@@ -171,6 +188,19 @@ class TimeSeriesUtils:
 
         return aligned_data
 
+    @staticmethod
+    def to_columns(data: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Convert a DataFrame into per-column NumPy arrays
+
+        Args:
+            data: OHLCV DataFrame, optionally with indicator columns
+
+        Returns:
+            Dictionary of column name -> contiguous array, row-aligned with ``data``
+        """
+        return {column: data[column].to_numpy() for column in data.columns}
+
     @staticmethod
     def fill_missing_data(data: pd.DataFrame, method: str = 'forward') -> pd.DataFrame:
         """
@@ -444,6 +474,10 @@ def calculate_technical_indicators(data: pd.DataFrame, config: Dict) -> pd.DataF
         rs = gain / loss
         df['rsi'] = 100 - (100 / (1 + rs))
 
+    # Momentum (fractional price change over the lookback window)
+    if 'momentum_lookback' in config:
+        df['momentum'] = df['close'].pct_change(config['momentum_lookback'], fill_method=None)
+
     # MACD
     if 'macd_config' in config:
         macd_config = config['macd_config']
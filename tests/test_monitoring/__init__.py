@@ -0,0 +1 @@
+"""Monitoring system tests package."""
\ No newline at end of file
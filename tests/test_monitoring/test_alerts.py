@@ -0,0 +1,163 @@
+"""Tests for alert management."""
+
+import asyncio
+import pytest
+import time
+from datetime import datetime
+
+from backend.src.monitoring.alerts import Alert, AlertChannel, AlertManager, AlertRule, AlertSeverity
+
+
+def make_rule(calls, **overrides):
+    """Build a counting test rule that fires when x > 1."""
+    params = dict(
+        name="test_rule",
+        condition=lambda data: calls.append(1) or data.get("x", 0) > 1,
+        severity=AlertSeverity.WARNING,
+        component="test",
+        message_template="x is {x}",
+        cooldown_minutes=0,
+        channels=[],
+        fields=["x"],
+    )
+    params.update(overrides)
+    return AlertRule(**params)
+
+
+class TestAlertManager:
+    """Test Alert Manager."""
+    
+    @pytest.mark.asyncio
+    async def test_rule_evaluation_is_memoized(self):
+        """Unchanged watched data should not re-run the condition."""
+        calls = []
+        manager = AlertManager()
+        manager.add_rule(make_rule(calls))
+        
+        for _ in range(3):
+            await manager.check_rules({"x": 0, "noise": object()})
+        
+        assert len(calls) == 1
+        
+        await manager.check_rules({"x": 5})
+        
+        assert len(calls) == 2
+        assert any(alert.metadata["rule_name"] == "test_rule" for alert in manager.active_alerts.values())
+    
+    @pytest.mark.asyncio
+    async def test_rule_without_fields_is_always_evaluated(self):
+        """Rules that don't declare fields bypass the evaluation cache."""
+        calls = []
+        manager = AlertManager()
+        manager.add_rule(make_rule(calls, fields=None))
+        
+        for _ in range(3):
+            await manager.check_rules({"x": 0})
+        
+        assert len(calls) == 3
+    
+    def test_alert_stats_match_history(self):
+        """Running stats counters should agree with a scan of the history window."""
+        manager = AlertManager()
+        now = time.time()
+        
+        # History is appended in time order, oldest first
+        for minutes_ago, severity, component in [
+            (60 * 30, AlertSeverity.CRITICAL, "database"),
+            (150, AlertSeverity.WARNING, "risk"),
+            (90, AlertSeverity.ERROR, "api"),
+            (5, AlertSeverity.WARNING, "api"),
+        ]:
+            ts = now - minutes_ago * 60
+            alert = Alert(
+                id=f"alert_{minutes_ago}",
+                title="Test",
+                message="Test alert",
+                severity=severity,
+                component=component,
+                timestamp=datetime.utcfromtimestamp(ts)
+            )
+            manager._append_history(alert, ts)
+        
+        stats = manager.get_alert_stats(hours=2)
+        
+        assert stats["total_alerts"] == 2
+        assert stats["severity_breakdown"] == {"warning": 1, "error": 1}
+        assert stats["component_breakdown"] == {"api": 2}
+        assert manager.get_alert_stats(hours=48)["total_alerts"] == 4
+    
+    def test_alert_history_rows_expand_to_dicts(self):
+        """History keeps compact rows and expands them on read."""
+        manager = AlertManager()
+        manager.max_recent_alerts = 1
+        now = time.time()
+        
+        for i, severity in enumerate([AlertSeverity.ERROR, AlertSeverity.WARNING]):
+            ts = now - (2 - i) * 60
+            alert = Alert(
+                id=f"alert_{i}",
+                title="Test",
+                message="Test alert",
+                severity=severity,
+                component="api",
+                timestamp=datetime.utcfromtimestamp(ts)
+            )
+            manager._append_history(alert, ts)
+        
+        history = manager.get_alert_history(hours=1)
+        
+        assert [entry["id"] for entry in history] == ["alert_1", "alert_0"]
+        assert history[0]["message"] == "Test alert"
+        assert history[1]["message"] is None
+        assert history[1]["severity"] == "error"
+        assert [entry["id"] for entry in manager.get_alert_history(1, AlertSeverity.ERROR)] == ["alert_0"]
+    
+    @pytest.mark.asyncio
+    async def test_alert_metadata_keeps_only_rule_fields(self):
+        """Alert metadata should not retain the whole data snapshot."""
+        manager = AlertManager()
+        manager.add_rule(make_rule([], message_template="x is {x} on {symbol}"))
+        
+        await manager.check_rules({"x": 5, "symbol": "BTC-USD", "snapshot": list(range(1000))})
+        
+        alert = next(a for a in manager.active_alerts.values() if a.metadata["rule_name"] == "test_rule")
+        assert alert.metadata["data"] == {"x": 5, "symbol": "BTC-USD"}
+    
+    @pytest.mark.asyncio
+    async def test_alert_ids_do_not_collide(self):
+        """Repeated firings within the same second get distinct ids."""
+        manager = AlertManager()
+        manager.add_rule(make_rule([]))
+        
+        await manager.check_rules({"x": 5})
+        await manager.check_rules({"x": 5})
+        
+        ids = [a.id for a in manager.active_alerts.values() if a.metadata["rule_name"] == "test_rule"]
+        assert len(ids) == 2
+        assert len(set(ids)) == 2
+    
+    def test_notification_queue_created_lazily(self):
+        """The queue and semaphore are bound to a loop only once the worker starts."""
+        manager = AlertManager()
+        
+        assert manager._notify_q is None and manager._notify_semaphore is None
+    
+    @pytest.mark.asyncio
+    async def test_stop_notifications_bounded_by_drain_timeout(self):
+        """A hung channel should not block shutdown past the drain timeout."""
+        manager = AlertManager()
+        manager.notify_drain_timeout_seconds = 0.1
+        
+        async def hang(alert):
+            await asyncio.Event().wait()
+        
+        manager._send_webhook_notification = hang
+        manager.add_rule(make_rule([], channels=[AlertChannel.WEBHOOK]))
+        await manager.check_rules({"x": 5})
+        await asyncio.sleep(0)
+        
+        start = time.perf_counter()
+        await manager.stop_notifications()
+        
+        assert time.perf_counter() - start < 1.0
+        assert manager._notify_task is None and manager._notify_q is None
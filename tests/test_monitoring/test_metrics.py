@@ -0,0 +1,157 @@
+"""Tests for metrics collection."""
+
+import asyncio
+import pytest
+import time
+
+from backend.src.monitoring import metrics
+from backend.src.monitoring.metrics import MetricsCollector, get_metrics_collector, timed
+
+
+class TestMetricsCollector:
+    """Test Metrics Collector."""
+    
+    def test_timer_buffer_keeps_most_recent_samples(self):
+        """Timer samples beyond the buffer size should evict the oldest."""
+        collector = MetricsCollector()
+        collector.max_timer_samples = 100
+        
+        for i in range(250):
+            collector.record_timer("latency", float(i))
+        
+        stats = collector.get_timer_stats("latency")
+        assert stats["count"] == 100
+        assert stats["min"] == 150.0
+        assert stats["max"] == 249.0
+    
+    def test_timer_stats_missing_metric(self):
+        """Unknown timers should report no statistics."""
+        collector = MetricsCollector()
+        
+        assert collector.get_timer_stats("missing") is None
+    
+    def test_timer_stats_refresh_after_new_samples(self):
+        """Cached timer stats should be invalidated by new recordings."""
+        collector = MetricsCollector()
+        collector.record_timer("latency", 1.0)
+        
+        first = collector.get_timer_stats("latency")
+        assert collector.get_timer_stats("latency") == first
+        
+        collector.record_timer("latency", 3.0)
+        stats = collector.get_timer_stats("latency")
+        assert stats["count"] == 2
+        assert stats["max"] == 3.0
+    
+    def test_label_order_does_not_affect_key(self):
+        """Counters should aggregate regardless of label ordering."""
+        collector = MetricsCollector()
+        collector.enable_history("orders_total")
+        collector.increment("orders_total", labels={"symbol": "BTC-USD", "side": "buy"})
+        collector.increment("orders_total", labels={"side": "buy", "symbol": "BTC-USD"})
+        
+        assert collector.get_counter("orders_total", {"symbol": "BTC-USD", "side": "buy"}) == 2.0
+        assert "orders_total{side=buy,symbol=BTC-USD}" in collector.get_all_metrics()
+    
+    def test_trading_summary_positions(self):
+        """Position gauges should be reported per symbol."""
+        collector = MetricsCollector()
+        collector.record_position_update("ETH-USD", 2.5, 10.0)
+        
+        summary = collector.get_trading_summary()
+        assert summary["current_positions"] == {"ETH-USD": 2.5}
+    
+    def test_recent_metrics_respects_window(self):
+        """Only points inside the window should be returned, oldest first."""
+        collector = MetricsCollector()
+        collector.record_timer("api_call_latency", 0.1, labels={"endpoint": "a"})
+        collector.record_timer("api_call_latency", 0.2, labels={"endpoint": "b"})
+        rows = collector.metrics[collector._make_key("api_call_latency", {"endpoint": "a"})]
+        rows[0] = (rows[0][0] - 600, rows[0][1])
+        collector.record_timer("api_call_latency", 0.3, labels={"endpoint": "a"})
+        
+        recent = collector.get_recent_metrics("api_call_latency", minutes=5)
+        assert len(recent) == 2
+        assert recent[0].timestamp <= recent[1].timestamp
+    
+    @pytest.mark.asyncio
+    async def test_increments_are_batched_per_window(self):
+        """Bursts of increments should collapse into a single counter point."""
+        collector = MetricsCollector()
+        collector.enable_history("api_calls_total")
+        for _ in range(5):
+            collector.increment("api_calls_total")
+        
+        await asyncio.sleep(collector.flush_interval_seconds * 2)
+        
+        assert collector.get_counter("api_calls_total") == 5.0
+        assert len(collector.get_metrics_by_name("api_calls_total")) == 1
+    
+    def test_counter_history_is_opt_in(self):
+        """Counters without history enabled should only keep their current value."""
+        collector = MetricsCollector()
+        collector.increment("errors_total")
+        
+        assert collector.get_counter("errors_total") == 1.0
+        assert collector.get_metrics_by_name("errors_total") == []
+    
+    def test_trading_summary_counts_trades_in_window(self):
+        """Trade totals should come from the cumulative counter history."""
+        collector = MetricsCollector()
+        for _ in range(3):
+            collector.record_trade_execution("BTC-USD", "buy", 1.0, 100.0, 0.01)
+        
+        assert collector.get_trading_summary()["total_trades"] == 3
+    
+    def test_trading_summary_excludes_trades_before_window(self, monkeypatch):
+        """Trades whose rows were evicted should not count once only in-window rows remain."""
+        collector = MetricsCollector(max_history_size=2)
+        now = time.time()
+        
+        with monkeypatch.context() as patched:
+            patched.setattr(metrics.time, "time", lambda: now - 2 * 86400)
+            for _ in range(4):
+                collector.record_trade_execution("BTC-USD", "buy", 1.0, 100.0, 0.01)
+        for _ in range(2):
+            collector.record_trade_execution("BTC-USD", "buy", 1.0, 100.0, 0.01)
+        
+        assert collector.get_trading_summary(hours=24)["total_trades"] == 2
+    
+    def test_record_batch_matches_individual_calls(self):
+        """A batch should update the same stores as the individual record methods."""
+        collector = MetricsCollector()
+        collector.record_trade_execution("BTC-USD", "sell", 0.5, 30000.0, 0.02)
+        
+        labels = {"symbol": "BTC-USD", "side": "sell"}
+        assert collector.get_counter("trades_total", labels) == 1.0
+        assert collector.get_gauge("last_trade_price", {"symbol": "BTC-USD"}) == 30000.0
+        assert collector.get_gauge("last_trade_size", labels) == 0.5
+        assert collector.get_timer_stats("trade_execution_latency", labels)["count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_timed_decorator_records_duration(self):
+        """Decorated coroutines should record one timer sample per call."""
+        @timed("decorated_call_latency", endpoint="test")
+        async def work():
+            return "done"
+        
+        assert await work() == "done"
+        
+        stats = get_metrics_collector().get_timer_stats("decorated_call_latency", {"endpoint": "test"})
+        assert stats["count"] >= 1
+    
+    def test_metrics_by_name_merges_keys_in_time_order(self):
+        """Points from different label sets should come back interleaved by time."""
+        collector = MetricsCollector()
+        for i in range(3):
+            collector.record_histogram("fill_size", float(i), labels={"symbol": "BTC-USD"})
+            collector.record_histogram("fill_size", float(i), labels={"symbol": "ETH-USD"})
+        collector.record_histogram("fill_size_total", 1.0)
+        
+        points = collector.get_metrics_by_name("fill_size")
+        assert len(points) == 6
+        assert [p.timestamp for p in points] == sorted(p.timestamp for p in points)
+        
+        collector.clear_metrics("fill_size")
+        assert collector.get_metrics_by_name("fill_size") == []
+        assert len(collector.get_metrics_by_name("fill_size_total")) == 1
@@ -0,0 +1 @@
+"""Security tests package."""
\ No newline at end of file
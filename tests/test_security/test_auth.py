@@ -0,0 +1,292 @@
+"""Tests for authentication utilities."""
+
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import bcrypt
+import jwt
+import pyotp
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+from backend.src.security import auth
+
+
+def make_user_model(**overrides):
+    """User row stand-in with the fields the auth wrapper reads."""
+    fields = dict(
+        id=1,
+        email="trader@example.com",
+        username="trader",
+        hashed_password="",
+        is_active=True,
+        is_superuser=False,
+        is_2fa_enabled=False,
+        totp_secret=None,
+        backup_codes=None,
+        trading_enabled=True,
+        paper_trading_mode=True,
+        created_at=datetime(2024, 1, 1),
+        last_login=None
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class FakeUserDAO:
+    """In-memory UserDAO that records lookups and updates."""
+
+    def __init__(self, user_model):
+        self.user_model = user_model
+        self.lookups = 0
+        self.updates = []
+
+    def __call__(self, db):
+        return self
+
+    def get_user_by_email(self, email):
+        self.lookups += 1
+        return self.user_model if email == self.user_model.email else None
+
+    def get_user_by_id(self, user_id):
+        return self.user_model if user_id == self.user_model.id else None
+
+    def update_user(self, user_id, fields):
+        self.updates.append(fields)
+        for name, value in fields.items():
+            setattr(self.user_model, name, value)
+
+    def update_last_login(self, user_id):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    """Give every test empty token and user caches."""
+    monkeypatch.setattr(auth, "_token_cache", auth._TTLCache(maxsize=100))
+    monkeypatch.setattr(auth, "_user_cache", auth._TTLCache(maxsize=100))
+    auth._totp.cache_clear()
+
+
+@pytest.fixture
+def decode_calls(monkeypatch):
+    """Count JWT decodes, i.e. token cache misses."""
+    calls = []
+    real_decode = jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(1)
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth.jwt, "decode", counting_decode)
+    return calls
+
+
+@pytest.fixture
+def eddsa_keys(monkeypatch):
+    """Configure Ed25519 signing the way settings would at import time."""
+    private_key = Ed25519PrivateKey.generate()
+    pem = private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+    monkeypatch.setattr(auth.settings, "jwt_private_key", pem)
+    monkeypatch.setattr(auth.settings, "jwt_public_key", None)
+
+    algorithm, signing_key, verify_key = auth._load_jwt_keys()
+    monkeypatch.setattr(auth, "ALGORITHM", algorithm)
+    monkeypatch.setattr(auth, "_SIGNING_KEY", signing_key)
+    monkeypatch.setattr(auth, "_VERIFY_KEY", verify_key)
+    return private_key
+
+
+class TestVerifyToken:
+    """Test JWT verification and its cache."""
+
+    def test_verified_token_is_cached(self, decode_calls):
+        """Repeat verifications within the TTL should not decode again."""
+        token = auth.create_access_token({"sub": "trader@example.com"})
+
+        for _ in range(3):
+            assert auth.verify_token(token)["sub"] == "trader@example.com"
+
+        assert len(decode_calls) == 1
+
+    def test_cached_token_expires_with_its_exp(self, decode_calls, monkeypatch):
+        """A token expiring before the cache TTL should drop out of the cache at its exp."""
+        token = auth.create_access_token({"sub": "trader@example.com"}, expires_delta=timedelta(seconds=2))
+        assert auth.verify_token(token) is not None
+
+        # Past the token's exp but well inside TOKEN_CACHE_TTL_SECONDS
+        real_monotonic = time.monotonic
+        monkeypatch.setattr(auth.time, "monotonic", lambda: real_monotonic() + 3)
+        auth.verify_token(token)
+
+        assert len(decode_calls) == 2
+
+    def test_invalidated_token_is_verified_again(self, decode_calls):
+        """Logging out should evict the token's cached payload."""
+        token = auth.create_access_token({"sub": "trader@example.com"})
+        auth.verify_token(token)
+
+        auth.invalidate_token(token)
+        auth.verify_token(token)
+
+        assert len(decode_calls) == 2
+
+    def test_token_missing_type_is_rejected(self):
+        """Tokens without a type claim should fail the required-claims check."""
+        now = int(time.time())
+        token = jwt.encode({"sub": "trader@example.com", "exp": now + 60}, auth._SIGNING_KEY, algorithm=auth.ALGORITHM)
+
+        assert auth.verify_token(token) is None
+
+    def test_eddsa_round_trip(self, eddsa_keys):
+        """Tokens signed with the configured Ed25519 key should verify."""
+        token = auth.create_access_token({"sub": "trader@example.com"})
+
+        assert jwt.get_unverified_header(token)["alg"] == "EdDSA"
+        assert auth.verify_token(token)["type"] == "access"
+
+    def test_hs256_token_rejected_when_eddsa_configured(self, eddsa_keys):
+        """A shared-secret token must not be accepted once signing moved to EdDSA."""
+        now = int(time.time())
+        token = jwt.encode(
+            {"sub": "trader@example.com", "exp": now + 60, "type": "access"},
+            auth.SECRET_KEY,
+            algorithm="HS256"
+        )
+
+        assert auth.verify_token(token) is None
+
+
+class TestGetCurrentUser:
+    """Test request authentication and the user cache."""
+
+    async def _authenticate(self, token):
+        request = SimpleNamespace(state=SimpleNamespace())
+        credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+        return await auth.get_current_user(request, credentials, db=None)
+
+    async def test_user_is_cached_until_invalidated(self, monkeypatch):
+        """The user row should be loaded once, then again only after invalidate_user."""
+        dao = FakeUserDAO(make_user_model())
+        monkeypatch.setattr(auth, "UserDAO", dao)
+        token = auth.create_access_token({"sub": "trader@example.com"})
+
+        for _ in range(3):
+            user = await self._authenticate(token)
+        assert user.email == "trader@example.com"
+        assert dao.lookups == 1
+
+        auth.invalidate_user("trader@example.com")
+        await self._authenticate(token)
+        assert dao.lookups == 2
+
+    async def test_refresh_token_is_not_an_access_token(self, monkeypatch):
+        """Refresh tokens should not authenticate API requests."""
+        monkeypatch.setattr(auth, "UserDAO", FakeUserDAO(make_user_model()))
+        token = auth.create_refresh_token({"sub": "trader@example.com"})
+
+        with pytest.raises(HTTPException):
+            await self._authenticate(token)
+
+
+class TestAuthenticateUser:
+    """Test password login."""
+
+    async def test_lower_cost_hash_is_upgraded_on_login(self, monkeypatch):
+        """A hash made below the configured cost should be replaced after a successful login."""
+        monkeypatch.setattr(auth.settings, "bcrypt_cost", 5)
+        old_hash = bcrypt.hashpw(b"hunter22", bcrypt.gensalt(rounds=4)).decode()
+        dao = FakeUserDAO(make_user_model(hashed_password=old_hash))
+        monkeypatch.setattr(auth, "UserDAO", dao)
+
+        user = await auth.authenticate_user("trader@example.com", "hunter22", db=None)
+
+        assert user.email == "trader@example.com"
+        new_hash = dao.updates[0]["hashed_password"]
+        assert new_hash.startswith("$2b$05$")
+        assert auth.verify_password("hunter22", new_hash)
+
+    async def test_current_cost_hash_is_kept(self, monkeypatch):
+        """Hashes already at the configured cost should not be rewritten."""
+        monkeypatch.setattr(auth.settings, "bcrypt_cost", 4)
+        dao = FakeUserDAO(make_user_model(hashed_password=auth.hash_password("hunter22")))
+        monkeypatch.setattr(auth, "UserDAO", dao)
+
+        assert await auth.authenticate_user("trader@example.com", "hunter22", db=None)
+        assert dao.updates == []
+
+    async def test_wrong_password_is_rejected(self, monkeypatch):
+        """A bad password should fail without touching the stored hash."""
+        monkeypatch.setattr(auth.settings, "bcrypt_cost", 5)
+        old_hash = bcrypt.hashpw(b"hunter22", bcrypt.gensalt(rounds=4)).decode()
+        dao = FakeUserDAO(make_user_model(hashed_password=old_hash))
+        monkeypatch.setattr(auth, "UserDAO", dao)
+
+        assert await auth.authenticate_user("trader@example.com", "wrong", db=None) is None
+        assert dao.updates == []
+
+
+class TestTwoFactor:
+    """Test TOTP verification."""
+
+    def test_totp_objects_are_reused(self):
+        """Verifying against the same secret should build one TOTP object."""
+        secret = auth.generate_2fa_secret()
+        code = pyotp.TOTP(secret).now()
+
+        assert auth.verify_totp_token(secret, code)
+        assert auth.verify_totp_token(secret, code)
+        assert auth._totp.cache_info().currsize == 1
+
+    async def test_disable_2fa_clears_totp_cache(self, monkeypatch):
+        """The revoked secret should not stay in the TOTP cache."""
+        monkeypatch.setattr(auth.settings, "bcrypt_cost", 4)
+        secret = auth.generate_2fa_secret()
+        user_model = make_user_model(
+            hashed_password=auth.hash_password("hunter22"), is_2fa_enabled=True, totp_secret=secret
+        )
+        monkeypatch.setattr(auth, "UserDAO", FakeUserDAO(user_model))
+        auth.verify_totp_token(secret, pyotp.TOTP(secret).now())
+
+        success, _ = await auth.AuthenticationManager(db=None).disable_2fa(1, "hunter22")
+
+        assert success
+        assert user_model.totp_secret is None
+        assert auth._totp.cache_info().currsize == 0
+
+
+class TestBackupCodes:
+    """Test 2FA backup codes."""
+
+    def test_hashed_code_matches_and_is_removed(self):
+        """A code stored as its HMAC should verify once and then be consumed."""
+        codes = auth.generate_backup_codes(3)
+        stored = [auth.hash_backup_code(code) for code in codes]
+
+        is_valid, remaining = auth.verify_backup_code(stored, codes[1].lower())
+
+        assert is_valid
+        assert remaining == [stored[0], stored[2]]
+        assert auth.verify_backup_code(remaining, codes[1]) == (False, remaining)
+
+    def test_legacy_plaintext_code_still_verifies(self):
+        """Codes saved in plaintext before hashing was introduced should keep working."""
+        stored = ["A1B2C3D4", auth.hash_backup_code("FFEEDDCCBB")]
+
+        is_valid, remaining = auth.verify_backup_code(stored, "a1b2c3d4")
+
+        assert is_valid
+        assert remaining == [stored[1]]
+
+    def test_wrong_code_leaves_list_unchanged(self):
+        """A non-matching code should be rejected without consuming anything."""
+        stored = [auth.hash_backup_code(code) for code in auth.generate_backup_codes(3)] + ["A1B2C3D4"]
+
+        assert auth.verify_backup_code(stored, "0000000000") == (False, stored)
+        assert auth.verify_backup_code(stored, "") == (False, stored)
@@ -0,0 +1,265 @@
+"""Tests for the dYdX REST API client."""
+
+import asyncio
+import hashlib
+import hmac
+import json
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+import httpx
+import pytest
+
+from backend.src.trading import api_client
+from backend.src.trading.api_client import (
+    _parse_position, CircuitBreaker, DydxRestClient, OrderRequest, OrderSide, OrderStatus, OrderType, RateLimiter
+)
+
+
+@pytest.fixture
+def rest_client(monkeypatch):
+    """REST client built from a minimal in-memory config."""
+    config = SimpleNamespace(
+        dydx_environment="testnet",
+        dydx_api_key="test-key",
+        dydx_secret_key="test-secret",
+        dydx_passphrase="test-passphrase",
+        api_requests_per_second=10,
+        api_max_connections=500,
+        api_max_keepalive_connections=100,
+        api_keepalive_expiry=75.0
+    )
+    monkeypatch.setattr(api_client, "get_config", lambda: config)
+    return DydxRestClient()
+
+
+def mock_transport(rest_client, monkeypatch, handler):
+    """Route the client's HTTP requests to an in-process handler."""
+    monkeypatch.setattr(
+        rest_client,
+        "_create_http_client",
+        lambda base_url: httpx.AsyncClient(base_url=base_url, transport=httpx.MockTransport(handler))
+    )
+
+
+class TestRateLimiter:
+    """Test Rate Limiter."""
+
+    async def test_burst_up_to_capacity_without_waiting(self):
+        """A full bucket should hand out its tokens immediately."""
+        limiter = RateLimiter(5)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            await limiter.acquire()
+
+        assert time.perf_counter() - start < 0.05
+
+    async def test_waiters_do_not_serialize_behind_sleeper(self):
+        """Concurrent waiters should share refills instead of queueing on the lock."""
+        limiter = RateLimiter(20)
+        limiter.tokens = 0
+
+        start = time.perf_counter()
+        await asyncio.gather(*(limiter.acquire() for _ in range(10)))
+        elapsed = time.perf_counter() - start
+
+        # 10 tokens at 20/s should arrive in about half a second
+        assert elapsed < 1.0
+        assert limiter.tokens < 1
+
+
+def test_parse_position_handles_zulu_timestamps():
+    """Indexer timestamps ending in Z should parse as UTC."""
+    position = _parse_position({
+        "market": "ETH-USD", "side": "LONG", "size": "1.5", "entryPrice": "3000",
+        "unrealizedPnl": "12.5", "realizedPnl": "0", "createdAt": "2024-01-02T03:04:05.123Z"
+    })
+
+    assert position.created_at == datetime(2024, 1, 2, 3, 4, 5, 123000, tzinfo=timezone.utc)
+    assert position.size == 1.5 and position.unrealized_pnl == 12.5
+    assert position.mark_price == pytest.approx(3000 + 12.5 / 1.5)
+    assert not hasattr(position, "__dict__")
+
+
+def test_parse_position_mark_price():
+    """An explicit mark price should be used as-is; shorts derive it with the sign flipped."""
+    base = {"market": "ETH-USD", "size": "2", "entryPrice": "3000", "realizedPnl": "0",
+            "createdAt": "2024-01-02T03:04:05Z"}
+
+    assert _parse_position({**base, "side": "LONG", "unrealizedPnl": "20", "markPrice": "3011"}).mark_price == 3011.0
+    assert _parse_position({**base, "side": "SHORT", "unrealizedPnl": "20"}).mark_price == 2990.0
+
+
+class TestCircuitBreaker:
+    """Test Circuit Breaker."""
+
+    def _open_breaker(self):
+        breaker = CircuitBreaker(failure_threshold=2, timeout=60)
+        breaker.record_failure()
+        breaker.record_failure()
+        # Pretend the open timeout has elapsed
+        breaker.last_failure_time -= 61
+        return breaker
+
+    def test_half_open_admits_single_probe(self):
+        """Only one caller should be let through while the breaker is half-open."""
+        breaker = self._open_breaker()
+
+        assert breaker.can_execute() is True
+        assert breaker.state == "HALF_OPEN"
+        assert breaker.can_execute() is False
+
+        breaker.record_success()
+        assert breaker.state == "CLOSED"
+        assert breaker.can_execute() is True
+
+    def test_failed_probe_reopens(self):
+        """A failed probe should reopen the breaker immediately."""
+        breaker = self._open_breaker()
+
+        assert breaker.can_execute() is True
+        breaker.record_failure()
+
+        assert breaker.state == "OPEN"
+        assert breaker.can_execute() is False
+
+
+class TestDydxRestClient:
+    """Test dYdX REST client."""
+
+    def test_signature_matches_fresh_hmac(self, rest_client):
+        """Signing from the cached hash states should match a freshly keyed HMAC."""
+        for _ in range(2):
+            signature = rest_client._generate_signature("1700000000", "post", "/v4/orders", b'{"a":1}')
+
+        expected = hmac.new(
+            b"test-secret", b'1700000000POST/v4/orders{"a":1}', hashlib.sha256
+        ).hexdigest()
+        assert signature == expected
+
+    def test_signature_with_key_longer_than_block(self, rest_client):
+        """Keys over the SHA-256 block size are hashed first, as HMAC requires."""
+        long_key = b"k" * 100
+        rest_client._hmac_inner, rest_client._hmac_outer = rest_client._keyed_sha256_states(long_key)
+
+        expected = hmac.new(long_key, b"1700000000GET/v4/fills", hashlib.sha256).hexdigest()
+        assert rest_client._generate_signature("1700000000", "GET", "/v4/fills") == expected
+
+    def test_auth_headers(self, rest_client):
+        """Auth headers should combine static credentials with a fresh signature."""
+        headers = rest_client._get_auth_headers("GET", "/v4/accounts")
+
+        assert headers["DYDX-API-KEY"] == "test-key"
+        assert headers["DYDX-PASSPHRASE"] == "test-passphrase"
+        assert headers["DYDX-SIGNATURE"] == rest_client._generate_signature(
+            headers["DYDX-TIMESTAMP"], "GET", "/v4/accounts"
+        )
+
+    async def test_requests_routed_to_host_client(self, rest_client, monkeypatch):
+        """Indexer and trading endpoints should go through their own host's client."""
+        def echo_url(request):
+            return httpx.Response(200, json={"url": str(request.url)})
+
+        mock_transport(rest_client, monkeypatch, echo_url)
+
+        async with rest_client:
+            indexer = await rest_client._make_request("GET", "/v4/perpetualMarkets", authenticated=False)
+            trading = await rest_client._make_request("POST", "/v4/orders", data={"size": "1"}, use_api_url=True)
+
+        assert indexer["url"] == f"{rest_client.base_url}/v4/perpetualMarkets"
+        assert trading["url"] == f"{rest_client.api_url}/v4/orders"
+        assert rest_client.client is None and rest_client.trading_client is None
+
+    async def test_place_order_payload_and_result(self, rest_client, monkeypatch):
+        """Enum fields should be sent as their string values and fills derived from the response."""
+        sent = {}
+
+        def handle_order(request):
+            sent.update(json.loads(request.content))
+            return httpx.Response(200, json={"order": {
+                "id": "o-1", "status": "OPEN", "size": "2", "remainingSize": "0.5"
+            }})
+
+        mock_transport(rest_client, monkeypatch, handle_order)
+
+        async with rest_client:
+            result = await rest_client.place_order(
+                OrderRequest(symbol="BTC-USD", side=OrderSide.BUY, type=OrderType.LIMIT, size=2.0, price=50000.0)
+            )
+
+        assert sent["side"] == "BUY" and sent["type"] == "LIMIT" and sent["timeInForce"] == "GTT"
+        assert result.status == OrderStatus.OPEN
+        assert result.filled_size == 1.5 and result.remaining_size == 0.5
+
+    async def test_rate_limited_request_is_retried(self, rest_client, monkeypatch):
+        """A 429 should be retried after the Retry-After delay instead of failing."""
+        responses = iter([
+            httpx.Response(429, headers={"Retry-After": "0"}),
+            httpx.Response(200, json={"markets": {}}),
+        ])
+
+        mock_transport(rest_client, monkeypatch, lambda request: next(responses))
+
+        async with rest_client:
+            result = await rest_client.get_markets()
+
+        assert result == {"markets": {}}
+        assert rest_client.stats["requests_sent"] == 2
+
+    async def test_positions_arrays_align_with_positions(self, rest_client, monkeypatch):
+        """Column arrays should hold the same values as the Position objects."""
+        payload = {"positions": [
+            {"market": "BTC-USD", "side": "LONG", "size": "0.5", "entryPrice": "60000",
+             "unrealizedPnl": "100", "realizedPnl": "5", "createdAt": "2024-01-01T00:00:00Z"},
+            {"market": "ETH-USD", "side": "SHORT", "size": "2", "entryPrice": "3000",
+             "unrealizedPnl": "-20", "realizedPnl": "0", "createdAt": "2024-01-01T00:00:00Z"},
+        ]}
+
+        mock_transport(rest_client, monkeypatch, lambda request: httpx.Response(200, json=payload))
+
+        async with rest_client:
+            positions = await rest_client.get_positions()
+            arrays = await rest_client.get_positions_arrays()
+
+        assert list(arrays["symbol"]) == [p.symbol for p in positions]
+        assert arrays["size"].dtype == "float64"
+        assert arrays["size"].tolist() == [p.size for p in positions]
+        assert arrays["unrealized_pnl"].tolist() == [100.0, -20.0]
+        assert "mark_price" not in arrays
+
+    async def test_place_orders_batch_preserves_order(self, rest_client, monkeypatch):
+        """Batched orders should return results aligned with the requests."""
+        def handle_order(request):
+            client_id = json.loads(request.content)["clientId"]
+            return httpx.Response(200, json={"order": {
+                "id": f"o-{client_id}", "clientId": client_id, "status": "OPEN", "size": "1", "remainingSize": "1"
+            }})
+
+        mock_transport(rest_client, monkeypatch, handle_order)
+        rest_client.rate_limiters["trading"] = RateLimiter(100)
+        orders = [
+            OrderRequest(symbol="BTC-USD", side=OrderSide.BUY, type=OrderType.MARKET, size=1.0, client_id=str(i))
+            for i in range(5)
+        ]
+
+        async with rest_client:
+            results = await rest_client.place_orders_batch(orders, max_concurrency=2)
+
+        assert [result.order_id for result in results] == [f"o-{i}" for i in range(5)]
+        assert all(result.success for result in results)
+
+    async def test_trading_host_isolated_from_indexer_failures(self, rest_client, monkeypatch):
+        """An open indexer breaker should not block trading API requests."""
+        mock_transport(rest_client, monkeypatch, lambda request: httpx.Response(200, json={}))
+        indexer_breaker = rest_client.circuit_breakers["indexer"]
+        for _ in range(indexer_breaker.failure_threshold):
+            indexer_breaker.record_failure()
+
+        async with rest_client:
+            assert await rest_client.get_markets() is None
+            assert await rest_client.cancel_order("o-1") is True
+
+        stats = rest_client.get_client_stats()
+        assert stats["circuit_breakers"]["indexer"]["state"] == "OPEN"
+        assert stats["circuit_breakers"]["trading"]["state"] == "CLOSED"
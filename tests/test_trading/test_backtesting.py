@@ -0,0 +1,91 @@
+"""Tests for the backtesting simulation loop."""
+
+import numpy as np
+import pandas as pd
+import pytest
+from datetime import datetime
+
+from backend.src.trading.backtesting.engine import BacktestEngine
+from backend.src.trading.backtesting.mock_wallet import MockWallet
+from backend.src.trading.backtesting.utils import BacktestConfig, calculate_technical_indicators
+
+
+def make_ohlcv(n, seed, start_price, start, freq):
+    """Random-walk OHLCV frame with n bars from start at the given frequency."""
+    rng = np.random.default_rng(seed)
+    close = start_price * np.exp(np.cumsum(rng.normal(0, 0.01, n)))
+    return pd.DataFrame({
+        'timestamp': pd.date_range(start, periods=n, freq=freq),
+        'open': close,
+        'high': close * 1.01,
+        'low': close * 0.99,
+        'close': close,
+        'volume': 1.0
+    })
+
+
+class PerStepStrategy:
+    """Exposes only generate_signals, forcing the engine to replay every step."""
+
+    def __init__(self, strategy):
+        self._strategy = strategy
+
+    def generate_signals(self, data, symbol):
+        return self._strategy.generate_signals(data, symbol)
+
+
+class TestEventReplay:
+    """Event-driven replay must match replaying every step."""
+
+    async def _simulate(self, engine, config, data, per_step):
+        strategy = await engine._initialize_strategy(config)
+        if per_step:
+            strategy = PerStepStrategy(strategy)
+
+        wallet = MockWallet(config.initial_capital, config.commission_rate)
+        frames = {symbol: frame.copy() for symbol, frame in data.items()}
+        result = await engine._run_simulation(wallet, frames, strategy, config, 'test', None)
+        return wallet, result
+
+    @pytest.mark.parametrize("strategy_name, params", [
+        ('momentum', {'lookback': 10, 'threshold': 0.01, 'positionSize': 1.0}),
+        ('rsi_mean_reversion', {'period': 14, 'positionSize': 1.0}),
+    ])
+    @pytest.mark.parametrize("eth_start, eth_freq", [
+        ('2024-01-01', 'h'),             # aligned timelines
+        ('2024-01-02 16:15', '30min'),   # staggered start, interleaved bars
+    ])
+    async def test_matches_per_step_replay(self, strategy_name, params, eth_start, eth_freq):
+        """Trades, final value and drawdown should not depend on which steps are replayed."""
+        config = BacktestConfig(
+            strategy_name=strategy_name,
+            strategy_params=params,
+            symbols=['BTC-USD', 'ETH-USD'],
+            start_date=datetime(2024, 1, 1),
+            end_date=datetime(2024, 2, 1),
+            max_position_size=0.5,
+            max_total_exposure=1.0
+        )
+        engine = BacktestEngine()
+        indicator_config = engine._get_indicator_config(config)
+        data = {
+            'BTC-USD': make_ohlcv(400, 1, 100.0, '2024-01-01', 'h'),
+            'ETH-USD': make_ohlcv(500, 2, 50.0, eth_start, eth_freq),
+        }
+        data = {symbol: calculate_technical_indicators(frame, indicator_config) for symbol, frame in data.items()}
+
+        event_wallet, event_result = await self._simulate(engine, config, data, per_step=False)
+        step_wallet, step_result = await self._simulate(engine, config, data, per_step=True)
+
+        def trades(wallet):
+            return [(t.symbol, t.side, t.size, t.price, t.timestamp) for t in wallet.trade_history]
+
+        assert event_result['total_trades_executed'] > 0
+        assert trades(event_wallet) == trades(step_wallet)
+        assert event_result['total_signals_generated'] == step_result['total_signals_generated']
+
+        event_history = event_wallet.portfolio_history_frame()
+        step_history = step_wallet.portfolio_history_frame()
+        assert len(event_history) == len(step_history)
+        assert event_history['total_value'].iloc[-1] == pytest.approx(step_history['total_value'].iloc[-1])
+        assert event_wallet.max_drawdown == pytest.approx(step_wallet.max_drawdown)